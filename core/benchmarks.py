@@ -0,0 +1,202 @@
+"""
+Micro-benchmarks for per-request hot paths, run by the ``microbench``
+command. Each benchmark does its setup once and returns the callable to
+time. Timing follows pyperf: the loop count is calibrated so one run takes
+at least ``min_time`` seconds, then several runs are recorded per
+benchmark.
+
+Password hashing is left out on purpose: its cost is fixed by
+``PASSWORD_HASHERS``, not by our code, and would drown everything else.
+"""
+import statistics
+import time
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, List, Optional
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+STRONG_PASSWORD = "Vq8#mLw2!xTz"
+
+
+def benchmark(name: str):
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+# ----------------------------
+# Timing
+# ----------------------------
+def _time_loops(fn: Callable[[], object], loops: int) -> float:
+    started = time.perf_counter()
+    for _ in range(loops):
+        fn()
+    return time.perf_counter() - started
+
+
+def measure(fn: Callable[[], object], runs: int = 5, min_time: float = 0.1) -> Dict[str, float]:
+    """Per-call timings of ``fn`` in microseconds over ``runs`` calibrated runs."""
+    fn()  # warm-up: lazy imports, caches
+    loops = 1
+    while (elapsed := _time_loops(fn, loops)) < min_time:
+        loops = max(loops * 2, int(loops * min_time / elapsed * 1.1) if elapsed else loops * 10)
+
+    samples = [_time_loops(fn, loops) / loops * 1e6 for _ in range(runs)]
+    return {
+        "mean_us": round(statistics.fmean(samples), 3),
+        "stdev_us": round(statistics.stdev(samples), 3) if runs > 1 else 0.0,
+        "min_us": round(min(samples), 3),
+        "loops": loops,
+        "runs": runs,
+    }
+
+
+def run_benchmarks(names: Optional[Iterable[str]] = None, runs: int = 5, min_time: float = 0.1) -> Dict[str, dict]:
+    return {name: measure(BENCHMARKS[name](), runs, min_time) for name in (names or BENCHMARKS)}
+
+
+def find_regressions(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[dict]:
+    """
+    Benchmarks whose fastest run is more than ``threshold`` times the
+    baseline's. The minimum is compared because it is the least affected
+    by noise from the rest of the machine.
+    """
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before and result["min_us"] > before["min_us"] * threshold:
+            regressions.append({
+                "name": name,
+                "baseline_us": before["min_us"],
+                "current_us": result["min_us"],
+                "ratio": round(result["min_us"] / before["min_us"], 2),
+            })
+    return regressions
+
+
+# ----------------------------
+# core.utils
+# ----------------------------
+@benchmark("core.generate_otp")
+def bench_generate_otp():
+    from core.utils import generate_otp
+    return generate_otp
+
+
+@benchmark("core.api_response")
+def bench_api_response():
+    from core.utils import api_response
+    data = {"user_id": "8f1c7d8e-5d8b-4c1e-9a57-2f9a4c3b1d20", "email": "emp@example.com"}
+    return lambda: api_response(message="Profile fetched successfully", data=data)
+
+
+# ----------------------------
+# JSON rendering
+# ----------------------------
+def employee_list_payload(count: int = 500) -> dict:
+    """An ``api_response`` body listing ``count`` employees, as list endpoints return."""
+    employees = [
+        {
+            "id": uuid.UUID(int=index),
+            "email": f"employee{index}@example.com",
+            "em_id": f"EMP-{index:08d}",
+            "em_role": "EMPLOYEE",
+            "status": "ACTIVE",
+            "em_phone": "01700000000",
+            "em_birthday": date(1990, 1, 1),
+            "em_joining_date": date(2020, 1, 1),
+            "basic_salary": Decimal("52000.00"),
+            "last_login": datetime(2025, 9, 1, 9, 30, tzinfo=timezone.utc),
+            "em_image": f"https://hrms.example.com/media/images/employee/profile/{index}.webp",
+        }
+        for index in range(count)
+    ]
+    return {"status": "success", "message": "Employees fetched successfully", "data": employees}
+
+
+@benchmark("core.render.JSONRenderer")
+def bench_render_stdlib():
+    from rest_framework.renderers import JSONRenderer
+    payload = employee_list_payload()
+    return lambda: JSONRenderer().render(payload)
+
+
+@benchmark("core.render.ORJSONRenderer")
+def bench_render_orjson():
+    from core.renderers import ORJSONRenderer
+    payload = employee_list_payload()
+    return lambda: ORJSONRenderer().render(payload)
+
+
+# ----------------------------
+# payroll
+# ----------------------------
+@benchmark("payroll.compute_payslip")
+def bench_compute_payslip():
+    # Per employee: times the payroll head count gives the compute share of
+    # a run (the rest is its five input queries and the bulk_create).
+    from payroll.calculations import PayslipInput, compute_payslip
+    item = PayslipInput(
+        employee_id=uuid.UUID(int=1), salary_type_id=None, working_days=30, unpaid_days=Decimal("1.5"),
+        basic=Decimal("30000.00"), medical=Decimal("1000.00"), house_rent=Decimal("5000.00"),
+        conveyance=Decimal("500.00"), provident_fund=Decimal("1200.00"), tax=Decimal("1500.00"),
+        loan=Decimal("2000.00"),
+    )
+    return lambda: compute_payslip(item)
+
+
+# ----------------------------
+# users.serializers
+# ----------------------------
+@benchmark("users.validate_password")
+def bench_validate_password():
+    from users.models import User
+    from users.validators import validate_password
+    user = User(email="employee@example.com")
+    return lambda: validate_password(STRONG_PASSWORD, user)
+
+
+@benchmark("users.validate_password.django")
+def bench_validate_password_django():
+    from django.contrib.auth.password_validation import get_password_validators, validate_password
+    from users.models import User
+    user = User(email="employee@example.com")
+    validators = get_password_validators([
+        {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
+        {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator", "OPTIONS": {"min_length": 8}},
+        {"NAME": "django.contrib.auth.password_validation.CommonPasswordValidator"},
+        {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
+    ])
+    return lambda: validate_password(STRONG_PASSWORD, user, validators)
+
+
+@benchmark("users.RegisterSerializer.is_valid")
+def bench_register_serializer():
+    from users.serializers import RegisterSerializer
+    data = {
+        "email": "new.employee@example.com", "password": STRONG_PASSWORD, "password_confirm": STRONG_PASSWORD,
+        "em_role": "EMPLOYEE", "em_phone": "01700000000", "em_gender": "MALE",
+    }
+    return lambda: RegisterSerializer(data=data).is_valid(raise_exception=True)
+
+
+@benchmark("users.ForgotPasswordOTPSerializer.is_valid")
+def bench_forgot_password_serializer():
+    from users.serializers import ForgotPasswordOTPSerializer
+    # An unknown email costs the same lookup without writing a user.
+    return lambda: ForgotPasswordOTPSerializer(data={"email": "unknown@example.com"}).is_valid()
+
+
+@benchmark("users.UserProfileSerializer.data")
+def bench_profile_serializer():
+    from users.models import User
+    from users.serializers import UserProfileSerializer
+    user = User(
+        email="employee@example.com", em_id="EMP-BENCH001", em_phone="01700000000",
+        em_birthday=date(1990, 1, 1), em_joining_date=date(2020, 1, 1),
+        em_image_variants={"medium": {"webp": "images/employee/profile/a.webp", "jpeg": "images/employee/profile/a.jpg"}},
+    )
+    return lambda: UserProfileSerializer(user).data
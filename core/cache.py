@@ -0,0 +1,28 @@
+"""
+Cache backends that report hits and misses to the request metrics
+(``core.metrics``).
+"""
+from django_redis.cache import RedisCache
+
+from core.metrics import record_cache
+
+_MISSING = object()
+
+
+class CacheMetricsMixin:
+    def get(self, key, default=None, *args, **kwargs):
+        value = super().get(key, _MISSING, *args, **kwargs)
+        # With IGNORE_EXCEPTIONS an unreachable Redis returns None: a miss.
+        hit = value is not _MISSING and value is not None
+        record_cache(int(hit), int(not hit))
+        return default if value is _MISSING else value
+
+    def get_many(self, keys, *args, **kwargs):
+        keys = list(keys)
+        values = super().get_many(keys, *args, **kwargs)
+        record_cache(len(values), len(keys) - len(values))
+        return values
+
+
+class InstrumentedRedisCache(CacheMetricsMixin, RedisCache):
+    pass
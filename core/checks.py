@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestFilesMixin
+from django.core.checks import Error, Tags, Warning, register
+from django.core.files.storage import storages
+
+
+# ----------------------------
+# Static Files
+# ----------------------------
+@register(Tags.staticfiles, deploy=True)
+def check_static_manifest(app_configs, **kwargs):
+    """
+    In production the staticfiles manifest must be loaded into memory once,
+    when the storage is created, so ``static()`` lookups never touch the
+    disk. Runs with ``check --deploy`` before each deployment starts.
+    """
+    if settings.DEBUG:
+        return []
+
+    storage = storages["staticfiles"]
+    if not isinstance(storage, ManifestFilesMixin):
+        return [Warning(
+            "Static files are not fingerprinted.",
+            hint="Use whitenoise.storage.CompressedManifestStaticFilesStorage in STORAGES['staticfiles'].",
+            id="core.W001",
+        )]
+
+    messages = []
+    if not storage.hashed_files:
+        messages.append(Error(
+            f"Static manifest '{storage.manifest_name}' is missing or empty in {settings.STATIC_ROOT}.",
+            hint="Run `python manage.py collectstatic --noinput` during the build.",
+            id="core.E001",
+        ))
+    if getattr(settings, "WHITENOISE_AUTOREFRESH", False):
+        messages.append(Warning(
+            "WHITENOISE_AUTOREFRESH rescans static files on every request.",
+            hint="Only enable it in development.",
+            id="core.W002",
+        ))
+    return messages
@@ -189,3 +189,27 @@ USER_TYPE_CHOICES = (
     ('Tester', 'Tester'),
     ('Collaborators', 'Collaborators'),  
 )
+
+# ----------------------------
+# Payroll Run Status Choices
+# ----------------------------
+PAYROLL_RUN_STATUS_CHOICES = (
+    ("PENDING", _("Pending")),
+    ("RUNNING", _("Running")),
+    ("COMPLETED", _("Completed")),
+    ("FAILED", _("Failed")),
+)
+
+# ----------------------------
+# Upload Session Choices
+# ----------------------------
+UPLOAD_STATUS_CHOICES = (
+    ("IN_PROGRESS", _("In Progress")),
+    ("COMPLETED", _("Completed")),
+    ("ABORTED", _("Aborted")),
+)
+
+UPLOAD_TARGET_CHOICES = (
+    ("EMPLOYEE_FILE", _("Employee File")),
+    ("PROJECT_FILE", _("Project File")),
+)
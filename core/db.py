@@ -0,0 +1,85 @@
+"""
+Database connection settings and pool metrics. ``database_config`` is
+called from settings, so it must not import anything that needs Django
+to be configured.
+"""
+from typing import Dict, Optional
+
+import dj_database_url
+
+
+# ----------------------------
+# Configuration
+# ----------------------------
+def database_config(
+    url: str,
+    conn_max_age: int = 50,
+    pool: bool = True,
+    pool_size: int = 4,
+    max_overflow: int = 6,
+    pool_timeout: float = 10.0,
+    max_idle: float = 300.0,
+    max_lifetime: float = 1800.0,
+) -> Dict[str, object]:
+    """
+    Build a DATABASES entry from ``url``. For PostgreSQL with ``pool`` on,
+    Django's built-in psycopg pool replaces per-worker persistent
+    connections: ``pool_size`` connections are kept open, up to
+    ``max_overflow`` more are opened under load, and a checkout waits at
+    most ``pool_timeout`` seconds before failing.
+    """
+    config = dj_database_url.parse(url, conn_max_age=conn_max_age, conn_health_checks=True)
+    if config["ENGINE"] != "django.db.backends.postgresql":
+        return config
+
+    # Tags our sessions in pg_stat_activity (see db_pool_loadtest).
+    config.setdefault("OPTIONS", {}).setdefault("application_name", "hrms")
+    if pool:
+        # Pooled connections are returned at the end of every request;
+        # Django refuses to combine pooling with CONN_MAX_AGE.
+        config["CONN_MAX_AGE"] = 0
+        config["OPTIONS"]["pool"] = {
+            "min_size": pool_size,
+            "max_size": pool_size + max_overflow,
+            "timeout": pool_timeout,
+            "max_idle": max_idle,
+            "max_lifetime": max_lifetime,
+            "name": "hrms",
+        }
+    return config
+
+
+# ----------------------------
+# Pool Metrics
+# ----------------------------
+def pool_stats(alias: str = "default") -> Optional[Dict[str, object]]:
+    """
+    Size, availability and checkout-wait metrics of the connection pool
+    behind ``alias``, or None when it isn't pooled. Counters are cumulative
+    since the pool was opened in this process.
+    """
+    from django.db import connections
+
+    connection = connections[alias]
+    if not connection.settings_dict.get("OPTIONS", {}).get("pool"):
+        return None
+    pool = getattr(connection, "pool", None)
+    if pool is None:
+        return None
+
+    stats = pool.get_stats()
+    checkouts = stats.get("requests_num", 0)
+    queued = stats.get("requests_queued", 0)
+    wait_ms = stats.get("requests_wait_ms", 0)
+    return {
+        "min_size": pool.min_size,
+        "max_size": pool.max_size,
+        "size": stats.get("pool_size", 0),
+        "available": stats.get("pool_available", 0),
+        "waiting": stats.get("requests_waiting", 0),
+        "checkouts": checkouts,
+        "checkouts_queued": queued,
+        "checkout_timeouts": stats.get("requests_errors", 0),
+        "checkout_wait_ms_total": wait_ms,
+        "checkout_wait_ms_avg": round(wait_ms / queued, 2) if queued else 0.0,
+    }
@@ -1,5 +1,3 @@
-import sendgrid
-from sendgrid.helpers.mail import Mail, Email
 from django.core.mail.backends.base import BaseEmailBackend
 from django.conf import settings
 from decouple import config
@@ -33,6 +31,10 @@ class SendGridBackend(BaseEmailBackend):
         api_key = config("SENDGRID_API_KEY", default=None)
         if not api_key:
             raise ValueError("SENDGRID_API_KEY is not set in environment variables.")
+
+        # Imported here so workers only load the SendGrid client (and its
+        # HTTP stack) once an email is actually sent.
+        import sendgrid
         self.sg = sendgrid.SendGridAPIClient(api_key=api_key)
 
         # Validate default sender
@@ -47,6 +49,8 @@ class SendGridBackend(BaseEmailBackend):
         """
         Sends one or more EmailMessage objects and returns the number of emails sent.
         """
+        from sendgrid.helpers.mail import Mail, Email
+
         num_sent = 0
 
         for message in email_messages:
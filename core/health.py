@@ -0,0 +1,133 @@
+"""
+Readiness probes. Dependencies are probed in parallel on a small,
+long-lived thread pool (so the database probe reuses that thread's
+persistent connection, or checks one out of the pool) and the combined
+result is cached in-process for ``HEALTH_CACHE_SECONDS``. A probe still
+running from an earlier check (hung past its timeout) is not submitted
+again, so hung probes can't take over the pool.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections
+
+from core.db import pool_stats
+from core.utils import pending_email_count
+
+logger = logging.getLogger(__name__)
+
+STATUS_OK = "ok"
+STATUS_DEGRADED = "degraded"
+STATUS_FAIL = "fail"
+
+_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="health")
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+_cache_lock = threading.Lock()
+_cached: Tuple[float, Dict[str, object]] = (0.0, {})
+
+
+# ----------------------------
+# Probes
+# ----------------------------
+def probe_database() -> Dict[str, object]:
+    connection = connections["default"]
+    connection.close_if_unusable_or_obsolete()
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+    stats = pool_stats()
+    if stats is not None:
+        # Hand the pooled connection back instead of holding it between probes.
+        connection.close()
+        return {"pool": stats}
+    return {}
+
+
+def probe_redis() -> Dict[str, object]:
+    from django_redis import get_redis_connection
+    get_redis_connection("default").ping()
+    return {}
+
+
+def probe_mail() -> Dict[str, object]:
+    depth = pending_email_count()
+    limit = getattr(settings, "HEALTH_MAIL_QUEUE_MAX", 100)
+    return {"queue_depth": depth, "status": STATUS_DEGRADED if depth > limit else STATUS_OK}
+
+
+# name -> (probe, status reported when the probe fails)
+# Redis failures only degrade the service: the cache ignores its errors.
+PROBES: Dict[str, Tuple[Callable[[], Dict[str, object]], str]] = {
+    "database": (probe_database, STATUS_FAIL),
+    "redis": (probe_redis, STATUS_DEGRADED),
+    "mail": (probe_mail, STATUS_DEGRADED),
+}
+
+
+# ----------------------------
+# Readiness
+# ----------------------------
+def _timed(probe: Callable[[], Dict[str, object]]) -> Dict[str, object]:
+    started = time.perf_counter()
+    result = {"status": STATUS_OK, **probe()}
+    result["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return result
+
+
+def run_probes() -> Dict[str, object]:
+    """Run every probe concurrently, each bounded by ``HEALTH_PROBE_TIMEOUT``."""
+    timeout = getattr(settings, "HEALTH_PROBE_TIMEOUT", 0.5)
+    futures: Dict[str, Optional[Future]] = {}
+    with _inflight_lock:
+        for name, (probe, _) in PROBES.items():
+            previous = _inflight.get(name)
+            if previous is not None and not previous.done():
+                futures[name] = None
+            else:
+                futures[name] = _inflight[name] = _executor.submit(_timed, probe)
+    deadline = time.monotonic() + timeout
+
+    checks = {}
+    for name, future in futures.items():
+        failure_status = PROBES[name][1]
+        if future is None:
+            checks[name] = {"status": failure_status, "error": "previous probe still running"}
+            continue
+        try:
+            checks[name] = future.result(timeout=max(deadline - time.monotonic(), 0))
+        except FutureTimeout:
+            checks[name] = {"status": failure_status, "error": f"timed out after {timeout}s"}
+        except Exception as e:
+            logger.warning(f"Health probe {name} failed: {str(e)}")
+            checks[name] = {"status": failure_status, "error": str(e)}
+
+    statuses = {check["status"] for check in checks.values()}
+    overall = STATUS_FAIL if STATUS_FAIL in statuses else STATUS_DEGRADED if STATUS_DEGRADED in statuses else STATUS_OK
+    return {"status": overall, "checks": checks}
+
+
+def readiness() -> Dict[str, object]:
+    """
+    Probe results, reused for ``HEALTH_CACHE_SECONDS`` so frequent probes
+    from load balancers add no load. Only one caller runs the probes when
+    the cached result expires.
+    """
+    global _cached
+    ttl = getattr(settings, "HEALTH_CACHE_SECONDS", 1.0)
+    with _cache_lock:
+        checked_at, result = _cached
+        if not result or time.monotonic() - checked_at >= ttl:
+            result = run_probes()
+            _cached = (time.monotonic(), result)
+    return result
+
+
+def reset_readiness_cache() -> None:
+    global _cached
+    with _cache_lock:
+        _cached = (0.0, {})
@@ -0,0 +1,198 @@
+import mimetypes
+import os
+import re
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.http import http_date, parse_http_date_safe
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+# ----------------------------
+# Range Parsing
+# ----------------------------
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single ``bytes=`` range into inclusive ``(start, end)`` offsets.
+    Returns None for a missing, malformed or multi-range header (the whole
+    file is served instead) and raises RangeNotSatisfiable when the range
+    lies outside the file.
+    """
+    match = RANGE_RE.match((header or "").strip())
+    if not match or not any(match.groups()):
+        return None
+
+    start, end = match.groups()
+    if not start:
+        length = int(end)
+        if length == 0:
+            raise RangeNotSatisfiable()
+        return max(size - length, 0), size - 1
+
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        raise RangeNotSatisfiable()
+    return start, end
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    candidates = [tag.strip() for tag in header.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def _not_modified(request, etag: Optional[str], last_modified: Optional[float]) -> bool:
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        return bool(etag) and _etag_matches(if_none_match, etag)
+    since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+    return since is not None and last_modified is not None and int(last_modified) <= since
+
+
+def _set_headers(response, etag, last_modified, filename, as_attachment, cache_control):
+    if filename:
+        disposition = "attachment" if as_attachment else "inline"
+        response["Content-Disposition"] = f'{disposition}; filename="{filename}"'
+    if etag:
+        response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    response["Cache-Control"] = cache_control
+
+
+def _iter_range(path: str, start: int, length: int):
+    with open(path, "rb") as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(STREAM_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+# ----------------------------
+# File Serving
+# ----------------------------
+def serve_file(
+    request,
+    path: str,
+    content_type: str = "application/octet-stream",
+    etag: Optional[str] = None,
+    filename: Optional[str] = None,
+    as_attachment: bool = False,
+    cache_control: str = "private, no-cache",
+    last_modified: Optional[float] = None,
+) -> HttpResponse:
+    """
+    Serve a file from disk with conditional (If-None-Match /
+    If-Modified-Since / If-Range) and single byte-range support. Full
+    responses go through FileResponse so the WSGI server can use
+    ``sendfile``.
+    """
+    size = os.path.getsize(path)
+    etag = f'"{etag}"' if etag and not etag.startswith('"') else etag
+
+    if _not_modified(request, etag, last_modified):
+        response = HttpResponse(status=304)
+        _set_headers(response, etag, last_modified, None, False, cache_control)
+        return response
+
+    range_header = request.headers.get("Range")
+    if_range = request.headers.get("If-Range")
+    if if_range and (not etag or if_range.strip() != etag):
+        range_header = None
+
+    try:
+        byte_range = parse_range(range_header, size) if range_header else None
+    except RangeNotSatisfiable:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    if byte_range:
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            _iter_range(path, start, end - start + 1), status=206, content_type=content_type
+        )
+        response["Content-Length"] = str(end - start + 1)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    else:
+        response = FileResponse(open(path, "rb"), content_type=content_type)
+        response["Content-Length"] = str(size)
+
+    _set_headers(response, etag, last_modified, filename, as_attachment, cache_control)
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+# ----------------------------
+# Protected Media
+# ----------------------------
+def serve_media(
+    request,
+    name: str,
+    etag: Optional[str] = None,
+    filename: Optional[str] = None,
+    as_attachment: bool = False,
+    cache_control: str = "private, no-cache",
+) -> HttpResponse:
+    """
+    Serve ``name`` from MEDIA_ROOT after the caller has checked access.
+
+    ``MEDIA_SERVE_BACKEND`` picks who moves the bytes:
+
+    - ``"django"``: ``serve_file`` (FileResponse, so ``sendfile`` under
+      gunicorn) with Range support.
+    - ``"nginx"``: an empty response with ``X-Accel-Redirect`` to
+      ``MEDIA_ACCEL_REDIRECT_PREFIX``, which must be an ``internal``
+      location aliased to MEDIA_ROOT. nginx then handles Range itself.
+    - ``"sendfile"``: ``X-Sendfile`` with the absolute path, for Apache
+      mod_xsendfile or lighttpd.
+
+    Conditional requests are answered here in every mode, so a 304 never
+    reaches the proxy. The ETag defaults to the file's mtime and size;
+    content-addressed files can pass their digest instead.
+    """
+    try:
+        path = safe_join(settings.MEDIA_ROOT, name)
+    except SuspiciousFileOperation:
+        raise Http404("File not found")
+    if not os.path.isfile(path):
+        raise Http404("File not found")
+
+    stat = os.stat(path)
+    etag = f'"{etag or f"{stat.st_mtime_ns:x}-{stat.st_size:x}"}"'
+    content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    backend = getattr(settings, "MEDIA_SERVE_BACKEND", "django")
+
+    if backend == "django":
+        return serve_file(
+            request, path, content_type, etag=etag, filename=filename, as_attachment=as_attachment,
+            cache_control=cache_control, last_modified=stat.st_mtime,
+        )
+
+    if _not_modified(request, etag, stat.st_mtime):
+        response = HttpResponse(status=304)
+    else:
+        response = HttpResponse(content_type=content_type)
+        if backend == "nginx":
+            prefix = getattr(settings, "MEDIA_ACCEL_REDIRECT_PREFIX", "/protected-media/")
+            response["X-Accel-Redirect"] = prefix.rstrip("/") + "/" + quote(name.lstrip("/"))
+        elif backend == "sendfile":
+            response["X-Sendfile"] = path
+        else:
+            raise ImproperlyConfigured(f"Unknown MEDIA_SERVE_BACKEND '{backend}'.")
+
+    _set_headers(response, etag, stat.st_mtime, filename, as_attachment, cache_control)
+    return response
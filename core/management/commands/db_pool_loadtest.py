@@ -0,0 +1,101 @@
+import json
+import threading
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+
+from core.db import pool_stats
+
+SERVER_CONNECTIONS_SQL = (
+    "SELECT count(*) FROM pg_stat_activity "
+    "WHERE datname = current_database() AND application_name = %s"
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Hammer the database from increasing numbers of threads and report "
+        "server-side connection counts and pool checkout waits per level."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", default="1,5,10,25,50", help="Comma-separated thread counts.")
+        parser.add_argument("--requests", type=int, default=200, help="Simulated requests per thread.")
+        parser.add_argument("--query-ms", type=float, default=5.0, help="Server-side time of each query.")
+        parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("The pool load test needs PostgreSQL (set DATABASE_URL with DEBUG off).")
+
+        levels = [int(level) for level in options["concurrency"].split(",") if level.strip()]
+        application_name = connection.settings_dict["OPTIONS"].get("application_name") or "hrms"
+        results = [self._run_level(level, options, application_name) for level in levels]
+
+        if options["json"]:
+            self.stdout.write(json.dumps({"pool": bool(pool_stats()), "levels": results}, indent=2))
+            return
+
+        self.stdout.write(f"{'threads':>8} {'req/s':>9} {'peak conns':>11} {'queued':>8} {'avg wait ms':>12} {'timeouts':>9}")
+        for row in results:
+            self.stdout.write(
+                f"{row['concurrency']:>8} {row['requests_per_second']:>9.0f} {row['peak_server_connections']:>11} "
+                f"{row['checkouts_queued']:>8} {row['checkout_wait_ms_avg']:>12.2f} {row['checkout_timeouts']:>9}"
+            )
+
+    def _run_level(self, concurrency, options, application_name):
+        before = pool_stats() or {}
+        peak = 0
+        errors = []
+        stop = threading.Event()
+        sleep_seconds = options["query_ms"] / 1000
+
+        def worker():
+            try:
+                for _ in range(options["requests"]):
+                    with connection.cursor() as cursor:
+                        cursor.execute("SELECT pg_sleep(%s)", [sleep_seconds])
+                    # End of a "request": a pooled connection goes back to
+                    # the pool, an unpooled one follows CONN_MAX_AGE.
+                    connection.close_if_unusable_or_obsolete()
+                    if connection.settings_dict["OPTIONS"].get("pool"):
+                        connection.close()
+            except Exception as e:
+                errors.append(str(e))
+            finally:
+                connections.close_all()
+
+        def sampler():
+            nonlocal peak
+            with connections["default"].cursor() as cursor:
+                while not stop.is_set():
+                    cursor.execute(SERVER_CONNECTIONS_SQL, [application_name])
+                    peak = max(peak, cursor.fetchone()[0])
+                    time.sleep(0.05)
+            connections.close_all()
+
+        sampling = threading.Thread(target=sampler)
+        sampling.start()
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        stop.set()
+        sampling.join()
+
+        after = pool_stats() or {}
+        queued = after.get("checkouts_queued", 0) - before.get("checkouts_queued", 0)
+        wait_ms = after.get("checkout_wait_ms_total", 0) - before.get("checkout_wait_ms_total", 0)
+        return {
+            "concurrency": concurrency,
+            "requests_per_second": concurrency * options["requests"] / elapsed,
+            # The sampler holds one connection of its own.
+            "peak_server_connections": max(peak - 1, 0),
+            "checkouts_queued": queued,
+            "checkout_wait_ms_avg": round(wait_ms / queued, 2) if queued else 0.0,
+            "checkout_timeouts": after.get("checkout_timeouts", 0) - before.get("checkout_timeouts", 0),
+            "errors": len(errors),
+        }
@@ -0,0 +1,46 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+
+from core.startup import LAZY_MODULES, import_times, measure_cold_start
+
+
+class Command(BaseCommand):
+    help = "Measure import time and time-to-first-request of a fresh WSGI worker."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=25, help="Number of slowest imports to list.")
+        parser.add_argument("--path", default="/health/", help="Path requested to measure the first request.")
+        parser.add_argument(
+            "--budget", type=float, default=None,
+            help="Fail when time-to-first-request exceeds this many seconds."
+        )
+        parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+
+    def handle(self, *args, **options):
+        rows = import_times()
+        cold_start = measure_cold_start(options["path"])
+        # Top-level packages only, so a package's submodules aren't listed twice.
+        top_level = [row for row in rows if "." not in row["module"]]
+        slowest = sorted(top_level, key=lambda row: row["cumulative_us"], reverse=True)[:options["top"]]
+
+        if options["json"]:
+            self.stdout.write(json.dumps({"cold_start": cold_start, "slowest_imports": slowest}, indent=2))
+        else:
+            self.stdout.write(f"{'cumulative ms':>14} {'self ms':>9}  module")
+            for row in slowest:
+                self.stdout.write(f"{row['cumulative_us'] / 1000:14.1f} {row['self_us'] / 1000:9.1f}  {row['module']}")
+            self.stdout.write(
+                f"\n{len(rows)} modules imported; application import {cold_start['import_seconds'] * 1000:.0f} ms, "
+                f"first request to {options['path']} ({cold_start['status']}) "
+                f"{cold_start['first_request_seconds'] * 1000:.0f} ms"
+            )
+
+        eager = cold_start["lazy_modules_loaded"]
+        if eager:
+            self.stderr.write(self.style.WARNING(f"Loaded eagerly: {', '.join(eager)} (expected lazy: {', '.join(LAZY_MODULES)})"))
+
+        budget = options["budget"]
+        if budget is not None and cold_start["first_request_seconds"] > budget:
+            raise CommandError(
+                f"Time to first request {cold_start['first_request_seconds']:.2f}s exceeds the {budget:.2f}s budget."
+            )
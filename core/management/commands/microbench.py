@@ -0,0 +1,56 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmarks import BENCHMARKS, find_regressions, run_benchmarks
+
+
+class Command(BaseCommand):
+    help = (
+        "Time per-request hot paths (core.utils helpers, users serializers and "
+        "password validation) and payslip computation, and optionally fail on "
+        "regressions against a baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("names", nargs="*", help="Benchmarks to run (substring match); all by default.")
+        parser.add_argument("--runs", type=int, default=5, help="Timed runs per benchmark.")
+        parser.add_argument("--min-time", type=float, default=0.1, help="Minimum seconds per run.")
+        parser.add_argument("--save", help="Write the results as JSON to this file (a new baseline).")
+        parser.add_argument("--baseline", help="JSON results of an earlier run to compare against.")
+        parser.add_argument(
+            "--threshold", type=float, default=1.25,
+            help="Fail when a benchmark is this many times slower than the baseline."
+        )
+        parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+
+    def handle(self, *args, **options):
+        names = [name for name in BENCHMARKS if not options["names"] or any(n in name for n in options["names"])]
+        if not names:
+            raise CommandError(f"No benchmark matches {', '.join(options['names'])}.")
+        results = run_benchmarks(names, options["runs"], options["min_time"])
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+        else:
+            self.stdout.write(f"{'benchmark':<42} {'mean us':>10} {'± stdev':>9} {'min us':>10} {'loops':>8}")
+            for name, row in results.items():
+                self.stdout.write(
+                    f"{name:<42} {row['mean_us']:>10.2f} {row['stdev_us']:>9.2f} {row['min_us']:>10.2f} {row['loops']:>8}"
+                )
+
+        if options["save"]:
+            with open(options["save"], "w") as f:
+                json.dump(results, f, indent=2)
+
+        if options["baseline"]:
+            with open(options["baseline"]) as f:
+                regressions = find_regressions(results, json.load(f), options["threshold"])
+            if regressions:
+                raise CommandError("Regressions over {:.0%} of baseline:\n{}".format(
+                    options["threshold"] - 1,
+                    "\n".join(
+                        f"  {r['name']}: {r['baseline_us']:.2f}us -> {r['current_us']:.2f}us ({r['ratio']}x)"
+                        for r in regressions
+                    ),
+                ))
+            self.stdout.write(self.style.SUCCESS(f"No regressions over {options['threshold'] - 1:.0%} of baseline."))
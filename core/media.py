@@ -0,0 +1,61 @@
+"""
+Access rules for files under MEDIA_ROOT. Every file is private: a path is
+only served when a rule for its top-level directory grants access.
+"""
+import posixpath
+import re
+from typing import Optional
+
+from core.permissions import is_admin
+
+PROFILE_IMAGE_PREFIX = "images/employee/profile/"
+# Generated variants only (see users.images): raw uploads in the same
+# directory still carry their EXIF metadata, GPS included.
+PROFILE_IMAGE_VARIANT_RE = re.compile(r"^images/employee/profile/[0-9a-f]{2}/[0-9a-f]{64}\.(webp|jpeg)$")
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+def normalize_media_name(name: str) -> Optional[str]:
+    """Collapse ``..`` segments so prefix checks can't be sidestepped."""
+    name = posixpath.normpath(name.replace("\\", "/")).lstrip("/")
+    if name in ("", ".") or name.startswith(".."):
+        return None
+    return name
+
+
+# ----------------------------
+# Access Rules
+# ----------------------------
+def _profile_image(user, name):
+    return PROFILE_IMAGE_VARIANT_RE.match(name) is not None
+
+
+def _employee_file(user, name):
+    from users.models import EmployeeFile
+    return is_admin(user) or EmployeeFile.objects.filter(file_url=name, employee=user).exists()
+
+
+def _project_file(user, name):
+    from project.models import ProjectFile
+    return is_admin(user) or ProjectFile.objects.filter(file_url=name, assigned_to=user).exists()
+
+
+def _payslip(user, name):
+    from payroll.models import PaySalary
+    digest = posixpath.splitext(posixpath.basename(name))[0]
+    return is_admin(user) or PaySalary.objects.filter(pdf_digest=digest, employee=user).exists()
+
+
+MEDIA_ACCESS_RULES = (
+    (PROFILE_IMAGE_PREFIX, _profile_image),
+    ("employee_files/", _employee_file),
+    ("project_files/", _project_file),
+    ("payslips/", _payslip),
+)
+
+
+def can_access_media(user, name: str) -> bool:
+    for prefix, rule in MEDIA_ACCESS_RULES:
+        if name.startswith(prefix):
+            return rule(user, name)
+    return False
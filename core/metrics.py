@@ -0,0 +1,239 @@
+"""
+Per-view request metrics: latency, SQL query count and time, cache hits
+and misses. ``RequestMetricsMiddleware`` collects them into an in-process
+registry that ``/metrics`` renders in the Prometheus text format.
+
+Each gunicorn worker keeps its own registry and series carry a ``pid``
+label, so Prometheus sees one set of counters per worker (aggregate with
+``sum without (pid)``).
+
+The hot path is kept to a few attribute updates per query so the
+middleware stays well under 50µs per request.
+"""
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+MAX_SAMPLED_QUERIES = 50
+
+
+class RequestStats:
+    __slots__ = ("queries", "db_seconds", "cache_hits", "cache_misses", "sql")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.sql: List[Tuple[str, float]] = []
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+# ----------------------------
+# Collectors
+# ----------------------------
+def _query_wrapper(execute, sql, params, many, context):
+    stats = _current.get()
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        if stats is not None:
+            elapsed = time.perf_counter() - started
+            stats.queries += 1
+            stats.db_seconds += elapsed
+            if len(stats.sql) < MAX_SAMPLED_QUERIES:
+                stats.sql.append((sql, elapsed))
+
+
+def record_cache(hits: int, misses: int) -> None:
+    stats = _current.get()
+    if stats is not None:
+        stats.cache_hits += hits
+        stats.cache_misses += misses
+
+
+# ----------------------------
+# Registry
+# ----------------------------
+class _ViewMetrics:
+    __slots__ = ("requests", "latency_sum", "buckets", "queries", "db_seconds", "cache_hits", "cache_misses", "slow")
+
+    def __init__(self):
+        self.requests: Dict[Tuple[str, int], int] = {}
+        self.latency_sum = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.slow = 0
+
+
+_lock = threading.Lock()
+_registry: Dict[str, _ViewMetrics] = {}
+_slow_samples = deque(maxlen=20)
+
+
+def record_request(view: str, method: str, status: int, latency: float, stats: RequestStats) -> None:
+    slow_seconds = getattr(settings, "METRICS_SLOW_REQUEST_MS", 500) / 1000
+    is_slow = latency >= slow_seconds
+    with _lock:
+        metrics = _registry.get(view)
+        if metrics is None:
+            metrics = _registry[view] = _ViewMetrics()
+        key = (method, status)
+        metrics.requests[key] = metrics.requests.get(key, 0) + 1
+        metrics.latency_sum += latency
+        metrics.buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        metrics.queries += stats.queries
+        metrics.db_seconds += stats.db_seconds
+        metrics.cache_hits += stats.cache_hits
+        metrics.cache_misses += stats.cache_misses
+        metrics.slow += is_slow
+
+    if is_slow:
+        sample = {
+            "view": view,
+            "method": method,
+            "status": status,
+            "latency_ms": round(latency * 1000, 1),
+            "queries": stats.queries,
+            "db_ms": round(stats.db_seconds * 1000, 1),
+            "sql": [(sql, round(elapsed * 1000, 2)) for sql, elapsed in stats.sql],
+        }
+        _slow_samples.append(sample)
+        slowest = sorted(stats.sql, key=lambda item: item[1], reverse=True)[:5]
+        logger.warning(
+            f"Slow request {method} {view}: {sample['latency_ms']}ms, {stats.queries} queries "
+            f"({sample['db_ms']}ms). Slowest SQL: "
+            + " | ".join(f"{elapsed * 1000:.1f}ms {sql}" for sql, elapsed in slowest)
+        )
+
+
+def recent_slow_requests() -> List[dict]:
+    return list(_slow_samples)
+
+
+def reset_metrics() -> None:
+    with _lock:
+        _registry.clear()
+        _slow_samples.clear()
+
+
+# ----------------------------
+# Middleware
+# ----------------------------
+class RequestMetricsMiddleware:
+    """Time every request and attribute its queries and cache calls to the view."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, "METRICS_ENABLED", True)
+
+    def __call__(self, request):
+        if not self.enabled:
+            return self.get_response(request)
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        # A connection shared between threads (live-server tests) must
+        # not get the wrapper twice, or its queries would count double.
+        wrapped = [
+            connection for connection in (connections[alias] for alias in connections)
+            if _query_wrapper not in connection.execute_wrappers
+        ]
+        for connection in wrapped:
+            connection.execute_wrappers.append(_query_wrapper)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            latency = time.perf_counter() - started
+            for connection in wrapped:
+                connection.execute_wrappers.remove(_query_wrapper)
+            _current.reset(token)
+
+        match = request.resolver_match
+        view = (match.view_name or match._func_path) if match else "unresolved"
+        record_request(view, request.method, response.status_code, latency, stats)
+        return response
+
+
+# ----------------------------
+# Prometheus Exposition
+# ----------------------------
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus() -> str:
+    pid = os.getpid()
+    lines = []
+
+    def metric(name, kind, help_text):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    with _lock:
+        snapshot = {
+            view: (
+                dict(m.requests), m.latency_sum, list(m.buckets), m.queries,
+                m.db_seconds, m.cache_hits, m.cache_misses, m.slow,
+            )
+            for view, m in _registry.items()
+        }
+
+    metric("hrms_http_requests_total", "counter", "Requests by view, method and status.")
+    for view, (requests, *_rest) in snapshot.items():
+        for (method, status), count in sorted(requests.items()):
+            lines.append(
+                f'hrms_http_requests_total{{pid="{pid}",view="{_escape(view)}",method="{method}",status="{status}"}} {count}'
+            )
+
+    metric("hrms_http_request_duration_seconds", "histogram", "Request latency by view.")
+    for view, (requests, latency_sum, buckets, *_rest) in snapshot.items():
+        labels = f'pid="{pid}",view="{_escape(view)}"'
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), buckets):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'hrms_http_request_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+        lines.append(f"hrms_http_request_duration_seconds_sum{{{labels}}} {latency_sum:.6f}")
+        lines.append(f"hrms_http_request_duration_seconds_count{{{labels}}} {cumulative}")
+
+    per_view = (
+        ("hrms_db_queries_total", "SQL queries executed by view.", 3, "{}"),
+        ("hrms_db_query_seconds_total", "Time spent in SQL by view.", 4, "{:.6f}"),
+        ("hrms_cache_hits_total", "Cache hits by view.", 5, "{}"),
+        ("hrms_cache_misses_total", "Cache misses by view.", 6, "{}"),
+        ("hrms_slow_requests_total", "Requests over METRICS_SLOW_REQUEST_MS by view.", 7, "{}"),
+    )
+    for name, help_text, index, fmt in per_view:
+        metric(name, "counter", help_text)
+        for view, values in snapshot.items():
+            lines.append(f'{name}{{pid="{pid}",view="{_escape(view)}"}} {fmt.format(values[index])}')
+
+    from core.db import pool_stats
+    stats = pool_stats()
+    if stats is not None:
+        for key in ("size", "available", "waiting"):
+            metric(f"hrms_db_pool_{key}", "gauge", f"Connection pool {key}.")
+            lines.append(f'hrms_db_pool_{key}{{pid="{pid}"}} {stats[key]}')
+        metric("hrms_db_pool_checkout_wait_seconds_total", "counter", "Time spent waiting for a pooled connection.")
+        lines.append(f'hrms_db_pool_checkout_wait_seconds_total{{pid="{pid}"}} {stats["checkout_wait_ms_total"] / 1000:.3f}')
+
+    return "\n".join(lines) + "\n"
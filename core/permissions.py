@@ -0,0 +1,24 @@
+from rest_framework.permissions import BasePermission
+
+ADMIN_ROLES = ("SUPER_ADMIN", "ADMIN")
+
+
+# ----------------------------
+# Role Helpers
+# ----------------------------
+def is_admin(user) -> bool:
+    """True for authenticated users holding an admin role."""
+    return bool(user and user.is_authenticated and getattr(user, "em_role", None) in ADMIN_ROLES)
+
+
+# ----------------------------
+# Admin Role Permission
+# ----------------------------
+class IsAdminRole(BasePermission):
+    """
+    Allow access only to users with the ADMIN or SUPER_ADMIN role.
+    """
+    message = "Admin access required."
+
+    def has_permission(self, request, view):
+        return is_admin(request.user)
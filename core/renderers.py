@@ -0,0 +1,61 @@
+"""
+orjson-backed JSON renderer. orjson is optional: without it, or with
+settings orjson cannot honour (non-compact or ASCII-only output), the
+stdlib ``JSONRenderer`` is used unchanged.
+
+orjson writes NaN and Infinity as ``null`` where the stdlib renderer
+raises (``STRICT_JSON``) or writes them verbatim, so a payload holding one
+is re-rendered by the stdlib. Only output containing ``null`` is checked.
+Anything else orjson refuses (integers beyond 64 bits) is also left to
+the stdlib.
+"""
+import math
+from decimal import Decimal
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson encodes UUIDs, dates and datetimes itself, matching DRF's output;
+# Decimals, lazy strings, querysets etc. go through DRF's encoder.
+_default = JSONEncoder().default
+
+
+def _has_non_finite(value) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, Decimal):
+        return not value.is_finite()
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+
+        options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            options |= orjson.OPT_INDENT_2
+        try:
+            ret = orjson.dumps(data, default=_default, option=options)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the stdlib encodes fine.
+            return super().render(data, accepted_media_type, renderer_context)
+        if b"null" in ret and _has_non_finite(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Like JSONRenderer, escape U+2028/U+2029 so the output is valid JavaScript.
+        if b"\xe2\x80" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
@@ -0,0 +1,135 @@
+"""
+Read-replica routing.
+
+Reads go to a replica only inside a *replica scope*: a safe-method
+request (opened by ``ReplicaRoutingMiddleware``) or a ``use_replicas()``
+block in reporting code. Everything else, including management commands
+and the payroll run, stays on ``default``. A scope picks one replica on
+its first read and keeps it, so a request doesn't see replicas at
+different lag points and holds one replica connection, not one per alias.
+
+Read-your-writes: the first write inside a scope pins the rest of it to
+the primary, and a request that wrote pins that user's next requests to
+the primary for ``REPLICA_STICKY_SECONDS`` (tracked in the cache, so it
+holds across workers).
+"""
+import base64
+import json
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+STICKY_KEY = "replica:sticky:{}"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class _Scope:
+    __slots__ = ("use_replica", "wrote", "replica")
+
+    def __init__(self, use_replica: bool):
+        self.use_replica = use_replica
+        self.wrote = False
+        self.replica = None
+
+
+_scope: ContextVar[Optional[_Scope]] = ContextVar("replica_scope", default=None)
+
+
+def replicas_enabled() -> bool:
+    return bool(getattr(settings, "READ_REPLICAS_ENABLED", True) and getattr(settings, "READ_REPLICAS", None))
+
+
+@contextmanager
+def use_replicas(enabled: bool = True):
+    """Route reads in the block to replicas (until the block writes)."""
+    scope = _Scope(use_replica=enabled and replicas_enabled())
+    token = _scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _scope.reset(token)
+
+
+# ----------------------------
+# Router
+# ----------------------------
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        scope = _scope.get()
+        if scope is None or not scope.use_replica:
+            return "default"
+        if scope.replica is None:
+            scope.replica = random.choice(settings.READ_REPLICAS)
+        return scope.replica
+
+    def db_for_write(self, model, **hints):
+        scope = _scope.get()
+        if scope is not None:
+            scope.use_replica = False
+            scope.wrote = True
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary.
+        return True
+
+
+# ----------------------------
+# Stickiness
+# ----------------------------
+def _token_user_id(request) -> Optional[str]:
+    """
+    User id claim of the bearer token, read without verifying it: it only
+    decides whether reads go to the primary, and authentication still
+    verifies the token later in the request.
+    """
+    header = request.headers.get("Authorization", "")
+    parts = header.split()
+    if len(parts) != 2 or parts[0] != "Bearer":
+        return None
+    try:
+        payload = parts[1].split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return None
+    claim = getattr(settings, "SIMPLE_JWT", {}).get("USER_ID_CLAIM", "user_id")
+    user_id = claims.get(claim) if isinstance(claims, dict) else None
+    return str(user_id) if user_id else None
+
+
+def _request_user_id(request) -> Optional[str]:
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return str(user.pk)
+    return _token_user_id(request)
+
+
+class ReplicaRoutingMiddleware:
+    """Open a replica scope for safe-method requests of non-sticky users."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not replicas_enabled():
+            return self.get_response(request)
+
+        user_id = _request_user_id(request)
+        use_replica = request.method in SAFE_METHODS and not (
+            user_id and cache.get(STICKY_KEY.format(user_id))
+        )
+
+        with use_replicas(use_replica) as scope:
+            response = self.get_response(request)
+
+        if scope.wrote or request.method not in SAFE_METHODS:
+            # Authentication has run by now, so the user is known even if
+            # the request started anonymous (e.g. login).
+            user_id = _request_user_id(request)
+            if user_id:
+                cache.set(STICKY_KEY.format(user_id), 1, getattr(settings, "REPLICA_STICKY_SECONDS", 5))
+        return response
@@ -0,0 +1,116 @@
+"""
+Worker startup helpers: fork-safety hooks for gunicorn ``preload_app`` and
+cold-start measurement. Measurements run in a fresh interpreter so nothing
+is already imported, exactly like a new gunicorn worker.
+"""
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+from django.conf import settings
+
+# Heavy optional dependencies that must only load when actually used.
+LAZY_MODULES = ("sendgrid", "PIL")
+
+
+# ----------------------------
+# Fork Safety
+# ----------------------------
+def close_connections_before_fork() -> None:
+    """
+    Close database connections opened while preloading the app (by system
+    checks or the cache warm-up) in the gunicorn master. Closing must
+    happen here: a child closing an inherited PostgreSQL connection would
+    terminate the session for every other process sharing the socket.
+    """
+    from django.db import connections
+    connections.close_all()
+    # A psycopg pool owns background threads, which don't survive fork();
+    # each worker opens its own pool on first use.
+    for conn in connections.all(initialized_only=True):
+        if hasattr(conn, "close_pool"):
+            conn.close_pool()
+
+
+def reset_connections_after_fork() -> None:
+    """
+    Drop any connection state inherited from the master in a new worker.
+    Database connections are discarded without closing the shared socket,
+    and Redis pools are reset so each worker opens its own connections.
+    """
+    from django.core.cache import caches
+    from django.db import connections
+
+    for conn in connections.all(initialized_only=True):
+        conn.connection = None
+
+    for alias in settings.CACHES:
+        cache = caches[alias]
+        client = getattr(cache, "client", None)
+        for pool_client in getattr(client, "_clients", None) or []:
+            if pool_client is not None:
+                pool_client.connection_pool.reset()
+
+
+# ----------------------------
+# Cold Start
+# ----------------------------
+_COLD_START_SCRIPT = """
+import io, json, sys, time
+t0 = time.perf_counter()
+from hrms.wsgi import application
+t1 = time.perf_counter()
+environ = {
+    "REQUEST_METHOD": "GET", "PATH_INFO": sys.argv[1], "QUERY_STRING": "",
+    "SERVER_NAME": "localhost", "SERVER_PORT": "80", "HTTP_HOST": "localhost",
+    "wsgi.url_scheme": "http", "wsgi.input": io.BytesIO(), "wsgi.errors": sys.stderr,
+    "wsgi.version": (1, 0), "wsgi.multithread": False, "wsgi.multiprocess": True, "wsgi.run_once": False,
+}
+status = []
+body = b"".join(application(environ, lambda s, h, e=None: status.append(s)))
+t2 = time.perf_counter()
+print(json.dumps({
+    "import_seconds": t1 - t0,
+    "first_request_seconds": t2 - t0,
+    "status": int(status[0].split()[0]),
+    "lazy_modules_loaded": [m for m in sys.argv[2:] if m in sys.modules],
+}))
+"""
+
+
+def _run(args: List[str], env: Optional[Dict[str, str]] = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=settings.BASE_DIR,
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "hrms.settings", **(env or {})},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def measure_cold_start(path: str = "/health/", env: Optional[Dict[str, str]] = None) -> Dict[str, object]:
+    """
+    Import the WSGI application and serve one request to ``path`` in a new
+    process. Returns import and time-to-first-request in seconds, the
+    response status and which ``LAZY_MODULES`` got imported.
+    """
+    result = _run(["-c", _COLD_START_SCRIPT, path, *LAZY_MODULES], env)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def import_times(env: Optional[Dict[str, str]] = None) -> List[Dict[str, object]]:
+    """
+    ``python -X importtime`` for loading the WSGI application, as a list of
+    ``{"module", "self_us", "cumulative_us"}`` rows in import order.
+    """
+    result = _run(["-X", "importtime", "-c", "from hrms.wsgi import application"], env)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append({"module": module.strip(), "self_us": int(self_us), "cumulative_us": int(cumulative_us)})
+    return rows
@@ -0,0 +1,80 @@
+"""
+Query-count guards for tests. ``QueryCountMixin`` adds assertions to a
+Django ``TestCase`` that pin how many SQL queries a block or endpoint may
+run, and catch N+1 regressions by checking that the count stays flat as
+the number of rows grows. ``capture_queries`` is the plain-function form
+for tests that are not ``TestCase`` methods.
+"""
+import re
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, List, Sequence, Tuple
+
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+def capture_queries(fn: Callable, using: str = "default") -> Tuple[object, List[str]]:
+    """Call ``fn`` and return its result with the SQL it executed."""
+    with CaptureQueriesContext(connections[using]) as context:
+        result = fn()
+    return result, [query["sql"] for query in context.captured_queries]
+
+
+def normalize_sql(sql: str) -> str:
+    """``sql`` with literal values replaced by ``?``, so per-row queries group together."""
+    return _LITERALS.sub("?", sql)
+
+
+def format_queries(queries: Sequence[str]) -> str:
+    return "\n".join(f"  {i}. {sql}" for i, sql in enumerate(queries, 1))
+
+
+class QueryCountMixin:
+    """Query-count assertions for ``django.test.TestCase`` subclasses."""
+
+    @contextmanager
+    def assertMaxQueries(self, limit: int, using: str = "default"):
+        with CaptureQueriesContext(connections[using]) as context:
+            yield context
+        queries = [query["sql"] for query in context.captured_queries]
+        if len(queries) > limit:
+            self.fail(f"{len(queries)} queries executed, expected at most {limit}:\n{format_queries(queries)}")
+
+    def assertQueriesDoNotScale(
+        self,
+        add_rows: Callable[[int], None],
+        request: Callable[[], object],
+        sizes: Sequence[int] = (1, 5, 20),
+        max_queries: int = None,
+        using: str = "default",
+    ) -> List[int]:
+        """
+        Grow the data to each of ``sizes`` rows with ``add_rows(count)``
+        (which adds ``count`` more), call ``request()`` and count its
+        queries. Fails when the count grows with the number of rows, listing
+        the queries that repeat per row, or when it exceeds ``max_queries``.
+        Returns the count at each size.
+        """
+        counts, captured, total = [], [], 0
+        for size in sorted(sizes):
+            add_rows(size - total)
+            total = size
+            _, queries = capture_queries(request, using)
+            counts.append(len(queries))
+            captured.append(queries)
+
+        if counts[-1] > counts[0]:
+            smallest = Counter(normalize_sql(sql) for sql in captured[0])
+            largest = Counter(normalize_sql(sql) for sql in captured[-1])
+            repeated = [f"{count - smallest[sql]}x more: {sql}" for sql, count in largest.items() if count > smallest[sql]]
+            by_size = ", ".join(f"{size} rows: {count}" for size, count in zip(sorted(sizes), counts))
+            self.fail(f"Query count scales with rows ({by_size}). Repeated queries:\n{format_queries(repeated)}")
+
+        if max_queries is not None and counts[-1] > max_queries:
+            self.fail(
+                f"{counts[-1]} queries executed, expected at most {max_queries}:\n{format_queries(captured[-1])}"
+            )
+        return counts
@@ -0,0 +1,45 @@
+import json
+import os
+import tempfile
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase
+
+from core.benchmarks import BENCHMARKS, find_regressions, measure
+
+
+class MeasureTests(SimpleTestCase):
+    def test_calibrates_loops(self):
+        result = measure(lambda: sum(range(100)), runs=3, min_time=0.01)
+        self.assertGreater(result["loops"], 1)
+        self.assertEqual(result["runs"], 3)
+        self.assertLessEqual(result["min_us"], result["mean_us"])
+
+    def test_find_regressions(self):
+        baseline = {"fast": {"min_us": 10.0}, "steady": {"min_us": 10.0}}
+        results = {"fast": {"min_us": 13.0}, "steady": {"min_us": 11.0}, "new": {"min_us": 99.0}}
+        regressions = find_regressions(results, baseline, threshold=1.25)
+        self.assertEqual([r["name"] for r in regressions], ["fast"])
+        self.assertEqual(regressions[0]["ratio"], 1.3)
+
+
+class MicrobenchCommandTests(TestCase):
+    def run_command(self, *args):
+        with open(os.devnull, "w") as devnull:
+            call_command("microbench", *args, "--runs", "2", "--min-time", "0.005", stdout=devnull)
+
+    def test_every_benchmark_runs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "baseline.json")
+            self.run_command("--save", output)
+            with open(output) as f:
+                results = json.load(f)
+        self.assertEqual(set(results), set(BENCHMARKS))
+
+    def test_baseline_regression_fails(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = os.path.join(tmp, "baseline.json")
+            with open(baseline, "w") as f:
+                json.dump({"core.generate_otp": {"min_us": 0.0001}}, f)
+            with self.assertRaisesMessage(CommandError, "core.generate_otp"):
+                self.run_command("generate_otp", "--baseline", baseline)
@@ -0,0 +1,99 @@
+import threading
+import time
+from unittest.mock import patch
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from core import health
+
+
+@override_settings(HEALTH_PROBE_TIMEOUT=0.5, HEALTH_CACHE_SECONDS=1.0)
+class ReadinessTests(TransactionTestCase):
+    def setUp(self):
+        self.client = APIClient()
+        health.reset_readiness_cache()
+        # No Redis server in the test environment.
+        self.redis_patch = patch.dict(health.PROBES, {"redis": (lambda: {}, health.STATUS_DEGRADED)})
+        self.redis_patch.start()
+
+    def tearDown(self):
+        self.redis_patch.stop()
+        health.reset_readiness_cache()
+
+    def test_liveness_does_not_probe(self):
+        with patch("core.health.run_probes") as run_probes:
+            response = self.client.get(reverse("health-live"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("uptime_seconds", response.data["data"])
+        run_probes.assert_not_called()
+
+    def test_ready_reports_latency_per_dependency(self):
+        response = self.client.get(reverse("health-ready"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        checks = response.data["data"]["checks"]
+        self.assertEqual(set(checks), {"database", "redis", "mail"})
+        for check in checks.values():
+            self.assertEqual(check["status"], health.STATUS_OK)
+            self.assertIn("latency_ms", check)
+        self.assertEqual(checks["mail"]["queue_depth"], 0)
+
+    def test_database_failure_is_not_ready(self):
+        def broken():
+            raise RuntimeError("connection refused")
+
+        with patch.dict(health.PROBES, {"database": (broken, health.STATUS_FAIL)}):
+            response = self.client.get(reverse("health-ready"))
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response.data["data"]["checks"]["database"]["error"], "connection refused")
+
+    def test_probes_run_in_parallel_with_timeout(self):
+        def slow():
+            time.sleep(0.3)
+            return {}
+
+        probes = {name: (slow, health.STATUS_DEGRADED) for name in ("a", "b", "c")}
+        probes["hung"] = (lambda: time.sleep(2) or {}, health.STATUS_DEGRADED)
+        with patch.object(health, "PROBES", probes), override_settings(HEALTH_PROBE_TIMEOUT=0.5):
+            started = time.monotonic()
+            result = health.run_probes()
+            elapsed = time.monotonic() - started
+        self.assertLess(elapsed, 0.8)
+        self.assertEqual(result["checks"]["a"]["status"], health.STATUS_OK)
+        self.assertEqual(result["checks"]["hung"]["status"], health.STATUS_DEGRADED)
+        self.assertEqual(result["status"], health.STATUS_DEGRADED)
+
+    def test_hung_probe_not_submitted_again(self):
+        release = threading.Event()
+        calls = []
+
+        def hung():
+            calls.append(1)
+            release.wait(5)
+            return {}
+
+        with patch.object(health, "PROBES", {"stuck": (hung, health.STATUS_DEGRADED)}), \
+                override_settings(HEALTH_PROBE_TIMEOUT=0.1):
+            self.assertEqual(health.run_probes()["checks"]["stuck"]["error"], "timed out after 0.1s")
+            self.assertEqual(health.run_probes()["checks"]["stuck"]["error"], "previous probe still running")
+            self.assertEqual(len(calls), 1)
+
+            release.set()
+            health._inflight["stuck"].result(timeout=1)
+            self.assertEqual(health.run_probes()["checks"]["stuck"]["status"], health.STATUS_OK)
+            self.assertEqual(len(calls), 2)
+
+    def test_result_cached_for_a_second(self):
+        with patch("core.health.run_probes", wraps=health.run_probes) as run_probes:
+            self.client.get(reverse("health-ready"))
+            self.client.get(reverse("health-ready"))
+            self.assertEqual(run_probes.call_count, 1)
+            with override_settings(HEALTH_CACHE_SECONDS=0):
+                self.client.get(reverse("health-ready"))
+            self.assertEqual(run_probes.call_count, 2)
+
+    def test_mail_queue_backlog_degrades(self):
+        with patch("core.health.pending_email_count", return_value=500), override_settings(HEALTH_MAIL_QUEUE_MAX=100):
+            result = health.run_probes()
+        self.assertEqual(result["checks"]["mail"]["status"], health.STATUS_DEGRADED)
+        self.assertEqual(result["status"], health.STATUS_DEGRADED)
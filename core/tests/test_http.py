@@ -0,0 +1,29 @@
+import unittest
+
+from core.http import parse_range, RangeNotSatisfiable
+
+
+class ParseRangeTests(unittest.TestCase):
+    def test_explicit_range(self):
+        self.assertEqual(parse_range("bytes=0-99", 1000), (0, 99))
+
+    def test_open_ended_range(self):
+        self.assertEqual(parse_range("bytes=900-", 1000), (900, 999))
+
+    def test_suffix_range(self):
+        self.assertEqual(parse_range("bytes=-100", 1000), (900, 999))
+        self.assertEqual(parse_range("bytes=-5000", 1000), (0, 999))
+
+    def test_end_clamped_to_size(self):
+        self.assertEqual(parse_range("bytes=500-5000", 1000), (500, 999))
+
+    def test_ignored_headers(self):
+        self.assertIsNone(parse_range("bytes=0-1,5-6", 1000))
+        self.assertIsNone(parse_range("items=0-1", 1000))
+        self.assertIsNone(parse_range("bytes=-", 1000))
+
+    def test_unsatisfiable(self):
+        with self.assertRaises(RangeNotSatisfiable):
+            parse_range("bytes=1000-", 1000)
+        with self.assertRaises(RangeNotSatisfiable):
+            parse_range("bytes=-0", 1000)
@@ -0,0 +1,106 @@
+import os
+import shutil
+import tempfile
+from django.core.files.base import ContentFile
+from django.test import override_settings
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from users.models import User, EmployeeFile
+
+
+class ProtectedMediaTests(APITestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+
+        self.employee = User.objects.create_user(email="emp@gmail.com", password="testpass123")
+        self.other = User.objects.create_user(email="other@gmail.com", password="testpass123")
+        self.admin = User.objects.create_user(email="admin@gmail.com", password="testpass123", em_role="ADMIN")
+
+        self.document = EmployeeFile(employee=self.employee, file_title="Contract")
+        self.document.file_url.save("contract.txt", ContentFile(b"0123456789" * 10))
+        self.url = reverse("protected-media", args=[self.document.file_url.name])
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def authenticate(self, user):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
+
+    def test_owner_and_admin_can_download(self):
+        for user in (self.employee, self.admin):
+            self.authenticate(user)
+            response = self.client.get(self.url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(b"".join(response.streaming_content), b"0123456789" * 10)
+
+    def test_other_employee_and_anonymous_denied(self):
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.authenticate(self.other)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unlisted_and_traversal_paths_denied(self):
+        self.authenticate(self.admin)
+        os.makedirs(os.path.join(self.media_root, "uploads", "partial"))
+        open(os.path.join(self.media_root, "uploads", "partial", "x.part"), "wb").close()
+        for name in ("uploads/partial/x.part", "images/employee/profile/../../uploads/partial/x.part"):
+            response = self.client.get(reverse("protected-media", args=[name]))
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_range_and_conditional_requests(self):
+        self.authenticate(self.employee)
+        response = self.client.get(self.url, HTTP_RANGE="bytes=10-19")
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b"".join(response.streaming_content), b"0123456789")
+
+        etag = response["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=http_date(0))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(MEDIA_SERVE_BACKEND="nginx", MEDIA_ACCEL_REDIRECT_PREFIX="/protected-media/")
+    def test_nginx_accel_redirect(self):
+        self.authenticate(self.employee)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["X-Accel-Redirect"], f"/protected-media/{self.document.file_url.name}")
+        self.assertEqual(response.content, b"")
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertNotIn("X-Accel-Redirect", response)
+
+    @override_settings(MEDIA_SERVE_BACKEND="sendfile")
+    def test_x_sendfile(self):
+        self.authenticate(self.employee)
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Sendfile"], self.document.file_url.path)
+        self.assertEqual(response.content, b"")
+
+    def test_profile_images_cached_immutably(self):
+        name = f"images/employee/profile/ab/{'ab' * 32}.webp"
+        os.makedirs(os.path.join(self.media_root, "images/employee/profile/ab"))
+        with open(os.path.join(self.media_root, name), "wb") as f:
+            f.write(b"RIFF")
+        self.authenticate(self.other)
+        response = self.client.get(reverse("protected-media", args=[name]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("immutable", response["Cache-Control"])
+
+    def test_raw_profile_upload_not_served(self):
+        name = "images/employee/profile/IMG_0001.jpg"
+        os.makedirs(os.path.join(self.media_root, "images/employee/profile"))
+        with open(os.path.join(self.media_root, name), "wb") as f:
+            f.write(b"\xff\xd8\xff\xe1Exif")
+        self.authenticate(self.admin)
+        response = self.client.get(reverse("protected-media", args=[name]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,99 @@
+import time
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core import metrics
+from core.cache import CacheMetricsMixin
+from users.models import User
+
+
+class InstrumentedLocMemCache(CacheMetricsMixin, LocMemCache):
+    pass
+
+
+INSTRUMENTED_CACHE = {"default": {"BACKEND": "core.tests.test_metrics.InstrumentedLocMemCache"}}
+
+
+@override_settings(CACHES=INSTRUMENTED_CACHE, METRICS_ENABLED=True, METRICS_SLOW_REQUEST_MS=10_000, METRICS_TOKEN="")
+class RequestMetricsTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        metrics.reset_metrics()
+        User.objects.create_user(email="metrics@gmail.com", password="testpass123")
+
+    def tearDown(self):
+        metrics.reset_metrics()
+
+    def login(self):
+        return self.client.post(
+            reverse("accounts:login"), {"email": "metrics@gmail.com", "password": "testpass123"}, format="json"
+        )
+
+    def view_metrics(self, view):
+        return metrics._registry[view]
+
+    def test_records_queries_cache_and_latency_per_view(self):
+        response = self.login()
+        login = self.view_metrics("accounts:login")
+        self.assertEqual(login.requests, {("POST", response.status_code): 1})
+        self.assertGreater(login.queries, 0)
+        self.assertGreater(login.db_seconds, 0)
+        # The throttle reads its history from the cache.
+        self.assertGreater(login.cache_hits + login.cache_misses, 0)
+        self.assertEqual(sum(login.buckets), 1)
+        self.assertEqual(login.slow, 0)
+
+    @override_settings(METRICS_SLOW_REQUEST_MS=0)
+    def test_slow_requests_are_sampled_with_sql(self):
+        with self.assertLogs("core.metrics", "WARNING") as logs:
+            self.login()
+        sample = metrics.recent_slow_requests()[-1]
+        self.assertEqual(sample["view"], "accounts:login")
+        self.assertEqual(len(sample["sql"]), sample["queries"])
+        self.assertIn("SELECT", sample["sql"][0][0])
+        self.assertIn("Slow request POST accounts:login", logs.output[0])
+
+    @override_settings(DEBUG=True)
+    def test_prometheus_endpoint(self):
+        self.login()
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        body = response.content.decode()
+        self.assertIn("# TYPE hrms_http_request_duration_seconds histogram", body)
+        self.assertRegex(body, r'hrms_http_requests_total\{pid="\d+",view="accounts:login",method="POST",status="\d+"\} 1')
+        self.assertRegex(body, r'hrms_http_request_duration_seconds_bucket\{pid="\d+",view="accounts:login",le="\+Inf"\} 1')
+        self.assertRegex(body, r'hrms_db_queries_total\{pid="\d+",view="accounts:login"\} [1-9]')
+
+    @override_settings(METRICS_TOKEN="scrape-secret")
+    def test_prometheus_endpoint_requires_token(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 404)
+        response = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer scrape-secret")
+        self.assertEqual(response.status_code, 200)
+
+
+@override_settings(METRICS_ENABLED=True, METRICS_SLOW_REQUEST_MS=10_000)
+class MiddlewareOverheadTests(SimpleTestCase):
+    def tearDown(self):
+        metrics.reset_metrics()
+
+    def test_overhead_under_50_microseconds(self):
+        request = RequestFactory().get("/")
+        response = HttpResponse()
+        get_response = lambda request: response  # noqa: E731
+        middleware = metrics.RequestMetricsMiddleware(get_response)
+
+        def best_of(fn, runs=5, n=2000):
+            best = float("inf")
+            for _ in range(runs):
+                started = time.perf_counter()
+                for _ in range(n):
+                    fn(request)
+                best = min(best, (time.perf_counter() - started) / n)
+            return best
+
+        overhead = best_of(middleware) - best_of(get_response)
+        self.assertLess(overhead, 50e-6)
@@ -0,0 +1,71 @@
+import io
+import json
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.benchmarks import employee_list_payload
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_matches_stdlib_output(self):
+        payload = employee_list_payload(3)
+        rendered = ORJSONRenderer().render(payload)
+        self.assertEqual(json.loads(rendered), json.loads(JSONRenderer().render(payload)))
+        employee = json.loads(rendered)["data"][1]
+        self.assertEqual(employee["id"], "00000000-0000-0000-0000-000000000001")
+        self.assertEqual(employee["em_birthday"], "1990-01-01")
+        self.assertEqual(employee["last_login"], "2025-09-01T09:30:00Z")
+        self.assertEqual(employee["basic_salary"], 52000.0)
+
+    def test_escapes_line_separators(self):
+        rendered = ORJSONRenderer().render({"note": "a\u2028b\u2029c"})
+        self.assertEqual(rendered, b'{"note":"a\\u2028b\\u2029c"}')
+
+    def test_indent_and_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+        self.assertIn(b'\n  "a": 1', ORJSONRenderer().render({"a": 1}, "application/json; indent=4"))
+
+    def test_non_finite_floats_match_stdlib(self):
+        for value in (float("nan"), float("inf"), Decimal("-Infinity")):
+            payload = {"data": [{"ratio": value, "note": None}]}
+            with self.assertRaises(ValueError):
+                JSONRenderer().render(payload)
+            with self.assertRaises(ValueError):
+                ORJSONRenderer().render(payload)
+
+    def test_big_integers_match_stdlib(self):
+        payload = {"data": {"id": 2 ** 64, "items": [-(2 ** 70)]}}
+        self.assertEqual(ORJSONRenderer().render(payload), JSONRenderer().render(payload))
+
+    def test_falls_back_without_orjson(self):
+        with patch("core.renderers.orjson", None):
+            self.assertEqual(ORJSONRenderer().render({"a": 1}), JSONRenderer().render({"a": 1}))
+
+
+class ORJSONParserTests(SimpleTestCase):
+    def parse(self, body, **context):
+        return ORJSONParser().parse(io.BytesIO(body), "application/json", context)
+
+    def test_parses_utf8(self):
+        self.assertEqual(self.parse('{"name": "Zoë"}'.encode()), {"name": "Zoë"})
+
+    def test_rejects_invalid_json(self):
+        with self.assertRaisesMessage(ParseError, "JSON parse error"):
+            self.parse(b'{"a": ')
+        with self.assertRaises(ParseError):
+            self.parse(b'{"a": NaN}')
+
+    def test_falls_back_for_other_encodings_and_without_orjson(self):
+        body = '{"name": "Zoë"}'.encode("utf-16")
+        with patch.object(JSONParser, "parse", return_value={"fallback": True}) as parse:
+            self.assertEqual(self.parse(body, encoding="utf-16"), {"fallback": True})
+            with patch("core.parsers.orjson", None):
+                self.parse(b"{}")
+        self.assertEqual(parse.call_count, 2)
@@ -0,0 +1,134 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from core.routers import ReplicaRouter, ReplicaRoutingMiddleware, use_replicas
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class FakeUser:
+    is_authenticated = True
+    pk = "4f1c8a52-3b54-4d0e-9d59-6a0c0f5cf2a1"
+
+
+@override_settings(READ_REPLICAS=["replica_1"], READ_REPLICAS_ENABLED=True, CACHES=LOCMEM_CACHE)
+class ReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = ReplicaRouter()
+        self.factory = RequestFactory()
+        cache.clear()
+
+    def test_reads_outside_scope_use_primary(self):
+        self.assertEqual(self.router.db_for_read(None), "default")
+
+    def test_write_pins_scope_to_primary(self):
+        with use_replicas():
+            self.assertEqual(self.router.db_for_read(None), "replica_1")
+            self.assertEqual(self.router.db_for_write(None), "default")
+            self.assertEqual(self.router.db_for_read(None), "default")
+
+    @override_settings(READ_REPLICAS=["replica_1", "replica_2", "replica_3"])
+    def test_scope_sticks_to_one_replica(self):
+        with use_replicas():
+            chosen = {self.router.db_for_read(None) for _ in range(50)}
+        self.assertEqual(len(chosen), 1)
+
+    @override_settings(READ_REPLICAS_ENABLED=False)
+    def test_disabled(self):
+        with use_replicas():
+            self.assertEqual(self.router.db_for_read(None), "default")
+
+    def request(self, method="get", user=None, write=False):
+        seen = []
+
+        def view(request):
+            if user is not None:
+                request.user = user
+            if write:
+                self.router.db_for_write(None)
+            seen.append(self.router.db_for_read(None))
+            return HttpResponse()
+
+        headers = {}
+        if user is not None:
+            token = AccessToken()
+            token["user_id"] = user.pk
+            headers["HTTP_AUTHORIZATION"] = f"Bearer {token}"
+        ReplicaRoutingMiddleware(view)(getattr(self.factory, method)("/", **headers))
+        return seen[0]
+
+    def test_safe_requests_read_from_replica(self):
+        self.assertEqual(self.request("get"), "replica_1")
+        self.assertEqual(self.request("post"), "default")
+
+    def test_user_sticks_to_primary_after_write(self):
+        user = FakeUser()
+        self.assertEqual(self.request("get", user), "replica_1")
+        self.request("patch", user)
+        self.assertEqual(self.request("get", user), "default")
+
+        other = FakeUser()
+        other.pk = "0d6c2c4e-9d1f-4a57-8f53-3c1a1e8f7b20"
+        self.assertEqual(self.request("get", other), "replica_1")
+
+    def test_write_during_safe_request_makes_user_sticky(self):
+        user = FakeUser()
+        self.assertEqual(self.request("get", user, write=True), "default")
+        self.assertEqual(self.request("get", user), "default")
+
+    @override_settings(REPLICA_STICKY_SECONDS=0)
+    def test_stickiness_expires(self):
+        user = FakeUser()
+        self.request("post", user)
+        self.assertEqual(self.request("get", user), "replica_1")
+
+
+TWO_SQLITE_SCRIPT = """
+import json, django
+django.setup()
+from django.core.management import call_command
+from django.test.utils import override_settings
+from core.routers import use_replicas
+from users.models import User
+
+call_command("migrate", verbosity=0)
+call_command("migrate", database="replica_1", verbosity=0)
+User.objects.create_user(email="new@gmail.com", password="testpass123")
+lookup = User.objects.filter(email="new@gmail.com")
+
+result = {"primary": lookup.exists()}
+with use_replicas():
+    result["replica"] = lookup.exists()
+    lookup.update(em_phone="123")
+    result["after_write"] = lookup.exists()
+with override_settings(READ_REPLICAS_ENABLED=False), use_replicas():
+    result["disabled"] = lookup.exists()
+print(json.dumps(result))
+"""
+
+
+class TwoSQLiteReplicaTests(SimpleTestCase):
+    """Primary and replica as two SQLite files; the replica never receives the write."""
+
+    def test_routing_against_real_databases(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {
+                **os.environ,
+                "DJANGO_SETTINGS_MODULE": "hrms.settings",
+                "DEBUG": "True",
+                "SQLITE_PATH": os.path.join(tmp, "primary.sqlite3"),
+                "DATABASE_REPLICA_URLS": f"sqlite:///{os.path.join(tmp, 'replica.sqlite3')}",
+            }
+            output = subprocess.run(
+                [sys.executable, "-c", TWO_SQLITE_SCRIPT],
+                cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=True,
+            ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        self.assertEqual(result, {"primary": True, "replica": False, "after_write": True, "disabled": True})
@@ -0,0 +1,25 @@
+import os
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from core.startup import measure_cold_start, reset_connections_after_fork
+
+# Time from a bare interpreter to the response of the first request.
+COLD_START_BUDGET_SECONDS = float(os.environ.get("COLD_START_BUDGET_SECONDS", "3.0"))
+
+
+class ColdStartTests(SimpleTestCase):
+    def test_first_request_within_budget(self):
+        result = measure_cold_start("/health/")
+        self.assertEqual(result["status"], 200)
+        self.assertLess(result["first_request_seconds"], COLD_START_BUDGET_SECONDS)
+
+    def test_optional_dependencies_loaded_lazily(self):
+        self.assertEqual(measure_cold_start("/health/")["lazy_modules_loaded"], [])
+
+
+class ForkSafetyTests(SimpleTestCase):
+    def test_redis_pools_reset_after_fork(self):
+        pool = cache.client.get_client(write=True).connection_pool
+        pool.pid = -1  # pretend the pool was created by the master
+        reset_connections_after_fork()
+        self.assertEqual(pool.pid, os.getpid())
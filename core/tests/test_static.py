@@ -0,0 +1,45 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+from django.core.files.storage import storages
+from django.test import SimpleTestCase, override_settings
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+from core.checks import check_static_manifest
+
+
+class StaticManifestTests(SimpleTestCase):
+    def setUp(self):
+        self.static_root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.static_root, ignore_errors=True)
+        storages._storages.pop("staticfiles", None)
+
+    def write_manifest(self):
+        with open(os.path.join(self.static_root, "staticfiles.json"), "w") as f:
+            json.dump({"version": "1.1", "paths": {"rest_framework/css/default.css": "rest_framework/css/default.abc123.css"}}, f)
+
+    def test_manifest_read_once(self):
+        self.write_manifest()
+        with patch.object(
+            CompressedManifestStaticFilesStorage, "read_manifest",
+            autospec=True, side_effect=CompressedManifestStaticFilesStorage.read_manifest
+        ) as read_manifest:
+            storage = CompressedManifestStaticFilesStorage(location=self.static_root)
+            for _ in range(3):
+                self.assertEqual(storage.url("rest_framework/css/default.css"), "/static/rest_framework/css/default.abc123.css")
+        read_manifest.assert_called_once()
+
+    def test_missing_manifest_is_an_error(self):
+        with override_settings(DEBUG=False, STATIC_ROOT=self.static_root):
+            storages._storages.pop("staticfiles", None)
+            self.assertEqual([m.id for m in check_static_manifest(None)], ["core.E001"])
+
+    def test_loaded_manifest_passes(self):
+        self.write_manifest()
+        with override_settings(DEBUG=False, STATIC_ROOT=self.static_root):
+            storages._storages.pop("staticfiles", None)
+            self.assertEqual(check_static_manifest(None), [])
+            self.assertTrue(storages["staticfiles"].hashed_files)
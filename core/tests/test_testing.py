@@ -0,0 +1,44 @@
+from django.test import TestCase
+from core.testing import QueryCountMixin, capture_queries, normalize_sql
+from department.models import Department
+from designation.models import Designation
+from users.models import User
+
+
+class QueryCountMixinTests(QueryCountMixin, TestCase):
+    def add_users(self, count):
+        for _ in range(count):
+            n = User.objects.count()
+            department = Department.objects.create(dep_name=f"Dept {n}")
+            designation = Designation.objects.create(des_name="Developer", department=department)
+            User.objects.create_user(email=f"user{n}@gmail.com", password="test@123", designation=designation)
+
+    def test_detects_lazy_lookup_per_row(self):
+        def lazy():
+            return [user.department for user in User.objects.all()]
+
+        with self.assertRaises(AssertionError) as ctx:
+            self.assertQueriesDoNotScale(self.add_users, lazy)
+        message = str(ctx.exception)
+        self.assertIn("Query count scales with rows (1 rows: 3, 5 rows: 11, 20 rows: 41)", message)
+        self.assertIn('19x more: SELECT "designation_designation"', message)
+
+    def test_passes_with_select_related(self):
+        def joined():
+            return [user.department for user in User.objects.select_related("designation__department")]
+
+        self.assertEqual(self.assertQueriesDoNotScale(self.add_users, joined, max_queries=1), [1, 1, 1])
+
+    def test_max_queries_lists_sql(self):
+        with self.assertRaises(AssertionError) as ctx:
+            with self.assertMaxQueries(1):
+                User.objects.count()
+                User.objects.exists()
+        self.assertIn("2 queries executed, expected at most 1", str(ctx.exception))
+        self.assertIn("  2. SELECT 1 AS", str(ctx.exception))
+
+    def test_capture_queries(self):
+        result, queries = capture_queries(User.objects.count)
+        self.assertEqual(result, 0)
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(normalize_sql("WHERE id = 42 AND email = 'a''b'"), "WHERE id = ? AND email = ?")
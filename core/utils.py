@@ -1,8 +1,9 @@
 import random
 import logging
-from threading import Thread
+from datetime import date
+from threading import Lock, Thread
 from smtplib import SMTPException
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Tuple
 
 from django.core.mail import send_mail
 from django.conf import settings
@@ -27,6 +28,21 @@ def generate_otp(length: int = 6) -> str:
     return str(random.randint(start, end))
 
 
+# ----------------------------
+# Month Bounds
+# ----------------------------
+def month_bounds(month: int, year: int) -> Tuple[date, date]:
+    """
+    Return the first day of the month and the first day of the next one,
+    for half-open ``[start, end)`` date range filters.
+    """
+    if not 1 <= month <= 12:
+        raise ValueError("Month must be between 1 and 12.")
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start, end
+
+
 # ----------------------------
 # Synchronous OTP email sender
 # ----------------------------
@@ -54,15 +70,42 @@ def _send_otp_email_sync(to_email: str, otp: str, validity_minutes: int = 10) ->
 # ----------------------------
 # Asynchronous OTP email sender
 # ----------------------------
+_pending_emails = 0
+_pending_emails_lock = Lock()
+
+
+def pending_email_count() -> int:
+    """Number of emails queued on background threads and not yet sent."""
+    return _pending_emails
+
+
+def _track_pending(delta: int) -> None:
+    global _pending_emails
+    with _pending_emails_lock:
+        _pending_emails += delta
+
+
+def _send_otp_email_tracked(to_email: str, otp: str, validity_minutes: int) -> None:
+    try:
+        _send_otp_email_sync(to_email, otp, validity_minutes)
+    finally:
+        _track_pending(-1)
+
+
 def send_otp_email(to_email: str, otp: str, validity_minutes: int = 10) -> None:
     """
     Send OTP email asynchronously using a background thread.
     """
-    Thread(
-        target=_send_otp_email_sync,
-        args=(to_email, otp, validity_minutes),
-        daemon=True
-    ).start()
+    _track_pending(1)
+    try:
+        Thread(
+            target=_send_otp_email_tracked,
+            args=(to_email, otp, validity_minutes),
+            daemon=True
+        ).start()
+    except Exception:
+        _track_pending(-1)
+        raise
 
 
 # ----------------------------
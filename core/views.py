@@ -1,3 +1,65 @@
-from django.shortcuts import render
+import hmac
 
-# Create your views here.
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+import logging
+
+from core.http import serve_media
+from core.media import IMMUTABLE_CACHE_CONTROL, PROFILE_IMAGE_PREFIX, can_access_media, normalize_media_name
+from core.metrics import render_prometheus
+from core.utils import api_response
+from users.throttles import GeneralThrottle
+
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------
+# Protected Media
+# ----------------------------
+class ProtectedMediaView(APIView):
+    """
+    Serve an uploaded file after checking that the requester may see it.
+    The transfer itself is handed to the front proxy or to ``sendfile``
+    (see ``core.http.serve_media``).
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [GeneralThrottle]
+
+    def get(self, request, name, *args, **kwargs):
+        name = normalize_media_name(name)
+        if name is None or not can_access_media(request.user, name):
+            return self.not_found()
+
+        # Profile image variants are named by content hash and never change.
+        cache_control = IMMUTABLE_CACHE_CONTROL if name.startswith(PROFILE_IMAGE_PREFIX) else "private, no-cache"
+        try:
+            return serve_media(request, name, cache_control=cache_control)
+        except Http404:
+            return self.not_found()
+
+    def not_found(self):
+        return api_response(status_str="error", message="File not found", status_code=status.HTTP_404_NOT_FOUND)
+
+
+# ----------------------------
+# Metrics
+# ----------------------------
+class MetricsView(APIView):
+    """Prometheus scrape endpoint, guarded by ``METRICS_TOKEN``."""
+    authentication_classes = []
+    permission_classes = []
+    throttle_classes = []
+
+    def get(self, request, *args, **kwargs):
+        token = getattr(settings, "METRICS_TOKEN", "")
+        if token:
+            supplied = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+            allowed = hmac.compare_digest(supplied.encode(), token.encode())
+        else:
+            allowed = settings.DEBUG
+        if not allowed:
+            return api_response(status_str="error", message="Not found", status_code=status.HTTP_404_NOT_FOUND)
+        return HttpResponse(render_prometheus(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,33 @@
+"""
+Gunicorn configuration (loaded automatically from the working directory).
+
+With ``preload_app`` Django is set up once in the master and workers are
+forked from it, so scale-ups and restarts don't pay settings, app registry
+and admin imports per worker. Connections opened during preloading are
+closed before forking and inherited pools are reset in each worker.
+"""
+import os
+
+# Imported as a module: gunicorn would read a top-level ``config`` name as
+# its own setting.
+import decouple
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+# hrms.settings splits DB_MAX_CONNECTIONS across these workers' pools.
+workers = decouple.config("WEB_CONCURRENCY", default=2, cast=int)
+preload_app = decouple.config("GUNICORN_PRELOAD", default=True, cast=bool)
+timeout = decouple.config("GUNICORN_TIMEOUT", default=30, cast=int)
+accesslog = "-"
+errorlog = "-"
+
+
+def pre_fork(server, worker):
+    if preload_app:
+        from core.startup import close_connections_before_fork
+        close_connections_before_fork()
+
+
+def post_fork(server, worker):
+    if preload_app:
+        from core.startup import reset_connections_after_fork
+        reset_connections_after_fork()
@@ -1,7 +1,7 @@
 from pathlib import Path
 from datetime import timedelta
 from decouple import config, Csv
-import dj_database_url
+from core.db import database_config
 
 # ----------------------------
 # BASE DIRECTORY
@@ -35,7 +35,7 @@ TEST = {
 # AUTHENTICATION BACKENDS
 # ----------------------------
 AUTHENTICATION_BACKENDS = [
-    "django.contrib.auth.backends.ModelBackend",
+    "users.backends.EmailBackend",
 ]
 
 # ----------------------------
@@ -68,18 +68,24 @@ INSTALLED_APPS = [
     'users',
     'department',
     'designation',
+    'loan',
+    'payroll',
+    'project',
+    'uploads',
 ]
 
 # ----------------------------
 # MIDDLEWARE
 # ----------------------------
 MIDDLEWARE = [
+    'core.metrics.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.routers.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -114,11 +120,41 @@ TEMPLATES = [
 DATABASE_URL = config("DATABASE_URL", default=None)
 CONN_MAX_AGE = config("CONN_MAX_AGE", default=50, cast=int)
 
+# Connection pool (PostgreSQL only; replaces CONN_MAX_AGE when enabled).
+# Each worker process keeps DB_POOL_SIZE connections and opens at most
+# DB_POOL_MAX_OVERFLOW more under load. This is the single source of
+# truth for sizing: DB_MAX_CONNECTIONS is what one app instance may hold,
+# split across the WEB_CONCURRENCY gunicorn workers (same variable and
+# default as gunicorn.conf.py). A sync worker needs one connection for its
+# request plus one for background threads (health probes, profile images);
+# the rest of its share is overflow. Postgres must allow DB_MAX_CONNECTIONS
+# times the instance count in railway.json (numReplicas, per region).
+WEB_CONCURRENCY = config("WEB_CONCURRENCY", default=2, cast=int)
+DB_MAX_CONNECTIONS = config("DB_MAX_CONNECTIONS", default=10, cast=int)
+DB_POOL_ENABLED = config("DB_POOL_ENABLED", default=True, cast=bool)
+DB_POOL_SIZE = config("DB_POOL_SIZE", default=2, cast=int)
+DB_POOL_MAX_OVERFLOW = config(
+    "DB_POOL_MAX_OVERFLOW", default=max(DB_MAX_CONNECTIONS // WEB_CONCURRENCY - DB_POOL_SIZE, 0), cast=int
+)
+DB_POOL_TIMEOUT = config("DB_POOL_TIMEOUT", default=10, cast=float)
+DB_POOL_MAX_IDLE = config("DB_POOL_MAX_IDLE", default=300, cast=float)
+DB_POOL_MAX_LIFETIME = config("DB_POOL_MAX_LIFETIME", default=1800, cast=float)
+
+DB_CONFIG_KWARGS = {
+    "conn_max_age": CONN_MAX_AGE,
+    "pool": DB_POOL_ENABLED,
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_POOL_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "max_idle": DB_POOL_MAX_IDLE,
+    "max_lifetime": DB_POOL_MAX_LIFETIME,
+}
+
 if DEBUG:
     DATABASES = {
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
-            "NAME": BASE_DIR / "db.sqlite3",
+            "NAME": config("SQLITE_PATH", default=str(BASE_DIR / "db.sqlite3")),
         }
     }
 else:
@@ -126,21 +162,34 @@ else:
         raise ValueError("DATABASE_URL environment variable is not set!")
     
     DATABASES = {
-        "default": dj_database_url.parse(
-            DATABASE_URL,
-            conn_max_age=CONN_MAX_AGE,
-            conn_health_checks=True
-        )
+        "default": database_config(DATABASE_URL, **DB_CONFIG_KWARGS)
+    }
+
+# Read replicas (comma-separated URLs; sqlite:/// files work locally).
+# Safe-method requests read from one replica, picked at random per
+# request and kept for all its reads, unless the user wrote within the
+# last REPLICA_STICKY_SECONDS (see core.routers).
+DATABASE_REPLICA_URLS = config("DATABASE_REPLICA_URLS", default="", cast=Csv())
+for index, replica_url in enumerate(DATABASE_REPLICA_URLS, start=1):
+    DATABASES[f"replica_{index}"] = {
+        **database_config(replica_url, **DB_CONFIG_KWARGS),
+        "TEST": {"MIRROR": "default"},
     }
 
+READ_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+READ_REPLICAS_ENABLED = config("READ_REPLICAS_ENABLED", default=True, cast=bool)
+REPLICA_STICKY_SECONDS = config("REPLICA_STICKY_SECONDS", default=5, cast=int)
+DATABASE_ROUTERS = ["core.routers.ReplicaRouter"]
+
 # ----------------------------
 # PASSWORD VALIDATION
 # ----------------------------
+# Drop-in replacements for Django's validators (see users/validators.py).
 AUTH_PASSWORD_VALIDATORS = [
-    {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
-    {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator', 'OPTIONS': {'min_length': 8}},
-    {'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator'},
-    {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
+    {'NAME': 'users.validators.UserAttributeSimilarityValidator'},
+    {'NAME': 'users.validators.MinimumLengthValidator', 'OPTIONS': {'min_length': 8}},
+    {'NAME': 'users.validators.CommonPasswordValidator'},
+    {'NAME': 'users.validators.NumericPasswordValidator'},
 ]
 
 # ----------------------------
@@ -153,6 +202,16 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    # orjson when installed, stdlib json otherwise (see core/renderers.py).
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "core.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_THROTTLE_CLASSES": (
         "users.throttles.OTPThrottle",
         "users.throttles.LoginThrottle",
@@ -169,6 +228,9 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=config("REFRESH_TOKEN_EXPIRY", default=7, cast=int)),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
+    # Tokens carry a hash of the password, so changing it revokes them all.
+    "CHECK_REVOKE_TOKEN": True,
+    "TOKEN_REFRESH_SERIALIZER": "users.serializers.SessionTokenRefreshSerializer",
 }
 
 # ----------------------------
@@ -178,12 +240,14 @@ REDIS_URL = config("REDIS_URL", default="redis://127.0.0.1:6379/1")
 
 CACHES = {
     "default": {
-        "BACKEND": "django_redis.cache.RedisCache",
+        "BACKEND": "core.cache.InstrumentedRedisCache",
         "LOCATION": REDIS_URL,
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
             "CONNECTION_POOL_KWARGS": {"ssl_cert_reqs": None},
             "IGNORE_EXCEPTIONS": True,
+            "SOCKET_CONNECT_TIMEOUT": config("REDIS_SOCKET_CONNECT_TIMEOUT", default=1, cast=float),
+            "SOCKET_TIMEOUT": config("REDIS_SOCKET_TIMEOUT", default=1, cast=float),
             "decode_responses": True,
         },
     }
@@ -205,10 +269,25 @@ USE_TZ = True
 # ----------------------------
 STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / "staticfiles"
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# collectstatic fingerprints every file (admin and rest_framework included)
+# and writes .br/.gz siblings; WhiteNoise serves the hashed names with
+# far-future immutable headers. Brotli output needs the `brotli` package.
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
+}
+WHITENOISE_KEEP_ONLY_HASHED_FILES = True
+WHITENOISE_MAX_AGE = 60 * 60
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / "media"
+# Who sends protected media: "django" (FileResponse/sendfile), "nginx"
+# (X-Accel-Redirect to an internal location) or "sendfile" (X-Sendfile).
+MEDIA_SERVE_BACKEND = config("MEDIA_SERVE_BACKEND", default="django")
+MEDIA_ACCEL_REDIRECT_PREFIX = config("MEDIA_ACCEL_REDIRECT_PREFIX", default="/protected-media/")
+UPLOAD_CHUNK_MAX_SIZE = config("UPLOAD_CHUNK_MAX_SIZE", default=5 * 1024 * 1024, cast=int)
+UPLOAD_MAX_SIZE = config("UPLOAD_MAX_SIZE", default=500 * 1024 * 1024, cast=int)
+PROFILE_IMAGE_MAX_UPLOAD_SIZE = config("PROFILE_IMAGE_MAX_UPLOAD_SIZE", default=10 * 1024 * 1024, cast=int)
 
 # ----------------------------
 # EMAIL SETTINGS (SendGrid)
@@ -217,6 +296,33 @@ EMAIL_BACKEND = config("EMAIL_BACKEND", default="core.emails.SendGridBackend")
 SENDGRID_API_KEY = config("SENDGRID_API_KEY")
 EMAIL_FROM = config("EMAIL_FROM")
 
+# ----------------------------
+# HEALTH CHECKS
+# ----------------------------
+HEALTH_PROBE_TIMEOUT = config("HEALTH_PROBE_TIMEOUT", default=0.5, cast=float)
+HEALTH_CACHE_SECONDS = config("HEALTH_CACHE_SECONDS", default=1.0, cast=float)
+HEALTH_MAIL_QUEUE_MAX = config("HEALTH_MAIL_QUEUE_MAX", default=100, cast=int)
+
+# ----------------------------
+# METRICS
+# ----------------------------
+METRICS_ENABLED = config("METRICS_ENABLED", default=True, cast=bool)
+METRICS_SLOW_REQUEST_MS = config("METRICS_SLOW_REQUEST_MS", default=500, cast=int)
+# Bearer token required to scrape /metrics; without one it is only served when DEBUG.
+METRICS_TOKEN = config("METRICS_TOKEN", default="")
+
+# ----------------------------
+# ACCOUNT CLEANUP (sweep_users)
+# ----------------------------
+UNVERIFIED_USER_MAX_AGE_DAYS = config("UNVERIFIED_USER_MAX_AGE_DAYS", default=7, cast=int)
+USER_SWEEP_BATCH_SIZE = config("USER_SWEEP_BATCH_SIZE", default=500, cast=int)
+USER_SWEEP_MAX_BATCH_MS = config("USER_SWEEP_MAX_BATCH_MS", default=200, cast=int)
+
+# ----------------------------
+# PAYROLL
+# ----------------------------
+PAYROLL_WORKERS = config("PAYROLL_WORKERS", default=1, cast=int)
+
 # ----------------------------
 # DEFAULT PK FIELD
 # ----------------------------
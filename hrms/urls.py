@@ -1,9 +1,18 @@
 from django.contrib import admin
+from django.conf import settings
 from django.urls import path, include
-from .views import HealthCheckAPIView
+from core.views import MetricsView, ProtectedMediaView
+from .views import HealthCheckAPIView, ReadinessCheckAPIView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path("health/", HealthCheckAPIView.as_view(), name="health-check"),
+    path("health/live/", HealthCheckAPIView.as_view(), name="health-live"),
+    path("health/ready/", ReadinessCheckAPIView.as_view(), name="health-ready"),
+    path("metrics", MetricsView.as_view(), name="metrics"),
     path("api/v1/accounts/", include(("users.urls", "users"), namespace="accounts")),  
+    path("api/v1/loans/", include(("loan.urls", "loan"), namespace="loans")),
+    path("api/v1/payroll/", include(("payroll.urls", "payroll"), namespace="payroll")),
+    path("api/v1/uploads/", include(("uploads.urls", "uploads"), namespace="uploads")),
+    path(f"{settings.MEDIA_URL.strip('/')}/<path:name>", ProtectedMediaView.as_view(), name="protected-media"),
 ]
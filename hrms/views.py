@@ -1,20 +1,29 @@
+import time
+from datetime import datetime, timezone as dt_timezone
 from rest_framework.views import APIView
 from rest_framework import status
 from rest_framework.permissions import AllowAny
-from django.utils import timezone
+from core.health import STATUS_FAIL, readiness
 from core.utils import api_response
 
+PROCESS_STARTED_AT = time.time()
+
 
 class HealthCheckAPIView(APIView):
     """
-    Health check endpoint for monitoring service status.
+    Liveness probe: answers as long as the process can serve requests.
+    It never touches dependencies, so a database outage doesn't get
+    healthy workers restarted.
     """
     permission_classes = [AllowAny]
+    authentication_classes = []
+    throttle_classes = []
 
     def get(self, request, *args, **kwargs):
         response = {
             "service": "HRMS API",
-            "uptime": timezone.now().isoformat(),
+            "started_at": datetime.fromtimestamp(PROCESS_STARTED_AT, dt_timezone.utc).isoformat(),
+            "uptime_seconds": round(time.time() - PROCESS_STARTED_AT, 1),
             "endpoint": "https://human-resource-management.up.railway.app/health"
         }
         return api_response(
@@ -22,3 +31,24 @@ class HealthCheckAPIView(APIView):
             data=response,
             status_code=status.HTTP_200_OK 
         )
+
+
+class ReadinessCheckAPIView(APIView):
+    """
+    Readiness probe: database, Redis and mail queue checked in parallel
+    with per-dependency latency. Returns 503 when the database is
+    unreachable; Redis or mail problems only report ``degraded``.
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    throttle_classes = []
+
+    def get(self, request, *args, **kwargs):
+        result = readiness()
+        failed = result["status"] == STATUS_FAIL
+        return api_response(
+            status_str="error" if failed else "success",
+            message="Service is not ready" if failed else f"Service is ready ({result['status']})",
+            data=result,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE if failed else status.HTTP_200_OK
+        )
@@ -0,0 +1,28 @@
+from django.contrib import admin, messages
+from .models import Loan, LoanInstallment
+from .services import approve_loan
+
+
+# ----------------------------
+# Loan Admin
+# ----------------------------
+class LoanAdmin(admin.ModelAdmin):
+    list_display = ("loan_number", "employee", "amount", "installment", "install_period", "status")
+    list_filter = ("status",)
+    search_fields = ("loan_number", "employee__email")
+    actions = ["approve_selected"]
+
+    @admin.action(description="Approve and generate installment schedule")
+    def approve_selected(self, request, queryset):
+        for loan in queryset:
+            try:
+                approve_loan(loan)
+            except ValueError as e:
+                self.message_user(request, f"{loan.loan_number}: {e}", level=messages.WARNING)
+
+
+# ----------------------------
+# Register Models in Admin
+# ----------------------------
+admin.site.register(Loan, LoanAdmin)
+admin.site.register(LoanInstallment)
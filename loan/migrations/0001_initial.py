@@ -0,0 +1,52 @@
+# Generated by Django 5.2.6 on 2026-10-19 08:03
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Loan',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('loan_number', models.CharField(max_length=64, unique=True)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('interest_percentage', models.DecimalField(decimal_places=2, default=0, max_digits=5)),
+                ('total_amount', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True)),
+                ('installment', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True)),
+                ('install_period', models.PositiveSmallIntegerField(default=1)),
+                ('loan_details', models.TextField(blank=True, null=True)),
+                ('approve_date', models.DateField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('Pause', 'Pause'), ('Active', 'Active'), ('Closed', 'Closed')], default='Pause', max_length=10)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='loans', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LoanInstallment',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('install_no', models.PositiveSmallIntegerField()),
+                ('due_date', models.DateField()),
+                ('install_amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('pay_amount', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True)),
+                ('paid_date', models.DateField(blank=True, null=True)),
+                ('notes', models.TextField(blank=True, null=True)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='loan_installments', to=settings.AUTH_USER_MODEL)),
+                ('loan', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='installments', to='loan.loan')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['due_date'], name='loan_loanin_due_dat_6c0e73_idx')],
+                'unique_together': {('loan', 'install_no')},
+            },
+        ),
+    ]
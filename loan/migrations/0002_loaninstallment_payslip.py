@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-19 08:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('loan', '0001_initial'),
+        ('payroll', '0002_attendancerollup_version_empsalary_version_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='loaninstallment',
+            name='payslip',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='loan_installments', to='payroll.paysalary'),
+        ),
+    ]
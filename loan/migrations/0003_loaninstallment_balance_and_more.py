@@ -0,0 +1,39 @@
+# Generated by Django 5.2.6 on 2026-10-19 08:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('loan', '0002_loaninstallment_payslip'),
+        ('payroll', '0002_attendancerollup_version_empsalary_version_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='loaninstallment',
+            name='balance',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name='loaninstallment',
+            name='interest_amount',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name='loaninstallment',
+            name='principal_amount',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.AddIndex(
+            model_name='loaninstallment',
+            index=models.Index(fields=['loan', 'paid_date'], name='loan_loanin_loan_id_859810_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='loaninstallment',
+            index=models.Index(fields=['employee', 'due_date'], name='loan_loanin_employe_96fc29_idx'),
+        ),
+    ]
@@ -0,0 +1,83 @@
+import uuid
+from django.conf import settings
+from django.db import models
+from core.constants import LOAN_STATUS_CHOICES
+
+
+# ----------------------------
+# Loan Model
+# ----------------------------
+class Loan(models.Model):
+    """
+    Loan granted to an employee and repaid through monthly
+    installments deducted during the payroll run.
+
+    The full amortization schedule is generated once at approval (see
+    ``loan.services.approve_loan``); the outstanding balance is derived
+    from the unpaid installments rather than kept as a running total.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    employee = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="loans"
+    )
+    loan_number = models.CharField(max_length=64, unique=True)
+    amount = models.DecimalField(max_digits=12, decimal_places=2)
+    interest_percentage = models.DecimalField(max_digits=5, decimal_places=2, default=0)
+    total_amount = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
+    installment = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
+    install_period = models.PositiveSmallIntegerField(default=1)
+    loan_details = models.TextField(blank=True, null=True)
+    approve_date = models.DateField(blank=True, null=True)
+    status = models.CharField(max_length=10, choices=LOAN_STATUS_CHOICES, default="Pause")
+
+    def __str__(self):
+        return f"{self.employee} - Loan #{self.loan_number}"
+
+
+# ----------------------------
+# Loan Installment Model
+# ----------------------------
+class LoanInstallment(models.Model):
+    """
+    A single monthly installment of a loan, due on ``due_date``.
+    ``balance`` is the principal still owed after this installment and
+    ``payslip`` links the payslip the installment was deducted in.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    loan = models.ForeignKey(Loan, on_delete=models.CASCADE, related_name="installments")
+    employee = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="loan_installments"
+    )
+    install_no = models.PositiveSmallIntegerField()
+    due_date = models.DateField()
+    principal_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    interest_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    install_amount = models.DecimalField(max_digits=12, decimal_places=2)
+    balance = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    pay_amount = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
+    paid_date = models.DateField(blank=True, null=True)
+    payslip = models.ForeignKey(
+        "payroll.PaySalary",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="loan_installments"
+    )
+    notes = models.TextField(blank=True, null=True)
+
+    class Meta:
+        unique_together = ("loan", "install_no")
+        indexes = [
+            models.Index(fields=["due_date"]),
+            models.Index(fields=["loan", "paid_date"]),
+            models.Index(fields=["employee", "due_date"]),
+        ]
+
+    def __str__(self):
+        return f"Installment #{self.install_no} for Loan #{self.loan.loan_number}"
@@ -0,0 +1,39 @@
+from rest_framework import serializers
+from .models import Loan, LoanInstallment
+
+
+# ----------------------------
+# Installment Serializer
+# ----------------------------
+class LoanInstallmentSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = LoanInstallment
+        fields = [
+            "install_no", "due_date", "principal_amount", "interest_amount",
+            "install_amount", "balance", "paid_date"
+        ]
+
+
+# ----------------------------
+# Amortization Table Serializer
+# ----------------------------
+class LoanScheduleSerializer(serializers.ModelSerializer):
+    outstanding = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+    installments = LoanInstallmentSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Loan
+        fields = [
+            "id", "loan_number", "amount", "interest_percentage", "total_amount",
+            "installment", "install_period", "approve_date", "status",
+            "outstanding", "installments"
+        ]
+
+
+# ----------------------------
+# Monthly Deduction Serializer
+# ----------------------------
+class MonthlyDeductionSerializer(serializers.Serializer):
+    employee_id = serializers.UUIDField()
+    total = serializers.DecimalField(max_digits=12, decimal_places=2)
+    installments = serializers.IntegerField()
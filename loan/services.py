@@ -0,0 +1,115 @@
+import calendar
+import logging
+from datetime import date
+from decimal import Decimal, ROUND_HALF_UP
+from typing import List, Optional
+
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from core.utils import month_bounds
+from .models import Loan, LoanInstallment
+
+logger = logging.getLogger(__name__)
+
+ZERO = Decimal("0")
+CENT = Decimal("0.01")
+APPROVAL_FIELDS = frozenset({"approve_date", "status", "installment", "total_amount"})
+
+
+def _add_months(day: date, months: int) -> date:
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+# ----------------------------
+# Amortization Schedule
+# ----------------------------
+def build_schedule(amount: Decimal, annual_rate: Decimal, periods: int, first_due: date) -> List[dict]:
+    """
+    Equal-installment amortization schedule. Interest accrues monthly on the
+    remaining principal; the last installment absorbs rounding so the
+    balance ends at exactly zero.
+    """
+    if periods < 1:
+        raise ValueError("Installment period must be at least one month.")
+
+    rate = Decimal(annual_rate or 0) / Decimal(1200)
+    if rate:
+        factor = (1 + rate) ** periods
+        emi = (amount * rate * factor / (factor - 1)).quantize(CENT, ROUND_HALF_UP)
+    else:
+        emi = (amount / periods).quantize(CENT, ROUND_HALF_UP)
+
+    schedule = []
+    balance = amount
+    for install_no in range(1, periods + 1):
+        interest = (balance * rate).quantize(CENT, ROUND_HALF_UP)
+        principal = balance if install_no == periods else min(emi - interest, balance)
+        balance -= principal
+        schedule.append({
+            "install_no": install_no,
+            "due_date": _add_months(first_due, install_no - 1),
+            "principal_amount": principal,
+            "interest_amount": interest,
+            "install_amount": principal + interest,
+            "balance": balance,
+        })
+    return schedule
+
+
+def approve_loan(loan: Loan, approve_date: Optional[date] = None) -> Loan:
+    """
+    Approve a loan and bulk-insert its whole installment schedule. The first
+    installment falls due one month after approval.
+    """
+    if loan.installments.exists():
+        raise ValueError("Loan already has an installment schedule.")
+
+    approve_date = approve_date or timezone.localdate()
+    schedule = build_schedule(
+        loan.amount, loan.interest_percentage, loan.install_period, _add_months(approve_date, 1)
+    )
+
+    with transaction.atomic():
+        LoanInstallment.objects.bulk_create([
+            LoanInstallment(loan=loan, employee_id=loan.employee_id, **row) for row in schedule
+        ])
+        loan.approve_date = approve_date
+        loan.status = "Active"
+        loan.installment = schedule[0]["install_amount"]
+        loan.total_amount = sum((row["install_amount"] for row in schedule), ZERO)
+        loan.save(update_fields=APPROVAL_FIELDS)
+
+    logger.info(f"Loan {loan.loan_number} approved with {len(schedule)} installments")
+    return loan
+
+
+# ----------------------------
+# Balances & Deductions
+# ----------------------------
+def outstanding_balance(loan: Loan) -> Decimal:
+    """Sum of unpaid installments, served by the (loan, paid_date) index."""
+    total = loan.installments.filter(paid_date__isnull=True).aggregate(total=Sum("install_amount"))["total"]
+    return total or ZERO
+
+
+def due_installments(start: date, end: date):
+    """Installments of active loans falling due in ``[start, end)``."""
+    return LoanInstallment.objects.filter(due_date__gte=start, due_date__lt=end, loan__status="Active")
+
+
+def monthly_deductions(month: int, year: int):
+    """
+    Loan deduction per employee for one month, as a single aggregate query
+    yielding ``{"employee_id", "total", "installments"}`` rows.
+    """
+    start, end = month_bounds(month, year)
+    return (
+        due_installments(start, end)
+        .values("employee_id")
+        .annotate(total=Sum("install_amount"), installments=Count("id"))
+        .order_by("employee_id")
+    )
@@ -0,0 +1,62 @@
+from datetime import date
+from decimal import Decimal
+from django.test import TestCase
+from users.models import User
+from loan.models import Loan
+from loan.services import build_schedule, approve_loan, outstanding_balance, monthly_deductions
+
+
+class BuildScheduleTests(TestCase):
+    def test_interest_free_schedule(self):
+        schedule = build_schedule(Decimal("1000.00"), Decimal("0"), 3, date(2025, 1, 31))
+        self.assertEqual([row["install_amount"] for row in schedule],
+                         [Decimal("333.33"), Decimal("333.33"), Decimal("333.34")])
+        self.assertEqual([row["due_date"] for row in schedule],
+                         [date(2025, 1, 31), date(2025, 2, 28), date(2025, 3, 31)])
+        self.assertEqual(schedule[-1]["balance"], Decimal("0.00"))
+
+    def test_interest_bearing_schedule_clears_balance(self):
+        schedule = build_schedule(Decimal("12000.00"), Decimal("12.00"), 12, date(2025, 1, 1))
+        self.assertEqual(schedule[0]["interest_amount"], Decimal("120.00"))
+        self.assertEqual(schedule[0]["install_amount"], Decimal("1066.19"))
+        self.assertEqual(sum(row["principal_amount"] for row in schedule), Decimal("12000.00"))
+        self.assertEqual(schedule[-1]["balance"], Decimal("0.00"))
+
+    def test_invalid_period(self):
+        with self.assertRaises(ValueError):
+            build_schedule(Decimal("100.00"), Decimal("0"), 0, date(2025, 1, 1))
+
+
+class ApproveLoanTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="test@gmail.com", password="test@123")
+        self.loan = Loan.objects.create(
+            employee=self.user, loan_number="L-1", amount=Decimal("6000.00"), install_period=6
+        )
+
+    def test_approval_generates_schedule(self):
+        approve_loan(self.loan, approve_date=date(2025, 8, 15))
+        self.assertEqual(self.loan.status, "Active")
+        self.assertEqual(self.loan.installments.count(), 6)
+        self.assertEqual(self.loan.installment, Decimal("1000.00"))
+        self.assertEqual(self.loan.installments.order_by("install_no").first().due_date, date(2025, 9, 15))
+        self.assertEqual(outstanding_balance(self.loan), Decimal("6000.00"))
+
+        self.loan.installments.filter(install_no=1).update(paid_date=date(2025, 9, 30))
+        self.assertEqual(outstanding_balance(self.loan), Decimal("5000.00"))
+
+    def test_approval_is_not_repeatable(self):
+        approve_loan(self.loan)
+        with self.assertRaises(ValueError):
+            approve_loan(self.loan)
+
+    def test_monthly_deductions_single_query(self):
+        approve_loan(self.loan, approve_date=date(2025, 8, 15))
+        other = User.objects.create_user(email="other@gmail.com", password="test@123")
+        approve_loan(
+            Loan.objects.create(employee=other, loan_number="L-2", amount=Decimal("300.00"), install_period=3),
+            approve_date=date(2025, 8, 1)
+        )
+        with self.assertNumQueries(1):
+            rows = {row["employee_id"]: row["total"] for row in monthly_deductions(9, 2025)}
+        self.assertEqual(rows, {self.user.pk: Decimal("1000.00"), other.pk: Decimal("100.00")})
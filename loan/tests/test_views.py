@@ -0,0 +1,84 @@
+from datetime import date
+from decimal import Decimal
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from core.testing import QueryCountMixin
+from users.models import User
+from loan.models import Loan
+from loan.services import approve_loan
+
+
+class LoanViewTests(QueryCountMixin, APITestCase):
+    def setUp(self):
+        self.employee = User.objects.create_user(email="emp@gmail.com", password="test@123", is_verified=True)
+        self.other = User.objects.create_user(email="other@gmail.com", password="test@123", is_verified=True)
+        self.admin = User.objects.create_admin(email="admin@gmail.com", password="test@123", is_verified=True)
+        self.loan = Loan.objects.create(
+            employee=self.employee, loan_number="L-1", amount=Decimal("3000.00"), install_period=3
+        )
+        approve_loan(self.loan, approve_date=date(2025, 8, 1))
+        self.schedule_url = reverse("loans:employee-schedule", args=[self.employee.pk])
+        self.deductions_url = reverse("loans:monthly-deductions")
+
+    def authenticate(self, user):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
+
+    def test_employee_reads_own_schedule(self):
+        self.authenticate(self.employee)
+        response = self.client.get(self.schedule_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        loan = response.data["data"][0]
+        self.assertEqual(len(loan["installments"]), 3)
+        self.assertEqual(Decimal(loan["outstanding"]), Decimal("3000.00"))
+
+    def test_employee_cannot_read_others_schedule(self):
+        self.authenticate(self.other)
+        response = self.client.get(self.schedule_url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_admin_reads_monthly_deductions(self):
+        self.authenticate(self.admin)
+        response = self.client.get(self.deductions_url, {"month": 9, "year": 2025})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Decimal(response.data["data"][0]["total"]), Decimal("1000.00"))
+
+    def test_monthly_deductions_requires_admin(self):
+        self.authenticate(self.employee)
+        response = self.client.get(self.deductions_url, {"month": 9, "year": 2025})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_monthly_deductions_invalid_params(self):
+        self.authenticate(self.admin)
+        response = self.client.get(self.deductions_url, {"month": 13, "year": 2025})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_schedule_queries_do_not_scale_with_loans(self):
+        self.authenticate(self.employee)
+
+        def add_loans(count):
+            for _ in range(count):
+                loan = Loan.objects.create(
+                    employee=self.employee, loan_number=f"L-{Loan.objects.count() + 1}",
+                    amount=Decimal("1200.00"), install_period=12
+                )
+                approve_loan(loan, approve_date=date(2025, 8, 1))
+
+        self.assertQueriesDoNotScale(add_loans, lambda: self.client.get(self.schedule_url), max_queries=3)
+
+    def test_monthly_deductions_queries_do_not_scale_with_employees(self):
+        self.authenticate(self.admin)
+
+        def add_employees(count):
+            for _ in range(count):
+                n = User.objects.count()
+                employee = User.objects.create_user(email=f"emp{n}@gmail.com", password="test@123")
+                loan = Loan.objects.create(
+                    employee=employee, loan_number=f"L-{n}", amount=Decimal("300.00"), install_period=3
+                )
+                approve_loan(loan, approve_date=date(2025, 8, 1))
+
+        self.assertQueriesDoNotScale(
+            add_employees, lambda: self.client.get(self.deductions_url, {"month": 9, "year": 2025}), max_queries=2
+        )
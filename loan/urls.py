@@ -0,0 +1,12 @@
+from django.urls import path
+from .views import EmployeeLoanScheduleView, MonthlyDeductionsView
+
+app_name = "loans"
+
+urlpatterns = [
+    # ----------------------------
+    # Amortization & Deductions
+    # ----------------------------
+    path("employees/<uuid:employee_id>/schedule/", EmployeeLoanScheduleView.as_view(), name="employee-schedule"),
+    path("deductions/", MonthlyDeductionsView.as_view(), name="monthly-deductions"),
+]
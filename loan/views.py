@@ -0,0 +1,80 @@
+from decimal import Decimal
+from django.db.models import DecimalField, Prefetch, Q, Sum, Value
+from django.db.models.functions import Coalesce
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+import logging
+
+from core.permissions import IsAdminRole, is_admin
+from core.utils import api_response
+from users.throttles import GeneralThrottle
+from .models import Loan, LoanInstallment
+from .serializers import LoanScheduleSerializer, MonthlyDeductionSerializer
+from .services import monthly_deductions
+
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------
+# Employee Amortization Table
+# ----------------------------
+class EmployeeLoanScheduleView(APIView):
+    """
+    Amortization tables of every loan of one employee. Employees may read
+    their own; admins may read anyone's.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [GeneralThrottle]
+
+    def get(self, request, employee_id, *args, **kwargs):
+        if str(request.user.pk) != str(employee_id) and not is_admin(request.user):
+            return api_response(
+                status_str="error",
+                message="You do not have permission to view this schedule",
+                status_code=status.HTTP_403_FORBIDDEN
+            )
+
+        loans = (
+            Loan.objects.filter(employee_id=employee_id)
+            .annotate(outstanding=Coalesce(
+                Sum("installments__install_amount", filter=Q(installments__paid_date__isnull=True)),
+                Value(Decimal("0")),
+                output_field=DecimalField(max_digits=12, decimal_places=2)
+            ))
+            .prefetch_related(Prefetch(
+                "installments", queryset=LoanInstallment.objects.order_by("install_no")
+            ))
+            .order_by("approve_date")
+        )
+        return api_response(
+            message="Loan schedule fetched successfully",
+            data=LoanScheduleSerializer(loans, many=True).data
+        )
+
+
+# ----------------------------
+# Monthly Loan Deductions
+# ----------------------------
+class MonthlyDeductionsView(APIView):
+    """
+    Loan deductions of every employee for one month, in a single query.
+    """
+    permission_classes = [IsAdminRole]
+    throttle_classes = [GeneralThrottle]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            month = int(request.query_params["month"])
+            year = int(request.query_params["year"])
+            rows = list(monthly_deductions(month, year))
+        except (KeyError, ValueError):
+            return api_response(
+                status_str="error",
+                message="Valid 'month' and 'year' query parameters are required",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        return api_response(
+            message="Monthly loan deductions fetched successfully",
+            data=MonthlyDeductionSerializer(rows, many=True).data
+        )
@@ -0,0 +1,15 @@
+from django.contrib import admin
+from .models import (
+    SalaryType, EmpSalary, Addition, Deduction, AttendanceRollup, PayrollRun, PaySalary
+)
+
+# ----------------------------
+# Register Models in Admin
+# ----------------------------
+admin.site.register(SalaryType)
+admin.site.register(EmpSalary)
+admin.site.register(Addition)
+admin.site.register(Deduction)
+admin.site.register(AttendanceRollup)
+admin.site.register(PayrollRun)
+admin.site.register(PaySalary)
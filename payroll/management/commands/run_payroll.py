@@ -0,0 +1,84 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from payroll.calculations import PARTITION_CHOICES, PARTITION_BY_RANGE
+from payroll.models import PayrollRun
+from payroll.services import (
+    run_payroll, recompute_dirty_payslips, render_payslips, DEFAULT_CHUNK_SIZE
+)
+
+
+class Command(BaseCommand):
+    help = "Compute and store payslips for every payable employee for a month."
+
+    def add_arguments(self, parser):
+        today = timezone.localdate()
+        parser.add_argument("--month", type=int, default=today.month)
+        parser.add_argument("--year", type=int, default=today.year)
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+        parser.add_argument(
+            "--workers", type=int, default=None,
+            help="Number of processes used to compute payslips (default: PAYROLL_WORKERS)."
+        )
+        parser.add_argument("--partition-by", choices=PARTITION_CHOICES, default=PARTITION_BY_RANGE)
+        parser.add_argument(
+            "--dry-run", action="store_true",
+            help="Compute and print totals without writing payslips."
+        )
+        parser.add_argument(
+            "--incremental", action="store_true",
+            help="Only recompute payslips flagged dirty by corrections since the last run."
+        )
+        parser.add_argument(
+            "--skip-pdfs", action="store_true",
+            help="Do not pre-generate payslip PDFs after the run."
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        if options["incremental"]:
+            return self._recompute(options, started)
+
+        try:
+            run = run_payroll(
+                options["month"],
+                options["year"],
+                chunk_size=options["chunk_size"],
+                workers=options["workers"],
+                partition_by=options["partition_by"],
+                dry_run=options["dry_run"],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if not options["dry_run"]:
+            self._render(run, options)
+
+        elapsed = time.perf_counter() - started
+        prefix = "[dry run] " if options["dry_run"] else ""
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}Payroll {run.month}/{run.year}: {run.employee_count} payslips, "
+            f"gross {run.total_gross}, deductions {run.total_deduction}, "
+            f"net {run.total_net} in {elapsed:.2f}s"
+        ))
+
+    def _recompute(self, options, started):
+        try:
+            run = PayrollRun.objects.get(month=options["month"], year=options["year"])
+        except PayrollRun.DoesNotExist:
+            raise CommandError(f"No payroll run for {options['month']}/{options['year']}.")
+
+        count = recompute_dirty_payslips(run)
+        self._render(run, options)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Payroll {run.month}/{run.year}: recomputed {count} payslips, "
+            f"net {run.total_net} in {elapsed:.2f}s"
+        ))
+
+    def _render(self, run, options):
+        if options["skip_pdfs"]:
+            return
+        rendered = render_payslips(run, workers=options["workers"])
+        self.stdout.write(f"Rendered {rendered} payslip PDFs")
@@ -0,0 +1,124 @@
+# Generated by Django 5.2.6 on 2026-10-19 08:03
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SalaryType',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('salary_type', models.CharField(max_length=64, unique=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='EmpSalary',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('employee', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='salary', to=settings.AUTH_USER_MODEL)),
+                ('salary_type', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='salaries', to='payroll.salarytype')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Deduction',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('provident_fund', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('bima', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('tax', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('others', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('salary', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deductions', to='payroll.empsalary')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Addition',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('basic', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('medical', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('house_rent', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('conveyance', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('salary', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='additions', to='payroll.empsalary')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PayrollRun',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('month', models.PositiveSmallIntegerField()),
+                ('year', models.PositiveSmallIntegerField()),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], default='PENDING', max_length=10)),
+                ('employee_count', models.PositiveIntegerField(default=0)),
+                ('total_gross', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('total_deduction', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('total_net', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'unique_together': {('year', 'month')},
+            },
+        ),
+        migrations.CreateModel(
+            name='AttendanceRollup',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('month', models.PositiveSmallIntegerField()),
+                ('year', models.PositiveSmallIntegerField()),
+                ('working_days', models.PositiveSmallIntegerField()),
+                ('present_days', models.DecimalField(decimal_places=1, default=0, max_digits=4)),
+                ('paid_leave_days', models.DecimalField(decimal_places=1, default=0, max_digits=4)),
+                ('unpaid_leave_days', models.DecimalField(decimal_places=1, default=0, max_digits=4)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['year', 'month'], name='payroll_att_year_4ade98_idx')],
+                'unique_together': {('employee', 'year', 'month')},
+            },
+        ),
+        migrations.CreateModel(
+            name='PaySalary',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('month', models.PositiveSmallIntegerField()),
+                ('year', models.PositiveSmallIntegerField()),
+                ('total_days', models.PositiveSmallIntegerField()),
+                ('unpaid_days', models.DecimalField(decimal_places=1, default=0, max_digits=4)),
+                ('basic', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('medical', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('house_rent', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('conveyance', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('gross', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('leave_deduction', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('provident_fund', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('bima', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('tax', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('others', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('loan', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('total_deduction', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('total_pay', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('status', models.CharField(choices=[('PROCESS', 'Process'), ('PAID', 'Paid'), ('FAILED', 'Failed'), ('PENDING', 'Pending')], default='PROCESS', max_length=10)),
+                ('paid_type', models.CharField(choices=[('BANK', 'Bank Transfer'), ('CASH', 'Cash'), ('CHECK', 'Check'), ('OTHER', 'Other')], default='BANK', max_length=10)),
+                ('paid_date', models.DateField(blank=True, null=True)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='salary_payments', to=settings.AUTH_USER_MODEL)),
+                ('payroll_run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='payslips', to='payroll.payrollrun')),
+                ('salary_type', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='payroll.salarytype')),
+            ],
+            options={
+                'unique_together': {('payroll_run', 'employee')},
+            },
+        ),
+    ]
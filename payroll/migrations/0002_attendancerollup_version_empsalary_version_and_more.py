@@ -0,0 +1,48 @@
+# Generated by Django 5.2.6 on 2026-10-19 08:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payroll', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attendancerollup',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='empsalary',
+            name='version',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='paysalary',
+            name='attendance_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='paysalary',
+            name='is_dirty',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='paysalary',
+            name='salary_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='paysalary',
+            index=models.Index(fields=['payroll_run', 'is_dirty'], name='payroll_pay_payroll_a2e881_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='paysalary',
+            index=models.Index(fields=['employee', 'year', 'month'], name='payroll_pay_employe_46a598_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 08:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payroll', '0002_attendancerollup_version_empsalary_version_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paysalary',
+            name='pdf_digest',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
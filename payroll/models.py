@@ -0,0 +1,206 @@
+import uuid
+from django.conf import settings
+from django.db import models
+from core.constants import (
+    PAYMENT_STATUS_CHOICES, PAYMENT_TYPE_CHOICES, PAYROLL_RUN_STATUS_CHOICES
+)
+
+
+# ----------------------------
+# Salary Type Model
+# ----------------------------
+class SalaryType(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    salary_type = models.CharField(max_length=64, unique=True)
+
+    def __str__(self):
+        return self.salary_type
+
+
+# ----------------------------
+# Employee Salary Structure
+# ----------------------------
+class EmpSalary(models.Model):
+    """
+    Salary structure of an employee. The monthly figures live in the
+    related ``Addition`` and ``Deduction`` rows.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    employee = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="salary"
+    )
+    salary_type = models.ForeignKey(
+        SalaryType,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="salaries"
+    )
+    total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    version = models.PositiveIntegerField(default=1)
+
+    def __str__(self):
+        return f"{self.employee} - Salary"
+
+
+class Addition(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    salary = models.ForeignKey(EmpSalary, on_delete=models.CASCADE, related_name="additions")
+    basic = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    medical = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    house_rent = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    conveyance = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    def __str__(self):
+        return f"Addition for {self.salary.employee}"
+
+
+class Deduction(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    salary = models.ForeignKey(EmpSalary, on_delete=models.CASCADE, related_name="deductions")
+    provident_fund = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    bima = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    tax = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    others = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    def __str__(self):
+        return f"Deduction for {self.salary.employee}"
+
+
+# ----------------------------
+# Monthly Attendance Rollup
+# ----------------------------
+class AttendanceRollup(models.Model):
+    """
+    Per-employee monthly attendance summary consumed by the payroll run.
+    Unpaid leave and absences are deducted pro rata from gross pay.
+    ``version`` is bumped on every correction (see ``payroll.signals``).
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    employee = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="attendance_rollups"
+    )
+    month = models.PositiveSmallIntegerField()
+    year = models.PositiveSmallIntegerField()
+    working_days = models.PositiveSmallIntegerField()
+    present_days = models.DecimalField(max_digits=4, decimal_places=1, default=0)
+    paid_leave_days = models.DecimalField(max_digits=4, decimal_places=1, default=0)
+    unpaid_leave_days = models.DecimalField(max_digits=4, decimal_places=1, default=0)
+    version = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        unique_together = ("employee", "year", "month")
+        indexes = [
+            models.Index(fields=["year", "month"]),
+        ]
+
+    def __str__(self):
+        return f"{self.employee} - {self.month}/{self.year}"
+
+
+# ----------------------------
+# Payroll Run
+# ----------------------------
+class PayrollRun(models.Model):
+    """
+    One payroll computation for a given month. Re-running a month
+    replaces the payslips of the previous run.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    month = models.PositiveSmallIntegerField()
+    year = models.PositiveSmallIntegerField()
+    status = models.CharField(max_length=10, choices=PAYROLL_RUN_STATUS_CHOICES, default="PENDING")
+    employee_count = models.PositiveIntegerField(default=0)
+    total_gross = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    total_deduction = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    total_net = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("year", "month")
+
+    def __str__(self):
+        return f"Payroll {self.month}/{self.year} ({self.status})"
+
+
+# ----------------------------
+# Payslip
+# ----------------------------
+class PaySalary(models.Model):
+    """
+    Payslip of one employee produced by a payroll run.
+
+    The versions of the salary structure and attendance rollup it was
+    computed from are recorded, and the loan installments it deducted point
+    back to it. A later correction to any of those inputs flags the payslip
+    ``is_dirty`` so only it is recomputed.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    payroll_run = models.ForeignKey(PayrollRun, on_delete=models.CASCADE, related_name="payslips")
+    employee = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="salary_payments"
+    )
+    salary_type = models.ForeignKey(SalaryType, on_delete=models.SET_NULL, null=True, blank=True)
+    month = models.PositiveSmallIntegerField()
+    year = models.PositiveSmallIntegerField()
+    total_days = models.PositiveSmallIntegerField()
+    unpaid_days = models.DecimalField(max_digits=4, decimal_places=1, default=0)
+
+    # ----------------------------
+    # Earnings
+    # ----------------------------
+    basic = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    medical = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    house_rent = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    conveyance = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    gross = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    # ----------------------------
+    # Deductions
+    # ----------------------------
+    leave_deduction = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    provident_fund = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    bima = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    tax = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    others = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    loan = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    total_deduction = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    total_pay = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    status = models.CharField(max_length=10, choices=PAYMENT_STATUS_CHOICES, default="PROCESS")
+    paid_type = models.CharField(max_length=10, choices=PAYMENT_TYPE_CHOICES, default="BANK")
+    paid_date = models.DateField(blank=True, null=True)
+
+    # ----------------------------
+    # Recorded Inputs
+    # ----------------------------
+    salary_version = models.PositiveIntegerField(default=0)
+    attendance_version = models.PositiveIntegerField(default=0)
+    is_dirty = models.BooleanField(default=False)
+
+    # ----------------------------
+    # Rendered PDF
+    # ----------------------------
+    pdf_digest = models.CharField(max_length=64, blank=True, default="")
+
+    class Meta:
+        unique_together = ("payroll_run", "employee")
+        indexes = [
+            models.Index(fields=["payroll_run", "is_dirty"]),
+            models.Index(fields=["employee", "year", "month"]),
+        ]
+
+    def __str__(self):
+        return f"{self.employee} - {self.month}/{self.year}"
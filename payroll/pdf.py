@@ -0,0 +1,130 @@
+"""
+Minimal, dependency-free payslip PDF writer. Like ``calculations`` this
+module must not import Django models so that worker processes can load it.
+
+Output is deterministic for a given payload (no timestamps or random IDs),
+so the digest of the payload is also a stable address for the file.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Bump whenever the layout changes so every payslip is re-rendered.
+RENDERER_VERSION = "1"
+
+MONTH_NAMES = (
+    "", "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+EARNING_LINES = (
+    ("Basic", "basic"),
+    ("Medical", "medical"),
+    ("House Rent", "house_rent"),
+    ("Conveyance", "conveyance"),
+)
+DEDUCTION_LINES = (
+    ("Unpaid Leave", "leave_deduction"),
+    ("Provident Fund", "provident_fund"),
+    ("Insurance (Bima)", "bima"),
+    ("Tax", "tax"),
+    ("Others", "others"),
+    ("Loan Installment", "loan"),
+)
+
+
+# ----------------------------
+# Addressing
+# ----------------------------
+def payslip_digest(payload: Dict[str, str]) -> str:
+    """SHA-256 of the render input; changes iff the rendered PDF would."""
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{RENDERER_VERSION}:{body}".encode()).hexdigest()
+
+
+def payslip_relative_path(digest: str) -> str:
+    return f"payslips/{digest[:2]}/{digest}.pdf"
+
+
+# ----------------------------
+# Rendering
+# ----------------------------
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _text(font: str, size: int, x: int, y: int, text: str) -> str:
+    return f"BT /{font} {size} Tf {x} {y} Td ({_escape(text)}) Tj ET"
+
+
+def _lines(payload: Dict[str, str]) -> List[Tuple[str, int, int, int, str]]:
+    month = MONTH_NAMES[int(payload["month"])]
+    rows = [
+        ("F2", 18, 50, 790, "Payslip"),
+        ("F1", 11, 50, 768, f"{month} {payload['year']}"),
+        ("F1", 11, 50, 740, f"Employee: {payload['employee']}"),
+        ("F1", 11, 50, 724, f"Employee ID: {payload['employee_code']}"),
+        ("F1", 11, 50, 708, f"Days: {payload['total_days']}  Unpaid: {payload['unpaid_days']}"),
+        ("F2", 12, 50, 676, "Earnings"),
+    ]
+    y = 658
+    for label, key in EARNING_LINES:
+        rows += [("F1", 11, 60, y, label), ("F1", 11, 400, y, payload[key])]
+        y -= 16
+    rows += [("F2", 11, 60, y, "Gross"), ("F2", 11, 400, y, payload["gross"])]
+
+    y -= 32
+    rows.append(("F2", 12, 50, y, "Deductions"))
+    y -= 18
+    for label, key in DEDUCTION_LINES:
+        rows += [("F1", 11, 60, y, label), ("F1", 11, 400, y, payload[key])]
+        y -= 16
+    rows += [("F2", 11, 60, y, "Total Deductions"), ("F2", 11, 400, y, payload["total_deduction"])]
+
+    y -= 32
+    rows += [("F2", 14, 50, y, "Net Pay"), ("F2", 14, 400, y, payload["total_pay"])]
+    return rows
+
+
+def render_payslip_pdf(payload: Dict[str, str]) -> bytes:
+    """Render a single-page A4 payslip."""
+    content = "\n".join(_text(*row) for row in _lines(payload)).encode("latin-1", "replace")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+        b"/Resources << /Font << /F1 4 0 R /F2 5 0 R >> >> /Contents 6 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+    ]
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def write_payslip_pdf(payload: Dict[str, str], media_root: str) -> str:
+    """
+    Render ``payload`` into its content-addressed path under ``media_root``
+    and return the digest. Existing files are left untouched.
+    """
+    digest = payslip_digest(payload)
+    path = Path(media_root) / payslip_relative_path(digest)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(render_payslip_pdf(payload))
+        os.replace(tmp, path)
+    return digest
@@ -0,0 +1,388 @@
+import calendar
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Subquery, Sum
+from django.utils import timezone
+
+from core.utils import month_bounds
+from loan.models import Loan
+from loan.services import due_installments
+from .models import EmpSalary, Addition, Deduction, AttendanceRollup, PayrollRun, PaySalary
+from .calculations import (
+    ZERO, PARTITION_BY_RANGE, PayslipInput, compute_parallel, compute_payslips, summarize
+)
+from .pdf import payslip_digest, payslip_relative_path, write_payslip_pdf
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+# ----------------------------
+# Input Loading
+# ----------------------------
+def load_payroll_inputs(
+    month: int, year: int, employee_ids: Optional[Iterable] = None
+) -> List[PayslipInput]:
+    """
+    Load salary structure, attendance rollups and loan installments for
+    every payable employee (or only ``employee_ids``) in a fixed number of
+    queries (five), no matter how many employees there are.
+    """
+    start, end = month_bounds(month, year)
+    default_days = calendar.monthrange(year, month)[1]
+
+    salary_qs = EmpSalary.objects.filter(employee__is_active=True, employee__status="ACTIVE")
+    rollup_qs = AttendanceRollup.objects.filter(year=year, month=month)
+    installment_qs = due_installments(start, end)
+    if employee_ids is not None:
+        salary_qs = salary_qs.filter(employee_id__in=employee_ids)
+        rollup_qs = rollup_qs.filter(employee_id__in=employee_ids)
+        installment_qs = installment_qs.filter(employee_id__in=employee_ids)
+
+    salaries = list(
+        salary_qs.order_by("employee_id").values_list(
+            "id", "employee_id", "salary_type_id", "employee__designation__department_id", "version"
+        )
+    )
+
+    additions = {
+        row["salary_id"]: row
+        for row in Addition.objects.filter(salary__in=salary_qs.values("id"))
+        .values("salary_id")
+        .annotate(
+            sum_basic=Sum("basic"),
+            sum_medical=Sum("medical"),
+            sum_house_rent=Sum("house_rent"),
+            sum_conveyance=Sum("conveyance"),
+        )
+        .order_by()
+    }
+
+    deductions = {
+        row["salary_id"]: row
+        for row in Deduction.objects.filter(salary__in=salary_qs.values("id"))
+        .values("salary_id")
+        .annotate(
+            sum_provident_fund=Sum("provident_fund"),
+            sum_bima=Sum("bima"),
+            sum_tax=Sum("tax"),
+            sum_others=Sum("others"),
+        )
+        .order_by()
+    }
+
+    rollups = {
+        employee_id: (working_days, unpaid, version)
+        for employee_id, working_days, unpaid, version in rollup_qs.values_list(
+            "employee_id", "working_days", "unpaid_leave_days", "version"
+        )
+    }
+
+    loans = dict(
+        installment_qs.values("employee_id")
+        .annotate(total=Sum("install_amount"))
+        .order_by()
+        .values_list("employee_id", "total")
+    )
+
+    inputs = []
+    for salary_id, employee_id, salary_type_id, department_id, salary_version in salaries:
+        add = additions.get(salary_id, {})
+        ded = deductions.get(salary_id, {})
+        working_days, unpaid, attendance_version = rollups.get(employee_id, (default_days, ZERO, 0))
+        inputs.append(PayslipInput(
+            employee_id=employee_id,
+            salary_type_id=salary_type_id,
+            working_days=working_days,
+            unpaid_days=unpaid or ZERO,
+            basic=add.get("sum_basic") or ZERO,
+            medical=add.get("sum_medical") or ZERO,
+            house_rent=add.get("sum_house_rent") or ZERO,
+            conveyance=add.get("sum_conveyance") or ZERO,
+            provident_fund=ded.get("sum_provident_fund") or ZERO,
+            bima=ded.get("sum_bima") or ZERO,
+            tax=ded.get("sum_tax") or ZERO,
+            others=ded.get("sum_others") or ZERO,
+            loan=loans.get(employee_id) or ZERO,
+            department_id=department_id,
+            salary_version=salary_version,
+            attendance_version=attendance_version,
+        ))
+    return inputs
+
+
+def _link_loan_installments(run: PayrollRun, employee_ids: Optional[Iterable] = None) -> None:
+    """
+    Point the month's due installments at the payslip that deducted them,
+    in a single UPDATE.
+    """
+    start, end = month_bounds(run.month, run.year)
+    installments = due_installments(start, end)
+    if employee_ids is not None:
+        installments = installments.filter(employee_id__in=employee_ids)
+    installments.update(payslip=Subquery(
+        PaySalary.objects.filter(payroll_run=run, employee_id=OuterRef("employee_id")).values("id")[:1]
+    ))
+
+
+# ----------------------------
+# Payroll Run
+# ----------------------------
+class PayrollPaidError(ValueError):
+    """Raised when re-running a month whose payslips are already (partly) paid."""
+
+
+def run_payroll(
+    month: int,
+    year: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: Optional[int] = None,
+    partition_by: str = PARTITION_BY_RANGE,
+    dry_run: bool = False,
+) -> PayrollRun:
+    """
+    Compute and store payslips for every payable employee for the given
+    month. Computation is spread over ``workers`` processes (defaults to
+    ``settings.PAYROLL_WORKERS``) and payslips are written with
+    ``bulk_create`` in chunks of ``chunk_size``; re-running a month replaces
+    its previous payslips. Once any payslip of the month is PAID the month
+    can no longer be re-run (``PayrollPaidError``); corrections then go
+    through ``recompute_dirty_payslips``, which leaves paid payslips alone.
+
+    With ``dry_run`` nothing is written and an unsaved ``PayrollRun``
+    carrying the totals is returned, for comparing against the serial path.
+    """
+    month_bounds(month, year)
+    if workers is None:
+        workers = settings.PAYROLL_WORKERS
+
+    started_at = timezone.now()
+    rows = compute_parallel(load_payroll_inputs(month, year), workers, by=partition_by)
+    totals = summarize(rows)
+
+    if dry_run:
+        return PayrollRun(month=month, year=year, started_at=started_at, **totals)
+
+    try:
+        with transaction.atomic():
+            run, _ = PayrollRun.objects.select_for_update().get_or_create(month=month, year=year)
+            if run.payslips.filter(status="PAID").exists():
+                raise PayrollPaidError(f"Payroll {month}/{year} has paid payslips and cannot be re-run.")
+            run.payslips.all().delete()
+
+            for start in range(0, len(rows), chunk_size):
+                PaySalary.objects.bulk_create(
+                    [
+                        PaySalary(payroll_run=run, month=month, year=year, **row)
+                        for row in rows[start:start + chunk_size]
+                    ],
+                    batch_size=chunk_size
+                )
+            _link_loan_installments(run)
+
+            for field, value in totals.items():
+                setattr(run, field, value)
+            run.status = "COMPLETED"
+            run.started_at = started_at
+            run.finished_at = timezone.now()
+            run.save()
+    except PayrollPaidError:
+        raise
+    except Exception:
+        logger.exception(f"Payroll run for {month}/{year} failed")
+        # The transaction rolled back, so a month that already completed
+        # still has its payslips and keeps its COMPLETED status.
+        run, created = PayrollRun.objects.get_or_create(
+            month=month, year=year,
+            defaults={"status": "FAILED", "finished_at": timezone.now()}
+        )
+        if not created:
+            PayrollRun.objects.filter(pk=run.pk, status__in=["PENDING", "FAILED"]).update(
+                status="FAILED", finished_at=timezone.now()
+            )
+        raise
+
+    logger.info(f"Payroll run for {month}/{year} completed: {run.employee_count} payslips")
+    return run
+
+
+# ----------------------------
+# Incremental Recomputation
+# ----------------------------
+def mark_payslips_dirty(employee_ids: Iterable, month: Optional[int] = None, year: Optional[int] = None) -> int:
+    """
+    Flag the unpaid payslips of ``employee_ids`` for recomputation, limited
+    to one month when ``month``/``year`` are given. Returns the number of
+    payslips flagged.
+    """
+    payslips = PaySalary.objects.filter(employee_id__in=employee_ids, is_dirty=False).exclude(status="PAID")
+    if month is not None and year is not None:
+        payslips = payslips.filter(month=month, year=year)
+    return payslips.update(is_dirty=True)
+
+
+def latest_payroll_run() -> Optional[PayrollRun]:
+    """The most recent completed run: the month a salary correction applies to."""
+    return PayrollRun.objects.filter(status="COMPLETED").order_by("-year", "-month").first()
+
+
+def mark_salary_payslips_dirty(employee_id) -> int:
+    """
+    Flag the employee's unpaid payslip in the latest payroll run after a
+    salary structure change; earlier months keep what they were computed
+    with. An employee without a payslip there (a new hire) is left to the
+    next ``run_payroll``. Returns the number of payslips flagged.
+    """
+    run = latest_payroll_run()
+    if run is None:
+        return 0
+    return mark_payslips_dirty([employee_id], run.month, run.year)
+
+
+def mark_loan_payslips_dirty(loan: Loan) -> int:
+    """
+    Flag the employee's unpaid payslips for the months the loan has an
+    installment due in. Returns the number of payslips flagged.
+    """
+    due_that_month = loan.installments.filter(
+        due_date__year=OuterRef("year"), due_date__month=OuterRef("month")
+    )
+    return (
+        PaySalary.objects.filter(employee_id=loan.employee_id, is_dirty=False)
+        .exclude(status="PAID")
+        .filter(Exists(due_that_month))
+        .update(is_dirty=True)
+    )
+
+
+def recompute_dirty_payslips(run: PayrollRun) -> int:
+    """
+    Rebuild only the payslips of ``run`` flagged ``is_dirty`` and refresh
+    the run totals. Employees who are no longer payable lose their payslip.
+    Returns the number of payslips recomputed.
+    """
+    dirty = dict(run.payslips.filter(is_dirty=True).values_list("employee_id", "id"))
+    if not dirty:
+        return 0
+
+    rows = {
+        row["employee_id"]: row
+        for row in compute_payslips(load_payroll_inputs(run.month, run.year, employee_ids=list(dirty)))
+    }
+
+    with transaction.atomic():
+        payslips = list(PaySalary.objects.select_for_update().filter(id__in=dirty.values()))
+        stale = [payslip.pk for payslip in payslips if payslip.employee_id not in rows]
+        updated = []
+        for payslip in payslips:
+            row = rows.get(payslip.employee_id)
+            if row is None:
+                continue
+            for field, value in row.items():
+                setattr(payslip, field, value)
+            payslip.is_dirty = False
+            updated.append(payslip)
+
+        if updated:
+            fields = [field for field in rows[updated[0].employee_id] if field != "employee_id"]
+            PaySalary.objects.bulk_update(updated, fields + ["is_dirty"], batch_size=DEFAULT_CHUNK_SIZE)
+        PaySalary.objects.filter(pk__in=stale).delete()
+        _link_loan_installments(run, employee_ids=list(dirty))
+
+        totals = run.payslips.aggregate(
+            employee_count=Count("id"),
+            total_gross=Sum("gross"),
+            total_deduction=Sum("total_deduction"),
+            total_net=Sum("total_pay"),
+        )
+        for field, value in totals.items():
+            setattr(run, field, ZERO if value is None else value)
+        run.finished_at = timezone.now()
+        run.save()
+
+    logger.info(f"Payroll {run.month}/{run.year}: recomputed {len(updated)} payslips")
+    return len(updated)
+
+
+# ----------------------------
+# Payslip PDFs
+# ----------------------------
+PAYSLIP_AMOUNT_FIELDS = (
+    "basic", "medical", "house_rent", "conveyance", "gross", "leave_deduction",
+    "provident_fund", "bima", "tax", "others", "loan", "total_deduction", "total_pay",
+)
+
+
+def payslip_payload(payslip: PaySalary) -> Dict[str, str]:
+    """Everything printed on the payslip PDF, as strings."""
+    payload = {field: str(getattr(payslip, field)) for field in PAYSLIP_AMOUNT_FIELDS}
+    payload.update({
+        "employee": payslip.employee.email,
+        "employee_code": payslip.employee.em_id or "",
+        "month": str(payslip.month),
+        "year": str(payslip.year),
+        "total_days": str(payslip.total_days),
+        "unpaid_days": str(payslip.unpaid_days),
+    })
+    return payload
+
+
+def payslip_pdf_path(digest: str) -> Path:
+    return Path(settings.MEDIA_ROOT) / payslip_relative_path(digest)
+
+
+def ensure_payslip_pdf(payslip: PaySalary) -> str:
+    """
+    Render one payslip in-process if its PDF is missing or stale and return
+    the digest. Used as the fallback when serving a payslip.
+    """
+    digest = write_payslip_pdf(payslip_payload(payslip), str(settings.MEDIA_ROOT))
+    if digest != payslip.pdf_digest:
+        payslip.pdf_digest = digest
+        PaySalary.objects.filter(pk=payslip.pk).update(pdf_digest=digest)
+    return digest
+
+
+def render_payslips(run: PayrollRun, workers: Optional[int] = None) -> int:
+    """
+    Pre-generate PDFs for the payslips of ``run`` in a process pool. Files
+    are content-addressed by the digest of their input, so a payslip is only
+    rendered when no file exists yet for its current input.
+    Returns the number of payslips rendered.
+    """
+    if workers is None:
+        workers = settings.PAYROLL_WORKERS
+
+    relinked, pending = [], []
+    for payslip in run.payslips.select_related("employee").order_by("employee_id"):
+        payload = payslip_payload(payslip)
+        digest = payslip_digest(payload)
+        if payslip_pdf_path(digest).exists():
+            if digest != payslip.pdf_digest:
+                payslip.pdf_digest = digest
+                relinked.append(payslip)
+            continue
+        pending.append((payslip, payload))
+
+    if pending:
+        payloads = [payload for _, payload in pending]
+        media_root = str(settings.MEDIA_ROOT)
+        if workers > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                digests = list(executor.map(write_payslip_pdf, payloads, repeat(media_root), chunksize=64))
+        else:
+            digests = [write_payslip_pdf(payload, media_root) for payload in payloads]
+        for (payslip, _), digest in zip(pending, digests):
+            payslip.pdf_digest = digest
+            relinked.append(payslip)
+
+    PaySalary.objects.bulk_update(relinked, ["pdf_digest"], batch_size=DEFAULT_CHUNK_SIZE)
+    logger.info(f"Payroll {run.month}/{run.year}: rendered {len(pending)} payslip PDFs")
+    return len(pending)
@@ -0,0 +1,70 @@
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from loan.models import Loan, LoanInstallment
+from loan.services import APPROVAL_FIELDS
+from .models import EmpSalary, Addition, Deduction, AttendanceRollup, PaySalary
+from .services import mark_loan_payslips_dirty, mark_payslips_dirty, mark_salary_payslips_dirty
+
+
+# ----------------------------
+# Salary Structure Corrections
+# ----------------------------
+def _bump_salary_version(salary_id):
+    EmpSalary.objects.filter(pk=salary_id).update(version=F("version") + 1)
+    employee_id = EmpSalary.objects.filter(pk=salary_id).values_list("employee_id", flat=True).first()
+    if employee_id is not None:
+        mark_salary_payslips_dirty(employee_id)
+
+
+@receiver(post_save, sender=EmpSalary)
+def salary_structure_saved(sender, instance, created, **kwargs):
+    if created:
+        # Only flags a payslip the employee already has; a new hire's
+        # structure is picked up by the next payroll run.
+        mark_salary_payslips_dirty(instance.employee_id)
+    else:
+        _bump_salary_version(instance.pk)
+
+
+@receiver(post_save, sender=Addition)
+@receiver(post_delete, sender=Addition)
+@receiver(post_save, sender=Deduction)
+@receiver(post_delete, sender=Deduction)
+def salary_component_changed(sender, instance, **kwargs):
+    _bump_salary_version(instance.salary_id)
+
+
+# ----------------------------
+# Attendance Corrections
+# ----------------------------
+@receiver(post_save, sender=AttendanceRollup)
+def attendance_rollup_saved(sender, instance, created, **kwargs):
+    if not created:
+        AttendanceRollup.objects.filter(pk=instance.pk).update(version=F("version") + 1)
+    mark_payslips_dirty([instance.employee_id], instance.month, instance.year)
+
+
+@receiver(post_delete, sender=AttendanceRollup)
+def attendance_rollup_deleted(sender, instance, **kwargs):
+    mark_payslips_dirty([instance.employee_id], instance.month, instance.year)
+
+
+# ----------------------------
+# Loan Corrections
+# ----------------------------
+@receiver(post_save, sender=LoanInstallment)
+@receiver(post_delete, sender=LoanInstallment)
+def loan_installment_changed(sender, instance, **kwargs):
+    if instance.payslip_id:
+        PaySalary.objects.filter(pk=instance.payslip_id).exclude(status="PAID").update(is_dirty=True)
+    mark_payslips_dirty([instance.employee_id], instance.due_date.month, instance.due_date.year)
+
+
+@receiver(post_save, sender=Loan)
+def loan_saved(sender, instance, created, update_fields=None, **kwargs):
+    # Approval only schedules installments from the next month on.
+    if created or update_fields == APPROVAL_FIELDS:
+        return
+    mark_loan_payslips_dirty(instance)
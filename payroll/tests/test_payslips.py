@@ -0,0 +1,88 @@
+import shutil
+import tempfile
+from decimal import Decimal
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from payroll.models import AttendanceRollup, PaySalary
+from payroll.pdf import render_payslip_pdf
+from payroll.services import (
+    run_payroll, recompute_dirty_payslips, render_payslips, payslip_payload, payslip_pdf_path
+)
+from payroll.tests.test_services import create_employee
+
+
+class PayslipPDFTests(APITestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+
+        self.alice = create_employee("alice@gmail.com")
+        self.bob = create_employee("bob@gmail.com")
+        self.run = run_payroll(9, 2025)
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def authenticate(self, user):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
+
+    def test_render_is_deterministic_pdf(self):
+        payslip = PaySalary.objects.select_related("employee").get(employee=self.alice)
+        pdf = render_payslip_pdf(payslip_payload(payslip))
+        self.assertTrue(pdf.startswith(b"%PDF-1.4"))
+        self.assertEqual(pdf, render_payslip_pdf(payslip_payload(payslip)))
+
+    def test_only_changed_payslips_rerendered(self):
+        self.assertEqual(render_payslips(self.run), 2)
+        self.assertEqual(render_payslips(self.run), 0)
+
+        AttendanceRollup.objects.create(
+            employee=self.alice, month=9, year=2025, working_days=30, unpaid_leave_days=Decimal("1.0")
+        )
+        recompute_dirty_payslips(self.run)
+        self.assertEqual(render_payslips(self.run), 1)
+
+        # A full re-run with unchanged inputs reuses the existing files.
+        run = run_payroll(9, 2025)
+        self.assertEqual(render_payslips(run), 0)
+        self.assertTrue(all(PaySalary.objects.values_list("pdf_digest", flat=True)))
+
+    def test_download_with_etag_and_range(self):
+        render_payslips(self.run)
+        payslip = PaySalary.objects.get(employee=self.alice)
+        url = reverse("payroll:payslip-pdf", args=[payslip.pk])
+        self.authenticate(self.alice)
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertEqual(response["ETag"], f'"{payslip.pdf_digest}"')
+        body = b"".join(response.streaming_content)
+        self.assertEqual(body, payslip_pdf_path(payslip.pdf_digest).read_bytes())
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=f'"{payslip.pdf_digest}"')
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(url, HTTP_RANGE="bytes=0-7")
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b"".join(response.streaming_content), b"%PDF-1.4")
+        self.assertEqual(response["Content-Range"], f"bytes 0-7/{len(body)}")
+
+    def test_missing_pdf_rendered_on_demand(self):
+        payslip = PaySalary.objects.get(employee=self.alice)
+        self.authenticate(self.alice)
+        response = self.client.get(reverse("payroll:payslip-pdf", args=[payslip.pk]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        payslip.refresh_from_db()
+        self.assertTrue(payslip_pdf_path(payslip.pdf_digest).exists())
+
+    def test_other_employee_cannot_download(self):
+        payslip = PaySalary.objects.get(employee=self.alice)
+        self.authenticate(self.bob)
+        response = self.client.get(reverse("payroll:payslip-pdf", args=[payslip.pk]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,278 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+from django.db import DatabaseError
+from django.test import TestCase
+from users.models import User
+from loan.models import Loan, LoanInstallment
+from loan.services import approve_loan
+from payroll.models import (
+    EmpSalary, Addition, Deduction, AttendanceRollup, PayrollRun, PaySalary
+)
+from department.models import Department
+from designation.models import Designation
+from payroll.calculations import (
+    PayslipInput, compute_payslip, compute_parallel, partition_inputs
+)
+from payroll.services import (
+    PayrollPaidError, load_payroll_inputs, run_payroll, mark_payslips_dirty, recompute_dirty_payslips
+)
+
+
+def create_employee(email, basic="30000.00", tax="1500.00"):
+    user = User.objects.create_user(email=email, password="test@123")
+    salary = EmpSalary.objects.create(employee=user, total=Decimal(basic))
+    Addition.objects.create(
+        salary=salary, basic=Decimal(basic), medical=Decimal("1000.00"),
+        house_rent=Decimal("5000.00"), conveyance=Decimal("500.00")
+    )
+    Deduction.objects.create(salary=salary, provident_fund=Decimal("1200.00"), tax=Decimal(tax))
+    return user
+
+
+class ComputePayslipTests(TestCase):
+    def test_gross_and_net(self):
+        row = compute_payslip(PayslipInput(
+            employee_id=1, salary_type_id=None, working_days=30,
+            basic=Decimal("30000.00"), medical=Decimal("1000.00"),
+            tax=Decimal("1500.00"), loan=Decimal("2000.00")
+        ))
+        self.assertEqual(row["gross"], Decimal("31000.00"))
+        self.assertEqual(row["total_deduction"], Decimal("3500.00"))
+        self.assertEqual(row["total_pay"], Decimal("27500.00"))
+
+    def test_unpaid_days_rounded_half_up(self):
+        row = compute_payslip(PayslipInput(
+            employee_id=1, salary_type_id=None, working_days=30,
+            unpaid_days=Decimal("1.0"), basic=Decimal("1000.00")
+        ))
+        self.assertEqual(row["leave_deduction"], Decimal("33.33"))
+        self.assertEqual(row["total_pay"], Decimal("966.67"))
+
+
+class PartitionTests(TestCase):
+    def setUp(self):
+        self.inputs = [
+            PayslipInput(
+                employee_id=i, salary_type_id=None, working_days=30,
+                basic=Decimal("1000.00") + i, unpaid_days=Decimal(i % 3),
+                department_id=i % 4
+            )
+            for i in range(50)
+        ]
+
+    def test_range_partitions_cover_inputs_in_order(self):
+        partitions = partition_inputs(self.inputs, 4)
+        self.assertEqual(len(partitions), 4)
+        self.assertEqual([item for part in partitions for item in part], self.inputs)
+
+    def test_department_partitions(self):
+        partitions = partition_inputs(self.inputs, 2, by="department")
+        self.assertEqual(len(partitions), 4)
+        for part in partitions:
+            self.assertEqual(len({item.department_id for item in part}), 1)
+
+    def test_unknown_partitioning(self):
+        with self.assertRaises(ValueError):
+            partition_inputs(self.inputs, 2, by="region")
+
+    def test_parallel_matches_serial(self):
+        serial = compute_parallel(self.inputs, workers=1)
+        self.assertEqual(compute_parallel(self.inputs, workers=3), serial)
+        self.assertEqual(compute_parallel(self.inputs, workers=3, by="department"), serial)
+
+
+class RunPayrollTests(TestCase):
+    def setUp(self):
+        self.alice = create_employee("alice@gmail.com")
+        self.bob = create_employee("bob@gmail.com", basic="20000.00", tax="0.00")
+
+    def test_inputs_load_in_fixed_queries(self):
+        with self.assertNumQueries(5):
+            inputs = load_payroll_inputs(9, 2025)
+        self.assertEqual(len(inputs), 2)
+
+        for i in range(5):
+            create_employee(f"extra{i}@gmail.com")
+        with self.assertNumQueries(5):
+            inputs = load_payroll_inputs(9, 2025)
+        self.assertEqual(len(inputs), 7)
+
+    def test_run_creates_payslips_with_deductions(self):
+        AttendanceRollup.objects.create(
+            employee=self.alice, month=9, year=2025,
+            working_days=30, unpaid_leave_days=Decimal("3.0")
+        )
+        loan = Loan.objects.create(
+            employee=self.bob, loan_number="L-1", amount=Decimal("6000.00"), status="Active"
+        )
+        LoanInstallment.objects.create(
+            loan=loan, employee=self.bob, install_no=1,
+            due_date=date(2025, 9, 28), install_amount=Decimal("2000.00")
+        )
+
+        run = run_payroll(9, 2025, chunk_size=1)
+
+        self.assertEqual(run.status, "COMPLETED")
+        self.assertEqual(run.employee_count, 2)
+        alice = PaySalary.objects.get(employee=self.alice)
+        self.assertEqual(alice.leave_deduction, Decimal("3650.00"))
+        self.assertEqual(alice.total_pay, Decimal("30150.00"))
+        bob = PaySalary.objects.get(employee=self.bob)
+        self.assertEqual(bob.loan, Decimal("2000.00"))
+        self.assertEqual(bob.total_pay, Decimal("23300.00"))
+        self.assertEqual(run.total_net, alice.total_pay + bob.total_pay)
+
+    def test_rerun_replaces_payslips(self):
+        run_payroll(9, 2025)
+        run = run_payroll(9, 2025)
+        self.assertEqual(PaySalary.objects.filter(payroll_run=run).count(), 2)
+        self.assertEqual(PaySalary.objects.count(), 2)
+
+    def test_rerun_refused_once_payslips_paid(self):
+        run = run_payroll(9, 2025)
+        PaySalary.objects.filter(employee=self.alice).update(status="PAID")
+
+        with self.assertRaises(PayrollPaidError):
+            run_payroll(9, 2025)
+
+        self.assertEqual(PaySalary.objects.filter(payroll_run=run).count(), 2)
+        self.assertEqual(PaySalary.objects.get(employee=self.alice).status, "PAID")
+        self.assertEqual(PayrollRun.objects.get(pk=run.pk).status, "COMPLETED")
+
+    def test_failed_rerun_keeps_completed_status(self):
+        run = run_payroll(9, 2025)
+        with patch("payroll.services._link_loan_installments", side_effect=DatabaseError("connection lost")):
+            with self.assertRaises(DatabaseError):
+                run_payroll(9, 2025)
+
+        run.refresh_from_db()
+        self.assertEqual(run.status, "COMPLETED")
+        self.assertEqual(PaySalary.objects.filter(payroll_run=run).count(), 2)
+
+    def test_failed_first_run_marked_failed(self):
+        with patch("payroll.services._link_loan_installments", side_effect=DatabaseError("connection lost")):
+            with self.assertRaises(DatabaseError):
+                run_payroll(9, 2025)
+        self.assertEqual(PayrollRun.objects.get(month=9, year=2025).status, "FAILED")
+
+    def test_inactive_employee_skipped(self):
+        self.bob.status = "INACTIVE"
+        self.bob.save()
+        run = run_payroll(9, 2025)
+        self.assertEqual(run.employee_count, 1)
+
+    def test_dry_run_writes_nothing_and_matches_serial(self):
+        department = Department.objects.create(dep_name="IT")
+        self.bob.designation = Designation.objects.create(des_name="Dev", department=department)
+        self.bob.save()
+
+        serial = run_payroll(9, 2025, workers=1, dry_run=True)
+        parallel = run_payroll(9, 2025, workers=2, partition_by="department", dry_run=True)
+
+        self.assertFalse(PayrollRun.objects.exists())
+        self.assertFalse(PaySalary.objects.exists())
+        self.assertEqual(parallel.employee_count, serial.employee_count)
+        self.assertEqual(parallel.total_net, serial.total_net)
+        self.assertEqual(parallel.total_gross, serial.total_gross)
+
+    def test_invalid_month(self):
+        with self.assertRaises(ValueError):
+            run_payroll(13, 2025)
+
+
+class IncrementalRecomputeTests(TestCase):
+    def setUp(self):
+        self.alice = create_employee("alice@gmail.com")
+        self.bob = create_employee("bob@gmail.com", basic="20000.00", tax="0.00")
+        self.rollup = AttendanceRollup.objects.create(
+            employee=self.alice, month=9, year=2025, working_days=30
+        )
+        self.run = run_payroll(9, 2025)
+
+    def test_payslip_records_input_versions(self):
+        payslip = PaySalary.objects.get(employee=self.alice)
+        self.assertEqual(payslip.salary_version, EmpSalary.objects.get(employee=self.alice).version)
+        self.assertEqual(payslip.attendance_version, self.rollup.version)
+        self.assertFalse(payslip.is_dirty)
+
+    def test_attendance_correction_marks_only_affected_payslip(self):
+        self.rollup.unpaid_leave_days = Decimal("3.0")
+        self.rollup.save()
+
+        self.assertTrue(PaySalary.objects.get(employee=self.alice).is_dirty)
+        self.assertFalse(PaySalary.objects.get(employee=self.bob).is_dirty)
+
+        self.assertEqual(recompute_dirty_payslips(self.run), 1)
+        payslip = PaySalary.objects.get(employee=self.alice)
+        self.assertFalse(payslip.is_dirty)
+        self.assertEqual(payslip.leave_deduction, Decimal("3650.00"))
+        self.assertEqual(payslip.attendance_version, 2)
+
+        self.run.refresh_from_db()
+        fresh = run_payroll(9, 2025, dry_run=True)
+        self.assertEqual(self.run.total_net, fresh.total_net)
+
+    def test_allowance_correction_and_loan_link(self):
+        loan = Loan.objects.create(
+            employee=self.bob, loan_number="L-1", amount=Decimal("6000.00"), status="Active"
+        )
+        installment = LoanInstallment.objects.create(
+            loan=loan, employee=self.bob, install_no=1,
+            due_date=date(2025, 9, 28), install_amount=Decimal("2000.00")
+        )
+        Addition.objects.create(salary=self.bob.salary, medical=Decimal("500.00"))
+
+        self.assertEqual(recompute_dirty_payslips(self.run), 1)
+        payslip = PaySalary.objects.get(employee=self.bob)
+        self.assertEqual(payslip.loan, Decimal("2000.00"))
+        self.assertEqual(payslip.medical, Decimal("1500.00"))
+        installment.refresh_from_db()
+        self.assertEqual(installment.payslip, payslip)
+
+    def test_paid_payslip_not_marked(self):
+        PaySalary.objects.filter(employee=self.alice).update(status="PAID")
+        self.rollup.unpaid_leave_days = Decimal("1.0")
+        self.rollup.save()
+        self.assertEqual(recompute_dirty_payslips(self.run), 0)
+
+    def test_no_longer_payable_employee_dropped(self):
+        self.bob.status = "INACTIVE"
+        self.bob.save()
+        mark_payslips_dirty([self.bob.pk])
+        recompute_dirty_payslips(self.run)
+        self.assertFalse(PaySalary.objects.filter(employee=self.bob).exists())
+        self.run.refresh_from_db()
+        self.assertEqual(self.run.employee_count, 1)
+
+    def test_salary_created_after_run_leaves_run_alone(self):
+        carol = create_employee("carol@gmail.com")
+
+        self.assertFalse(PaySalary.objects.filter(employee=carol).exists())
+        self.assertEqual(recompute_dirty_payslips(self.run), 0)
+        self.run.refresh_from_db()
+        self.assertEqual(self.run.employee_count, 2)
+        self.assertEqual(self.run.payslips.count(), 2)
+
+        run = run_payroll(10, 2025)
+        self.assertTrue(PaySalary.objects.filter(employee=carol, payroll_run=run).exists())
+
+    def test_salary_correction_marks_only_latest_month(self):
+        run_payroll(10, 2025)
+        Addition.objects.create(salary=self.alice.salary, medical=Decimal("500.00"))
+
+        self.assertFalse(PaySalary.objects.get(employee=self.alice, month=9).is_dirty)
+        self.assertTrue(PaySalary.objects.get(employee=self.alice, month=10).is_dirty)
+        self.assertFalse(PaySalary.objects.get(employee=self.bob, month=10).is_dirty)
+
+    def test_loan_change_marks_only_its_months(self):
+        loan = Loan.objects.create(employee=self.bob, loan_number="L-1", amount=Decimal("2000.00"))
+        approve_loan(loan, approve_date=date(2025, 8, 15))
+        run_payroll(10, 2025)
+        self.assertFalse(PaySalary.objects.filter(is_dirty=True).exists())
+
+        loan.status = "Pause"
+        loan.save()
+
+        self.assertTrue(PaySalary.objects.get(employee=self.bob, month=9).is_dirty)
+        self.assertFalse(PaySalary.objects.get(employee=self.bob, month=10).is_dirty)
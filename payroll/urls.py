@@ -0,0 +1,11 @@
+from django.urls import path
+from .views import PayslipPDFView
+
+app_name = "payroll"
+
+urlpatterns = [
+    # ----------------------------
+    # Payslips
+    # ----------------------------
+    path("payslips/<uuid:pk>/pdf/", PayslipPDFView.as_view(), name="payslip-pdf"),
+]
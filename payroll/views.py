@@ -0,0 +1,44 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+import logging
+
+from core.http import serve_media
+from core.permissions import is_admin
+from core.utils import api_response
+from users.throttles import GeneralThrottle
+from .models import PaySalary
+from .pdf import payslip_relative_path
+from .services import ensure_payslip_pdf
+
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------
+# Payslip PDF Download
+# ----------------------------
+class PayslipPDFView(APIView):
+    """
+    Download a payslip PDF. PDFs are normally pre-generated after the
+    payroll run; a missing one is rendered on the spot. Supports ETag
+    revalidation and byte ranges.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [GeneralThrottle]
+
+    def get(self, request, pk, *args, **kwargs):
+        payslip = PaySalary.objects.select_related("employee").filter(pk=pk).first()
+        if payslip is None or (payslip.employee_id != request.user.pk and not is_admin(request.user)):
+            return api_response(
+                status_str="error",
+                message="Payslip not found",
+                status_code=status.HTTP_404_NOT_FOUND
+            )
+
+        digest = ensure_payslip_pdf(payslip)
+        return serve_media(
+            request,
+            payslip_relative_path(digest),
+            etag=digest,
+            filename=f"payslip-{payslip.year}-{payslip.month:02d}.pdf",
+        )
@@ -0,0 +1,9 @@
+from django.contrib import admin
+from .models import Project, ProjectFile
+
+
+# ----------------------------
+# Register Models in Admin
+# ----------------------------
+admin.site.register(Project)
+admin.site.register(ProjectFile)
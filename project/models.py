@@ -0,0 +1,46 @@
+import uuid
+from django.conf import settings
+from django.db import models
+from core.constants import PROJECT_STATUS_CHOICES
+
+
+# ----------------------------
+# Project Model
+# ----------------------------
+class Project(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    name = models.CharField(max_length=128)
+    start_date = models.DateField(blank=True, null=True)
+    end_date = models.DateField(blank=True, null=True)
+    description = models.TextField(blank=True, null=True)
+    summary = models.CharField(max_length=512, blank=True, null=True)
+    status = models.CharField(max_length=10, choices=PROJECT_STATUS_CHOICES, default="running")
+    progress = models.CharField(max_length=128, blank=True, null=True)
+
+    def __str__(self):
+        return self.name
+
+
+# ----------------------------
+# Project File Model
+# ----------------------------
+class ProjectFile(models.Model):
+    """
+    Document attached to a project. Files are created by the chunked
+    upload API (see ``uploads``) once every chunk has been received.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="files")
+    details = models.TextField(blank=True, null=True)
+    file_url = models.FileField(upload_to="project_files/")
+    assigned_to = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="project_files"
+    )
+
+    def __str__(self):
+        return f"{self.project.name} - File"
@@ -0,0 +1,17 @@
+from django.contrib import admin
+from .models import UploadSession
+
+
+# ----------------------------
+# Upload Session Admin
+# ----------------------------
+class UploadSessionAdmin(admin.ModelAdmin):
+    list_display = ("filename", "owner", "target", "offset", "size", "status", "updated_at")
+    list_filter = ("status", "target")
+    search_fields = ("filename", "owner__email")
+
+
+# ----------------------------
+# Register Models in Admin
+# ----------------------------
+admin.site.register(UploadSession, UploadSessionAdmin)
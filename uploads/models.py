@@ -0,0 +1,53 @@
+import uuid
+from django.conf import settings
+from django.db import models
+from core.constants import UPLOAD_STATUS_CHOICES, UPLOAD_TARGET_CHOICES
+
+
+# ----------------------------
+# Upload Session Model
+# ----------------------------
+class UploadSession(models.Model):
+    """
+    A resumable upload. Chunks are appended to a staging file in order;
+    ``offset`` is the number of bytes durably received so far, which is
+    where a client resumes after a dropped connection. Once ``offset``
+    reaches ``size`` and the SHA-256 matches ``checksum``, the staged file
+    becomes the target ``EmployeeFile`` or ``ProjectFile``.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="upload_sessions"
+    )
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    checksum = models.CharField(max_length=64)
+    offset = models.PositiveBigIntegerField(default=0)
+    status = models.CharField(max_length=20, choices=UPLOAD_STATUS_CHOICES, default="IN_PROGRESS")
+
+    # ----------------------------
+    # Target
+    # ----------------------------
+    target = models.CharField(max_length=20, choices=UPLOAD_TARGET_CHOICES)
+    employee = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="+"
+    )
+    project = models.ForeignKey("project.Project", on_delete=models.CASCADE, null=True, blank=True, related_name="+")
+    title = models.CharField(max_length=512, blank=True, null=True)
+    result_id = models.UUIDField(blank=True, null=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "updated_at"])]
+
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.size})"
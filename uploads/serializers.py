@@ -0,0 +1,50 @@
+import os
+from django.conf import settings
+from rest_framework import serializers
+from core.permissions import is_admin
+from .models import UploadSession
+
+
+# ----------------------------
+# Upload Session Serializer
+# ----------------------------
+class UploadSessionSerializer(serializers.ModelSerializer):
+    checksum = serializers.RegexField(r"^[0-9a-fA-F]{64}$", error_messages={"invalid": "Expected a SHA-256 hex digest."})
+
+    class Meta:
+        model = UploadSession
+        fields = [
+            "id", "filename", "size", "checksum", "offset", "status",
+            "target", "employee", "project", "title", "result_id"
+        ]
+        read_only_fields = ["id", "offset", "status", "result_id"]
+
+    def validate_filename(self, value):
+        name = os.path.basename(value.replace("\\", "/")).strip()
+        if not name:
+            raise serializers.ValidationError("Invalid file name.")
+        return name
+
+    def validate_size(self, value):
+        max_size = getattr(settings, "UPLOAD_MAX_SIZE", 500 * 1024 * 1024)
+        if value < 1 or value > max_size:
+            raise serializers.ValidationError(f"File size must be between 1 and {max_size} bytes.")
+        return value
+
+    def validate(self, data):
+        user = self.context["request"].user
+        if data["target"] == "EMPLOYEE_FILE":
+            employee = data.get("employee")
+            if employee is None:
+                raise serializers.ValidationError({"employee": "This field is required."})
+            if employee.pk != user.pk and not is_admin(user):
+                raise serializers.ValidationError({"employee": "You may only upload your own files."})
+            data["project"] = None
+        else:
+            if data.get("project") is None:
+                raise serializers.ValidationError({"project": "This field is required."})
+            if not is_admin(user):
+                raise serializers.ValidationError({"project": "Only admins may upload project files."})
+            data["employee"] = None
+        data["checksum"] = data["checksum"].lower()
+        return data
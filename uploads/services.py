@@ -0,0 +1,235 @@
+import fcntl
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Tuple
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+
+from project.models import ProjectFile
+from users.models import EmployeeFile
+from .models import UploadSession
+
+logger = logging.getLogger(__name__)
+
+READ_BLOCK_SIZE = 64 * 1024
+
+
+class UploadError(Exception):
+    """Raised for chunks that cannot be applied; carries an HTTP status."""
+
+    def __init__(self, message, status_code=400, offset=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.offset = offset
+
+
+class _StagedFile(File):
+    """
+    A file already on local disk. Exposing ``temporary_file_path`` lets
+    FileSystemStorage move it into place instead of copying it.
+    """
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+def chunk_max_size() -> int:
+    return getattr(settings, "UPLOAD_CHUNK_MAX_SIZE", 5 * 1024 * 1024)
+
+
+def staging_path(session: UploadSession) -> Path:
+    return Path(settings.MEDIA_ROOT) / "uploads" / "partial" / f"{session.pk}.part"
+
+
+# ----------------------------
+# Running Checksums
+# ----------------------------
+_hashers: "OrderedDict[object, Tuple[int, object]]" = OrderedDict()
+_hashers_lock = threading.Lock()
+MAX_CACHED_HASHERS = 256
+
+
+def _hasher_at(session_id, path: Path, length: int):
+    """
+    SHA-256 state of the first ``length`` staged bytes. Chunks normally
+    extend the state this process kept from the previous chunk; after a
+    miss (another worker took the last chunk, or a restart) only the bytes
+    not yet hashed are read back from the staging file.
+    """
+    with _hashers_lock:
+        hashed, hasher = _hashers.get(session_id, (0, None))
+    if hasher is None or hashed > length:
+        hashed, hasher = 0, hashlib.sha256()
+    else:
+        hasher = hasher.copy()
+    if hashed < length:
+        with open(path, "rb") as f:
+            f.seek(hashed)
+            remaining = length - hashed
+            while remaining:
+                block = f.read(min(1024 * 1024, remaining))
+                if not block:
+                    break
+                hasher.update(block)
+                remaining -= len(block)
+    return hasher
+
+
+def _remember_hasher(session_id, length: int, hasher) -> None:
+    with _hashers_lock:
+        _hashers[session_id] = (length, hasher)
+        _hashers.move_to_end(session_id)
+        while len(_hashers) > MAX_CACHED_HASHERS:
+            _hashers.popitem(last=False)
+
+
+def _forget_hasher(session_id) -> None:
+    with _hashers_lock:
+        _hashers.pop(session_id, None)
+
+
+# ----------------------------
+# Chunk Handling
+# ----------------------------
+def write_chunk(session_id, stream, offset: int, length: int, checksum: str = None) -> UploadSession:
+    """
+    Append ``length`` bytes read from ``stream`` at ``offset``. The chunk is
+    streamed to disk in small blocks and never held in memory, under a file
+    lock but outside any transaction, so a slow client holds neither a row
+    lock nor a database connection. The staging file's length is the
+    source of truth for the bytes received: a short transaction then
+    records it as the session's offset. Offsets must match it, so a client
+    resumes by asking for the session's offset and sending from there (a
+    409 carries the right one). Bytes of a failed chunk are truncated away.
+
+    Once every byte is in, any further ``PUT`` retries completion, so a
+    failed attach can be finished without re-sending the file.
+    """
+    if length > chunk_max_size():
+        raise UploadError(f"Chunk exceeds the maximum size of {chunk_max_size()} bytes.", 413)
+
+    session = UploadSession.objects.get(pk=session_id)
+    if session.status != "IN_PROGRESS":
+        raise UploadError("Upload is no longer in progress.", 409, session.offset)
+
+    path = staging_path(session)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "ab") as f:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise UploadError("Another chunk of this upload is being written.", 409, session.offset)
+
+        received_before = os.fstat(f.fileno()).st_size
+        if received_before == session.size:
+            # Every byte is in; only completion is left to do (or redo).
+            return _record_and_complete(session.pk, received_before)
+        if offset != received_before:
+            raise UploadError("Chunk offset does not match the received bytes.", 409, received_before)
+        if offset + length > session.size:
+            raise UploadError("Chunk extends past the declared file size.", 400, received_before)
+
+        hasher = _hasher_at(session.pk, path, offset)
+        digest = hashlib.sha256()
+        received = 0
+        while received < length:
+            block = stream.read(min(READ_BLOCK_SIZE, length - received))
+            if not block:
+                break
+            digest.update(block)
+            hasher.update(block)
+            f.write(block)
+            received += len(block)
+
+        if received != length or (checksum and digest.hexdigest() != checksum.lower()):
+            f.truncate(offset)
+            message = "Chunk checksum mismatch." if received == length else "Incomplete chunk."
+            raise UploadError(message, 400, offset)
+        f.flush()
+        os.fsync(f.fileno())
+        _remember_hasher(session.pk, offset + length, hasher)
+
+        return _record_and_complete(session.pk, offset + length)
+
+
+def _record_and_complete(session_id, received: int) -> UploadSession:
+    with transaction.atomic():
+        session = UploadSession.objects.select_for_update().get(pk=session_id)
+        if session.status != "IN_PROGRESS":
+            raise UploadError("Upload is no longer in progress.", 409, session.offset)
+        if session.offset != received:
+            session.offset = received
+            session.save(update_fields=["offset", "updated_at"])
+
+    if session.offset == session.size:
+        session = complete_upload(session)
+    return session
+
+
+# ----------------------------
+# Assembly
+# ----------------------------
+def complete_upload(session: UploadSession) -> UploadSession:
+    """
+    Verify the whole file against the declared checksum and attach it to
+    its target. On mismatch the staged bytes are discarded and the session
+    restarts from zero. If attaching fails the staged file is put back and
+    the session stays fully received, so completion can be retried.
+    """
+    path = staging_path(session)
+    digest = _hasher_at(session.pk, path, session.size).hexdigest()
+    if digest != session.checksum:
+        # A state kept from before another worker reset the upload would be
+        # stale; only the file itself can condemn the upload.
+        _forget_hasher(session.pk)
+        digest = _hasher_at(session.pk, path, session.size).hexdigest()
+    if digest != session.checksum:
+        path.unlink(missing_ok=True)
+        _forget_hasher(session.pk)
+        UploadSession.objects.filter(pk=session.pk).update(offset=0)
+        raise UploadError("File checksum mismatch; the upload has been reset.", 422, 0)
+
+    stored_name = None
+    try:
+        with transaction.atomic():
+            session = UploadSession.objects.select_for_update().get(pk=session.pk)
+            if session.status == "COMPLETED":
+                return session
+
+            if session.target == "EMPLOYEE_FILE":
+                result = EmployeeFile(employee_id=session.employee_id, file_title=session.title or session.filename)
+            else:
+                result = ProjectFile(project_id=session.project_id, details=session.title)
+
+            with open(path, "rb") as f:
+                result.file_url.save(session.filename, _StagedFile(f), save=False)
+            stored_name = result.file_url.name
+            result.save()
+
+            session.status = "COMPLETED"
+            session.result_id = result.pk
+            session.save(update_fields=["status", "result_id", "updated_at"])
+    except Exception as e:
+        if stored_name and not path.exists():
+            # The storage moved the staged file into place; move it back.
+            os.replace(result.file_url.storage.path(stored_name), path)
+        logger.error(f"Upload {session.pk} could not be attached, completion can be retried: {str(e)}")
+        raise
+
+    path.unlink(missing_ok=True)
+    _forget_hasher(session.pk)
+    logger.info(f"Upload {session.pk} assembled into {session.target} {result.pk}")
+    return session
+
+
+def abort_upload(session: UploadSession) -> None:
+    staging_path(session).unlink(missing_ok=True)
+    _forget_hasher(session.pk)
+    session.status = "ABORTED"
+    session.save(update_fields=["status", "updated_at"])
@@ -0,0 +1,189 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+from django.core.files.storage import default_storage
+from django.db import DatabaseError
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from project.models import Project, ProjectFile
+from users.models import User, EmployeeFile
+from uploads.models import UploadSession
+from uploads.services import staging_path
+
+
+@override_settings(UPLOAD_CHUNK_MAX_SIZE=1024)
+class ChunkedUploadTests(APITestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+
+        self.employee = User.objects.create_user(email="emp@gmail.com", password="testpass123")
+        self.other = User.objects.create_user(email="other@gmail.com", password="testpass123")
+        self.admin = User.objects.create_user(email="admin@gmail.com", password="testpass123", em_role="ADMIN")
+        self.content = os.urandom(2500)
+        self.authenticate(self.employee)
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def authenticate(self, user):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
+
+    def start(self, **overrides):
+        data = {
+            "filename": "../contract.pdf",
+            "size": len(self.content),
+            "checksum": hashlib.sha256(self.content).hexdigest(),
+            "target": "EMPLOYEE_FILE",
+            "employee": str(self.employee.pk),
+            "title": "Contract",
+        }
+        data.update(overrides)
+        return self.client.post(reverse("uploads:upload-create"), data, format="json")
+
+    def send(self, upload_id, start, end, checksum=None, body=None):
+        body = self.content[start:end + 1] if body is None else body
+        headers = {"HTTP_CONTENT_RANGE": f"bytes {start}-{end}/{len(self.content)}"}
+        if checksum:
+            headers["HTTP_X_CHUNK_CHECKSUM"] = checksum
+        return self.client.put(
+            reverse("uploads:upload-chunk", args=[upload_id]), body,
+            content_type="application/octet-stream", **headers
+        )
+
+    def test_upload_in_chunks(self):
+        response = self.start()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        upload_id = response.data["data"]["id"]
+        self.assertEqual(response.data["data"]["filename"], "contract.pdf")
+        self.assertEqual(response.data["data"]["chunk_size"], 1024)
+
+        chunk = self.content[:1024]
+        response = self.send(upload_id, 0, 1023, checksum=hashlib.sha256(chunk).hexdigest())
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"]["offset"], 1024)
+        self.send(upload_id, 1024, 2047)
+        response = self.send(upload_id, 2048, 2499)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        employee_file = EmployeeFile.objects.get(pk=response.data["data"]["result_id"])
+        self.assertEqual(employee_file.employee, self.employee)
+        self.assertEqual(employee_file.file_title, "Contract")
+        with default_storage.open(employee_file.file_url.name) as f:
+            self.assertEqual(f.read(), self.content)
+        self.assertFalse(staging_path(UploadSession.objects.get()).exists())
+
+    def test_resume_after_interrupted_chunk(self):
+        upload_id = self.start().data["data"]["id"]
+        self.send(upload_id, 0, 1023)
+
+        # The connection dropped mid-chunk: only part of the body arrived.
+        response = self.send(upload_id, 1024, 2047, body=self.content[1024:1500])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(reverse("uploads:upload-chunk", args=[upload_id]))
+        self.assertEqual(response.data["data"]["offset"], 1024)
+        self.assertEqual(os.path.getsize(staging_path(UploadSession.objects.get())), 1024)
+
+        self.send(upload_id, 1024, 2047)
+        self.assertEqual(self.send(upload_id, 2048, 2499).status_code, status.HTTP_201_CREATED)
+
+    def test_out_of_order_chunk_reports_offset(self):
+        upload_id = self.start().data["data"]["id"]
+        response = self.send(upload_id, 1024, 2047)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data["data"]["offset"], 0)
+
+    def test_staged_bytes_are_the_source_of_truth(self):
+        upload_id = self.start().data["data"]["id"]
+        self.send(upload_id, 0, 1023)
+        # A chunk reached the disk but its worker died before recording it.
+        with open(staging_path(UploadSession.objects.get()), "ab") as f:
+            f.write(self.content[1024:2048])
+
+        response = self.send(upload_id, 1024, 2047)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data["data"]["offset"], 2048)
+
+        response = self.send(upload_id, 2048, 2499)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        employee_file = EmployeeFile.objects.get()
+        with default_storage.open(employee_file.file_url.name) as f:
+            self.assertEqual(f.read(), self.content)
+
+    def test_failed_completion_can_be_retried(self):
+        upload_id = self.start().data["data"]["id"]
+        self.send(upload_id, 0, 1023)
+        self.send(upload_id, 1024, 2047)
+        with patch.object(EmployeeFile, "save", side_effect=DatabaseError("connection lost")):
+            with self.assertRaises(DatabaseError):
+                self.send(upload_id, 2048, 2499)
+
+        session = UploadSession.objects.get()
+        self.assertEqual((session.status, session.offset), ("IN_PROGRESS", 2500))
+        self.assertEqual(os.path.getsize(staging_path(session)), 2500)
+
+        response = self.send(upload_id, 2048, 2499)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        employee_file = EmployeeFile.objects.get(pk=response.data["data"]["result_id"])
+        with default_storage.open(employee_file.file_url.name) as f:
+            self.assertEqual(f.read(), self.content)
+
+    def test_empty_body_rejected(self):
+        upload_id = self.start().data["data"]["id"]
+        response = self.send(upload_id, 0, 1023, body=b"")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(UploadSession.objects.get().offset, 0)
+
+    def test_chunk_too_large(self):
+        upload_id = self.start().data["data"]["id"]
+        response = self.send(upload_id, 0, 2047)
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+    def test_chunk_checksum_mismatch(self):
+        upload_id = self.start().data["data"]["id"]
+        response = self.send(upload_id, 0, 1023, checksum="0" * 64)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(UploadSession.objects.get().offset, 0)
+
+    def test_file_checksum_mismatch_resets_upload(self):
+        upload_id = self.start(checksum="a" * 64).data["data"]["id"]
+        self.send(upload_id, 0, 1023)
+        self.send(upload_id, 1024, 2047)
+        response = self.send(upload_id, 2048, 2499)
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(UploadSession.objects.get().offset, 0)
+        self.assertFalse(EmployeeFile.objects.exists())
+
+    def test_cannot_upload_for_other_employee(self):
+        response = self.start(employee=str(self.other.pk))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_other_user_cannot_touch_session(self):
+        upload_id = self.start().data["data"]["id"]
+        self.authenticate(self.other)
+        self.assertEqual(self.send(upload_id, 0, 1023).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_admin_uploads_project_file(self):
+        project = Project.objects.create(name="Apollo")
+        self.authenticate(self.admin)
+        response = self.start(target="PROJECT_FILE", project=str(project.pk), employee=None)
+        upload_id = response.data["data"]["id"]
+        for start in (0, 1024, 2048):
+            response = self.send(upload_id, start, min(start + 1023, 2499))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(ProjectFile.objects.get().project, project)
+
+    def test_abort(self):
+        upload_id = self.start().data["data"]["id"]
+        self.send(upload_id, 0, 1023)
+        response = self.client.delete(reverse("uploads:upload-chunk", args=[upload_id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.send(upload_id, 1024, 2047).status_code, status.HTTP_409_CONFLICT)
@@ -0,0 +1,12 @@
+from django.urls import path
+from .views import UploadSessionCreateView, UploadChunkView
+
+app_name = "uploads"
+
+urlpatterns = [
+    # ----------------------------
+    # Chunked Uploads
+    # ----------------------------
+    path("", UploadSessionCreateView.as_view(), name="upload-create"),
+    path("<uuid:pk>/", UploadChunkView.as_view(), name="upload-chunk"),
+]
@@ -0,0 +1,118 @@
+import re
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+import logging
+
+from core.utils import api_response
+from users.throttles import GeneralThrottle, UploadChunkThrottle
+from .models import UploadSession
+from .serializers import UploadSessionSerializer
+from .services import UploadError, abort_upload, chunk_max_size, write_chunk
+
+logger = logging.getLogger(__name__)
+
+CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+
+
+# ----------------------------
+# Start Upload
+# ----------------------------
+class UploadSessionCreateView(APIView):
+    """
+    Start a chunked upload. The response carries the session id, the
+    current offset and the maximum chunk size the server accepts.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [GeneralThrottle]
+
+    def post(self, request, *args, **kwargs):
+        serializer = UploadSessionSerializer(data=request.data, context={"request": request})
+        serializer.is_valid(raise_exception=True)
+        session = serializer.save(owner=request.user)
+        logger.info(f"User {request.user.email} started upload {session.pk} ({session.size} bytes)")
+        return api_response(
+            message="Upload started",
+            data={**serializer.data, "chunk_size": chunk_max_size()},
+            status_code=status.HTTP_201_CREATED
+        )
+
+
+# ----------------------------
+# Upload Chunks
+# ----------------------------
+class UploadChunkView(APIView):
+    """
+    ``GET`` returns the session (clients resume from ``offset``), ``PUT``
+    appends one chunk sent as the raw request body with a
+    ``Content-Range: bytes <start>-<end>/<size>`` header and an optional
+    ``X-Chunk-Checksum`` SHA-256, and ``DELETE`` aborts the upload. If
+    the last chunk arrived but the file could not be attached, resending
+    it retries completion.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UploadChunkThrottle]
+
+    def get_session(self, request, pk):
+        return UploadSession.objects.filter(pk=pk, owner=request.user).first()
+
+    def not_found(self):
+        return api_response(status_str="error", message="Upload not found", status_code=status.HTTP_404_NOT_FOUND)
+
+    def get(self, request, pk, *args, **kwargs):
+        session = self.get_session(request, pk)
+        if session is None:
+            return self.not_found()
+        return api_response(message="Upload status", data=UploadSessionSerializer(session).data)
+
+    def put(self, request, pk, *args, **kwargs):
+        session = self.get_session(request, pk)
+        if session is None:
+            return self.not_found()
+
+        match = CONTENT_RANGE_RE.match(request.headers.get("Content-Range", ""))
+        if not match or int(match.group(3)) != session.size or int(match.group(2)) < int(match.group(1)):
+            return api_response(
+                status_str="error",
+                message="A valid Content-Range header is required",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        start, end = int(match.group(1)), int(match.group(2))
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            content_length = -1
+        # DRF exposes no stream at all for an empty body.
+        if request.stream is None or content_length != end - start + 1:
+            return api_response(
+                status_str="error",
+                message="The request body must hold exactly the bytes of the Content-Range",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            # Read the raw request stream: request.data is never touched, so
+            # the chunk is neither parsed nor buffered.
+            session = write_chunk(
+                session.pk, request.stream, start, end - start + 1, request.headers.get("X-Chunk-Checksum")
+            )
+        except UploadError as e:
+            logger.warning(f"Upload {pk} chunk rejected: {str(e)}")
+            return api_response(
+                status_str="error",
+                message=str(e),
+                data={"offset": e.offset} if e.offset is not None else None,
+                status_code=e.status_code
+            )
+
+        data = UploadSessionSerializer(session).data
+        if session.status == "COMPLETED":
+            return api_response(message="Upload completed", data=data, status_code=status.HTTP_201_CREATED)
+        return api_response(message="Chunk received", data=data)
+
+    def delete(self, request, pk, *args, **kwargs):
+        session = self.get_session(request, pk)
+        if session is None:
+            return self.not_found()
+        abort_upload(session)
+        return api_response(message="Upload aborted", status_code=status.HTTP_200_OK)
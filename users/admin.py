@@ -1,4 +1,5 @@
-from .models import User
+from .models import User, EmployeeFile
+from .images import queue_profile_image
 from django.contrib import admin
 from designation.models import Designation
 from department.models import Department
@@ -57,11 +58,17 @@ class UserAdmin(BaseUserAdmin):
     search_fields = ("email", "em_id")
     ordering = ("email",)
     filter_horizontal = ("groups", "user_permissions")
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if "em_image" in form.changed_data and obj.em_image:
+            queue_profile_image(obj)
     
 
 # ----------------------------
 # Register Models in Admin
 # ----------------------------
 admin.site.register(User, UserAdmin)
+admin.site.register(EmployeeFile)
 admin.site.register(Department)
 admin.site.register(Designation)
@@ -3,3 +3,11 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        # Load the common-password list now, so preloaded gunicorn workers
+        # share it instead of each decompressing it on first signup.
+        from .validators import preload
+        preload()
@@ -0,0 +1,28 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+UserModel = get_user_model()
+
+# Everything the login path reads: credentials, the active/verified checks,
+# the token claims, and ``em_id`` (``User.save`` reads it when a password
+# is rehashed).
+LOGIN_FIELDS = ("id", "email", "password", "is_active", "is_verified", "em_role", "em_id")
+
+
+class EmailBackend(ModelBackend):
+    """``ModelBackend`` that loads only the columns login needs, in one query."""
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = UserModel._default_manager.only(*LOGIN_FIELDS).get(**{UserModel.USERNAME_FIELD: username})
+        except UserModel.DoesNotExist:
+            # Run the hasher anyway so unknown emails take as long as wrong passwords.
+            UserModel().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
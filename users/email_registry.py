@@ -0,0 +1,83 @@
+"""
+Redis set of registered emails, so the duplicate-signup check for a new
+email, the common case, is answered without a database query.
+
+The set is a hint: the unique constraint on ``User.email`` stays
+authoritative and registration turns an IntegrityError into the usual
+"already exists" error. Only a negative answer is trusted as is. A member
+may be stale, so callers confirm a hit against the database.
+``is_registered`` returns None whenever the set can't answer (Redis down,
+or the set not warmed / evicted) and callers then query the database. A
+warm marker lives inside the set itself, so an evicted set can never look
+warm.
+
+``warm_email_registry`` builds the set; signals keep it current on create,
+email change and delete. Bulk operations (``bulk_create``,
+``QuerySet.update``) bypass the signals, so re-warm after them.
+"""
+import logging
+from typing import Optional
+
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+KEY = "users:emails"
+# Never a valid email, so it can't collide with a member.
+WARM_MARKER = "\x00warm"
+
+
+def _redis():
+    from django_redis import get_redis_connection
+    return get_redis_connection("default")
+
+
+def is_registered(email: str) -> Optional[bool]:
+    """Whether ``email`` is taken, or None when the set can't tell."""
+    try:
+        pipe = _redis().pipeline(transaction=False)
+        pipe.sismember(KEY, WARM_MARKER)
+        pipe.sismember(KEY, email)
+        warm, member = pipe.execute()
+    except Exception as e:
+        logger.debug(f"Email registry unavailable: {str(e)}")
+        return None
+    return bool(member) if warm else None
+
+
+def _apply(method: str, email: str) -> None:
+    try:
+        getattr(_redis(), method)(KEY, email)
+    except Exception as e:
+        # A missed add only costs a database query later; a missed remove
+        # blocks re-registering that email until the next warm.
+        logger.warning(f"Email registry {method} failed for {email}: {str(e)}")
+
+
+def add(email: str) -> None:
+    transaction.on_commit(lambda: _apply("sadd", email))
+
+
+def remove(email: str) -> None:
+    transaction.on_commit(lambda: _apply("srem", email))
+
+
+def warm(batch_size: int = 5000) -> int:
+    """Rebuild the set from the database and swap it in atomically."""
+    from .models import User
+
+    client = _redis()
+    staging = f"{KEY}:warming"
+    client.delete(staging)
+    count = 0
+    batch = []
+    for email in User.objects.values_list("email", flat=True).iterator(chunk_size=batch_size):
+        batch.append(email)
+        if len(batch) == batch_size:
+            client.sadd(staging, *batch)
+            count += len(batch)
+            batch = []
+    client.sadd(staging, *batch, WARM_MARKER)
+    count += len(batch)
+    client.rename(staging, KEY)
+    return count
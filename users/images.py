@@ -0,0 +1,126 @@
+"""
+Profile image pipeline. An uploaded ``em_image`` is decoded once, rotated
+according to its EXIF orientation and re-encoded into fixed-size WebP and
+JPEG variants without any metadata. Variants are stored under the hash of
+their content, so identical images share files and URLs can be cached
+forever.
+"""
+import hashlib
+import logging
+from io import BytesIO
+from threading import Thread
+from typing import Dict, Optional
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+PROFILE_IMAGE_DIR = "images/employee/profile"
+# Largest first: each variant is downscaled from the previous one.
+PROFILE_IMAGE_SIZES = (("large", 1024), ("medium", 256), ("small", 64))
+PROFILE_IMAGE_FORMATS = (
+    ("webp", "WEBP", {"quality": 80, "method": 4}),
+    ("jpeg", "JPEG", {"quality": 85, "optimize": True}),
+)
+DEFAULT_IMAGE_SIZE = "medium"
+
+
+# ----------------------------
+# Encoding
+# ----------------------------
+def _store(content: bytes, ext: str) -> str:
+    digest = hashlib.sha256(content).hexdigest()
+    name = f"{PROFILE_IMAGE_DIR}/{digest[:2]}/{digest}.{ext}"
+    if not default_storage.exists(name):
+        default_storage.save(name, ContentFile(content))
+    return name
+
+
+def build_variants(source) -> Dict[str, Dict[str, str]]:
+    """
+    Decode ``source`` (a path or file object) once and store every size and
+    format. Returns ``{size: {format: storage name}}``.
+    """
+    # Pillow is only needed by the background thread, not at worker startup.
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as image:
+        # Let the JPEG decoder downscale while decoding instead of
+        # materializing a full-resolution phone photo.
+        image.draft("RGB", (PROFILE_IMAGE_SIZES[0][1],) * 2)
+        image = ImageOps.exif_transpose(image).convert("RGB")
+
+    variants = {}
+    for size_name, size in PROFILE_IMAGE_SIZES:
+        image.thumbnail((size, size), Image.LANCZOS)
+        variants[size_name] = {}
+        for ext, pil_format, options in PROFILE_IMAGE_FORMATS:
+            buffer = BytesIO()
+            # No ``exif=`` argument: re-encoded files carry no metadata.
+            image.save(buffer, pil_format, **options)
+            variants[size_name][ext] = _store(buffer.getvalue(), ext)
+    return variants
+
+
+# ----------------------------
+# Processing
+# ----------------------------
+def process_profile_image(user_id, source_name: str) -> Optional[Dict[str, Dict[str, str]]]:
+    """
+    Build variants for the upload stored at ``source_name`` and point the
+    user's ``em_image`` at the large JPEG. The raw upload (which still
+    carries EXIF) is deleted, and is never served meanwhile (see
+    ``core.media``). If the user has uploaded another image in the
+    meantime the result is discarded.
+    """
+    from .models import User
+
+    try:
+        with default_storage.open(source_name, "rb") as source:
+            variants = build_variants(source)
+    except Exception as e:
+        logger.error(f"Profile image processing failed for user {user_id}: {str(e)}")
+        return None
+
+    updated = User.objects.filter(pk=user_id, em_image=source_name).update(
+        em_image=variants["large"]["jpeg"], em_image_variants=variants
+    )
+    if updated:
+        default_storage.delete(source_name)
+        logger.info(f"Profile image processed for user {user_id}")
+    return variants if updated else None
+
+
+def _process_in_thread(user_id, source_name: str) -> None:
+    try:
+        process_profile_image(user_id, source_name)
+    finally:
+        # Outside the request cycle nothing else hands this thread's
+        # (pooled) connection back.
+        connection.close()
+
+
+def queue_profile_image(user) -> None:
+    """
+    Process the user's freshly saved upload in a background thread once
+    the surrounding transaction commits, keeping Pillow off the request.
+    """
+    user_id, source_name = user.pk, user.em_image.name
+    transaction.on_commit(lambda: Thread(
+        target=_process_in_thread,
+        args=(user_id, source_name),
+        daemon=True
+    ).start())
+
+
+# ----------------------------
+# URL Selection
+# ----------------------------
+def variant_name(variants: Dict[str, Dict[str, str]], size: str = DEFAULT_IMAGE_SIZE, webp: bool = True) -> Optional[str]:
+    """Storage name of the requested variant, falling back to the default size."""
+    if not variants:
+        return None
+    formats = variants.get(size) or variants.get(DEFAULT_IMAGE_SIZE) or {}
+    return formats.get("webp" if webp else "jpeg")
@@ -0,0 +1,228 @@
+"""
+Load-test scenarios for the accounts API, driven by the ``loadtest_accounts``
+command against a running server.
+
+The runner reads OTPs straight from the database, so it must use the same
+database settings as the server under test. Start the server with a dummy
+mail backend and throttle rates high enough for the load, e.g.::
+
+    EMAIL_BACKEND=django.core.mail.backends.dummy.EmailBackend \\
+    LOGIN_THROTTLE_RATE=100000/hour OTP_THROTTLE_RATE=100000/hour \\
+    GENERAL_THROTTLE_SAFE_RATE=100000/hour gunicorn hrms.wsgi:application
+
+Seeded users (``seed_users``) are split between workers so no two workers
+touch the same account.
+"""
+import http.client
+import json
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Callable, Dict, List
+from urllib.parse import urlsplit
+
+from django.db import connections
+
+from .models import PasswordResetToken, User
+
+API_PREFIX = "/api/v1/accounts"
+SEED_EMAIL = "{prefix}{index}@loadtest.local"
+SEED_PASSWORD = "LoadTest#Pass123"
+
+
+class ScenarioError(Exception):
+    pass
+
+
+# ----------------------------
+# HTTP Client
+# ----------------------------
+class Client:
+    """Keep-alive JSON client that records the latency of every step."""
+
+    def __init__(self, base_url: str, timings: Dict[str, List[float]], errors: Dict[str, int]):
+        parts = urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.connection = connection_class(parts.netloc, timeout=30)
+        self.prefix = parts.path.rstrip("/") + API_PREFIX
+        self.timings = timings
+        self.errors = errors
+        self.access = None
+
+    def request(self, step: str, method: str, path: str, body: dict, expect: int = 200) -> dict:
+        headers = {"Content-Type": "application/json"}
+        if self.access:
+            headers["Authorization"] = f"Bearer {self.access}"
+
+        started = time.perf_counter()
+        try:
+            self.connection.request(method, self.prefix + path, json.dumps(body), headers)
+            response = self.connection.getresponse()
+            raw = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            self.connection.close()
+            self.errors[step] += 1
+            raise ScenarioError(f"{step}: {str(e)}")
+        self.timings[step].append(time.perf_counter() - started)
+
+        if response.status != expect:
+            self.errors[step] += 1
+            raise ScenarioError(f"{step}: HTTP {response.status} {raw[:200]!r}")
+        return json.loads(raw) if raw else {}
+
+    def post(self, step: str, path: str, body: dict, expect: int = 200) -> dict:
+        return self.request(step, "POST", path, body, expect)
+
+    def close(self):
+        self.connection.close()
+
+
+def _otp(email: str) -> str:
+    return User.objects.filter(email=email).values_list("otp", flat=True).first()
+
+
+def _reset_otp(token: str) -> str:
+    return PasswordResetToken.objects.filter(
+        token_hash=PasswordResetToken.hash_token(token)
+    ).values_list("otp", flat=True).first()
+
+
+# ----------------------------
+# Scenarios
+# ----------------------------
+def registration(client: Client, _seeded_email: str) -> None:
+    """register → verify-otp → login → refresh → logout for a new account."""
+    email = f"reg-{uuid.uuid4().hex}@loadtest.local"
+    client.post("register", "/register/", {
+        "email": email, "password": SEED_PASSWORD, "password_confirm": SEED_PASSWORD,
+    }, expect=201)
+    client.post("verify-otp", "/verify-otp/", {"email": email, "otp": _otp(email)})
+    tokens = client.post("login", "/login/", {"email": email, "password": SEED_PASSWORD})
+    tokens = client.post("refresh", "/token/refresh/", {"refresh": tokens["refresh"]})
+    client.access = tokens["access"]
+    try:
+        client.post("logout", "/logout/", {"refresh": tokens["refresh"]}, expect=205)
+    finally:
+        client.access = None
+
+
+def password_reset(client: Client, email: str) -> None:
+    """forgot-password → reset-password → login for a seeded account."""
+    data = client.post("forgot-password", "/forgot-password/", {"email": email})["data"]
+    client.post("reset-password", "/reset-password/", {
+        "email": email, "otp": _reset_otp(data["token"]), "token": data["token"],
+        "new_password": SEED_PASSWORD, "new_password_confirm": SEED_PASSWORD,
+    })
+    client.post("login", "/login/", {"email": email, "password": SEED_PASSWORD})
+
+
+def change_password(client: Client, email: str) -> None:
+    """login → change-password for a seeded account (to the same password)."""
+    tokens = client.post("login", "/login/", {"email": email, "password": SEED_PASSWORD})
+    client.access = tokens["access"]
+    try:
+        client.request("change-password", "PUT", "/change-password/", {
+            "old_password": SEED_PASSWORD, "new_password": SEED_PASSWORD, "new_password_confirm": SEED_PASSWORD,
+        })
+    finally:
+        client.access = None
+
+
+SCENARIOS: Dict[str, Callable[[Client, str], None]] = {
+    "registration": registration,
+    "password-reset": password_reset,
+    "change-password": change_password,
+}
+
+
+# ----------------------------
+# Runner
+# ----------------------------
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples``."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize(samples: List[float], errors: int, elapsed: float) -> Dict[str, float]:
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 2) if samples else 0.0,
+        "p50_ms": round(percentile(samples, 50) * 1000, 2),
+        "p95_ms": round(percentile(samples, 95) * 1000, 2),
+        "p99_ms": round(percentile(samples, 99) * 1000, 2),
+        "max_ms": round(max(samples, default=0) * 1000, 2),
+    }
+
+
+def run_scenario(
+    name: str,
+    base_url: str,
+    concurrency: int,
+    iterations: int,
+    seeded: int,
+    prefix: str = "loadtest",
+) -> Dict[str, object]:
+    """
+    Run ``iterations`` of scenario ``name`` on each of ``concurrency``
+    threads and return latency percentiles and throughput per step and for
+    the scenario as a whole.
+    """
+    scenario = SCENARIOS[name]
+    if name != "registration" and seeded < concurrency:
+        raise ScenarioError(f"'{name}' needs at least {concurrency} seeded users; run seed_users first.")
+
+    timings: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    scenario_times: List[float] = []
+    failures: List[str] = []
+    lock = threading.Lock()
+
+    def worker(index):
+        local_timings, local_errors, local_scenarios = defaultdict(list), defaultdict(int), []
+        client = Client(base_url, local_timings, local_errors)
+        try:
+            for i in range(iterations):
+                # Worker w owns seeded users w, w + concurrency, ...
+                slot = (index + i * concurrency) % max(seeded - seeded % concurrency, concurrency)
+                email = SEED_EMAIL.format(prefix=prefix, index=slot)
+                started = time.perf_counter()
+                try:
+                    scenario(client, email)
+                    local_scenarios.append(time.perf_counter() - started)
+                except ScenarioError as e:
+                    with lock:
+                        failures.append(str(e))
+        finally:
+            client.close()
+            connections.close_all()
+            with lock:
+                for step, samples in local_timings.items():
+                    timings[step].extend(samples)
+                for step, count in local_errors.items():
+                    errors[step] += count
+                scenario_times.extend(local_scenarios)
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "scenario": name,
+        "concurrency": concurrency,
+        "iterations": iterations,
+        "elapsed_seconds": round(elapsed, 3),
+        "total": summarize(scenario_times, len(failures), elapsed),
+        "steps": {step: summarize(timings[step], errors[step], elapsed) for step in {**timings, **errors}},
+        "sample_failures": failures[:5],
+    }
@@ -0,0 +1,99 @@
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from users.loadtest import SCENARIOS, SEED_EMAIL, ScenarioError, run_scenario
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the accounts API load-test scenarios against a running server and "
+        "report p50/p95/p99 latency and throughput per step. See users/loadtest.py."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="Server under test.")
+        parser.add_argument(
+            "--scenario", action="append", choices=sorted(SCENARIOS),
+            help="Scenario to run (repeatable); all by default."
+        )
+        parser.add_argument("--concurrency", type=int, default=4, help="Concurrent clients.")
+        parser.add_argument("--iterations", type=int, default=10, help="Scenario runs per client.")
+        parser.add_argument("--prefix", default="loadtest", help="Email prefix used by seed_users.")
+        parser.add_argument("--output", help="Write the results as JSON to this file.")
+        parser.add_argument("--compare", help="Earlier JSON results to compare p50/p95/p99 against.")
+
+    def handle(self, *args, **options):
+        domain = SEED_EMAIL.split("@", 1)[1]
+        seeded = User.objects.filter(email__startswith=options["prefix"], email__endswith=f"@{domain}").count()
+
+        results = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "commit": self._commit(),
+            "base_url": options["base_url"],
+            "database": connection.vendor,
+            "python": platform.python_version(),
+            "scenarios": {},
+        }
+        for name in options["scenario"] or sorted(SCENARIOS):
+            try:
+                result = run_scenario(
+                    name, options["base_url"], options["concurrency"], options["iterations"], seeded, options["prefix"]
+                )
+            except ScenarioError as e:
+                raise CommandError(str(e))
+            results["scenarios"][name] = result
+            self._report(result)
+
+        if options["compare"]:
+            with open(options["compare"]) as f:
+                self._compare(json.load(f), results)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(results, f, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+    def _commit(self):
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"], cwd=settings.BASE_DIR,
+                capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def _report(self, result):
+        total = result["total"]
+        self.stdout.write(
+            f"\n{result['scenario']}: {total['requests']} runs, {total['errors']} failed, "
+            f"{total['throughput_rps']} runs/s"
+        )
+        self.stdout.write(f"  {'step':<18} {'req':>6} {'err':>5} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        for step, row in [*result["steps"].items(), ("(scenario)", total)]:
+            self.stdout.write(
+                f"  {step:<18} {row['requests']:>6} {row['errors']:>5} {row['throughput_rps']:>8} "
+                f"{row['p50_ms']:>9} {row['p95_ms']:>9} {row['p99_ms']:>9}"
+            )
+        for failure in result["sample_failures"]:
+            self.stdout.write(self.style.WARNING(f"  {failure}"))
+
+    def _compare(self, baseline, results):
+        self.stdout.write(f"\nCompared with {baseline.get('commit') or 'baseline'} (negative is faster):")
+        for name, result in results["scenarios"].items():
+            before = baseline.get("scenarios", {}).get(name)
+            if not before:
+                continue
+            for step, row in [*result["steps"].items(), ("(scenario)", result["total"])]:
+                old = before["total"] if step == "(scenario)" else before["steps"].get(step)
+                if not old:
+                    continue
+                deltas = "  ".join(
+                    f"{key[:3]} {row[key] - old[key]:+.1f}ms" for key in ("p50_ms", "p95_ms", "p99_ms")
+                )
+                self.stdout.write(f"  {name:<16} {step:<18} {deltas}")
@@ -0,0 +1,42 @@
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.utils.crypto import get_random_string
+
+from users.loadtest import SEED_EMAIL, SEED_PASSWORD
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = "Create N verified employees for load tests (all share one password)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("count", type=int, help="Number of users to create.")
+        parser.add_argument("--prefix", default="loadtest", help="Email prefix of the seeded users.")
+        parser.add_argument("--password", default=SEED_PASSWORD, help="Password of every seeded user.")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--delete", action="store_true", help="Delete previously seeded users instead.")
+
+    def handle(self, *args, **options):
+        domain = SEED_EMAIL.split("@", 1)[1]
+        if options["delete"]:
+            deleted, _ = User.objects.filter(
+                email__startswith=options["prefix"], email__endswith=f"@{domain}"
+            ).delete()
+            self.stdout.write(f"Deleted {deleted} rows.")
+            return
+
+        # Hashing once keeps seeding fast; every user gets the same hash.
+        password = make_password(options["password"])
+        users = [
+            User(
+                email=SEED_EMAIL.format(prefix=options["prefix"], index=index),
+                password=password,
+                # bulk_create skips User.save(), which assigns em_id.
+                em_id=f"EMP-{get_random_string(8).upper()}",
+                em_role="EMPLOYEE",
+                is_verified=True,
+            )
+            for index in range(options["count"])
+        ]
+        User.objects.bulk_create(users, batch_size=options["batch_size"], ignore_conflicts=True)
+        self.stdout.write(self.style.SUCCESS(f"Seeded {len(users)} users."))
@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from users import sweeper
+
+
+class Command(BaseCommand):
+    help = "Clear expired OTPs and password resets and purge stale unverified accounts in small batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=getattr(settings, "USER_SWEEP_BATCH_SIZE", 500))
+        parser.add_argument(
+            "--max-batch-ms", type=int, default=getattr(settings, "USER_SWEEP_MAX_BATCH_MS", 200),
+            help="Batches slower than this are halved, to bound how long row locks are held.",
+        )
+        parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches.")
+        parser.add_argument(
+            "--max-age-days", type=int, default=getattr(settings, "UNVERIFIED_USER_MAX_AGE_DAYS", 7),
+            help="Delete unverified accounts older than this.",
+        )
+        parser.add_argument("--skip-otps", action="store_true")
+        parser.add_argument("--skip-unverified", action="store_true")
+
+    def handle(self, *args, **options):
+        batching = {
+            "batch_size": options["batch_size"],
+            "max_batch_ms": options["max_batch_ms"],
+            "pause": options["pause"],
+        }
+        if not options["skip_otps"]:
+            stats = sweeper.clear_expired_otps(**batching)
+            self.stdout.write(f"Expired OTPs cleared: {stats['rows']} ({stats['batches']} batches, {stats['slow_batches']} slow)")
+            stats = sweeper.purge_expired_reset_tokens(**batching)
+            self.stdout.write(f"Expired password resets deleted: {stats['rows']} ({stats['batches']} batches, {stats['slow_batches']} slow)")
+        if not options["skip_unverified"]:
+            stats = sweeper.purge_unverified_users(options["max_age_days"], **batching)
+            self.stdout.write(f"Unverified users purged: {stats['rows']} ({stats['batches']} batches, {stats['slow_batches']} slow)")
+        self.stdout.write(self.style.SUCCESS("Sweep complete."))
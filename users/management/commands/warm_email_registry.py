@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from users import email_registry
+
+
+class Command(BaseCommand):
+    help = "Rebuild the Redis set of registered emails used by duplicate-signup checks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        count = email_registry.warm(options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Email registry warmed with {count} emails."))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 08:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_alter_user_em_blood_group_alter_user_em_gender'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='em_image_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-19 08:28
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_user_em_image_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmployeeFile',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('file_title', models.CharField(blank=True, max_length=512, null=True)),
+                ('file_url', models.FileField(upload_to='employee_files/')),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='files', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 09:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('designation', '0001_initial'),
+        ('users', '0005_employeefile'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('otp__isnull', False)), fields=['otp_created_at'], name='users_otp_created_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_verified', False)), fields=['date_joined'], name='users_unverified_joined_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.6 on 2026-10-19 09:42
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_user_sweeper_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='user',
+            name='reset_password_token',
+        ),
+        migrations.RemoveField(
+            model_name='user',
+            name='reset_password_token_created_at',
+        ),
+        migrations.RemoveField(
+            model_name='user',
+            name='is_reset_otp',
+        ),
+        migrations.CreateModel(
+            name='PasswordResetToken',
+            fields=[
+                ('token_hash', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('otp', models.CharField(max_length=6)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reset_tokens', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -1,6 +1,7 @@
+import hashlib
 import uuid
 from datetime import timedelta
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.utils.crypto import get_random_string
@@ -14,8 +15,8 @@ from core.constants import ROLE_CHOICES, STATUS_CHOICES, GENDER_CHOICES, BLOOD_G
 class User(AbstractBaseUser, PermissionsMixin):
     """
     Custom User model for HRMS.
-    Includes authentication, employee details, OTP handling,
-    and password reset token support.
+    Includes authentication, employee details and OTP handling;
+    password resets live in ``PasswordResetToken``.
     """
 
     # ----------------------------
@@ -46,6 +47,7 @@ class User(AbstractBaseUser, PermissionsMixin):
     em_joining_date = models.DateField(blank=True, null=True)
     em_contract_end = models.DateField(blank=True, null=True)
     em_image = models.ImageField(upload_to="images/employee/profile/", blank=True, null=True)
+    em_image_variants = models.JSONField(default=dict, blank=True)
     em_nid = models.CharField(max_length=64, blank=True, null=True)
 
     # ----------------------------
@@ -54,13 +56,6 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_verified = models.BooleanField(default=False)
     otp = models.CharField(max_length=6, blank=True, null=True)
     otp_created_at = models.DateTimeField(blank=True, null=True)
-    is_reset_otp = models.BooleanField(default=False)
-
-    # ----------------------------
-    # Password Reset
-    # ----------------------------
-    reset_password_token = models.UUIDField(blank=True, null=True)
-    reset_password_token_created_at = models.DateTimeField(blank=True, null=True)
 
     # ----------------------------
     # Permissions & Auth
@@ -73,6 +68,22 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
 
+    class Meta:
+        indexes = [
+            # Partial indexes for the sweeper (users/sweeper.py): only rows
+            # holding an OTP, and only unverified accounts, are indexed.
+            models.Index(
+                fields=["otp_created_at"],
+                condition=models.Q(otp__isnull=False),
+                name="users_otp_created_at_idx",
+            ),
+            models.Index(
+                fields=["date_joined"],
+                condition=models.Q(is_verified=False),
+                name="users_unverified_joined_idx",
+            ),
+        ]
+
     # ----------------------------
     # Managers
     # ----------------------------
@@ -87,6 +98,13 @@ class User(AbstractBaseUser, PermissionsMixin):
             self.em_id = f"EMP-{get_random_string(8).upper()}"
         super().save(*args, **kwargs)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Lets the email registry notice email changes (users/signals.py).
+        instance._loaded_email = instance.__dict__.get("email")
+        return instance
+
     def __str__(self):
         return self.email
 
@@ -98,16 +116,15 @@ class User(AbstractBaseUser, PermissionsMixin):
     # ----------------------------
     # OTP Methods
     # ----------------------------
-    def set_otp(self, otp, reset=False):
-        """Assign OTP to user (reset=True for password reset OTPs)."""
+    def set_otp(self, otp):
+        """Assign a signup verification OTP to the user."""
         self.otp = otp
-        self.is_reset_otp = reset
         self.otp_created_at = timezone.now()
-        self.save(update_fields=["otp", "otp_created_at", "is_reset_otp"])
+        self.save(update_fields=["otp", "otp_created_at"])
 
-    def verify_otp(self, otp, reset=False, expiry_minutes=10):
+    def verify_otp(self, otp, expiry_minutes=10):
         """Verify OTP (valid for 10 minutes by default)."""
-        if self.otp != otp or self.is_reset_otp != reset:
+        if self.otp != otp:
             return False
         if self.otp_created_at and timezone.now() > self.otp_created_at + timedelta(minutes=expiry_minutes):
             return False
@@ -119,32 +136,72 @@ class User(AbstractBaseUser, PermissionsMixin):
         """Clear OTP after use or expiry."""
         self.otp = None
         self.otp_created_at = None
-        self.is_reset_otp = False
-        self.save(update_fields=["otp", "otp_created_at", "is_reset_otp"])
+        self.save(update_fields=["otp", "otp_created_at"])
 
-    # ----------------------------
-    # Password Reset Token Methods
-    # ----------------------------
-    def set_reset_password_token(self):
-        """Generate a password reset token with timestamp."""
-        self.reset_password_token = uuid.uuid4()
-        self.reset_password_token_created_at = timezone.now()
-        self.save(update_fields=["reset_password_token", "reset_password_token_created_at"])
-        return self.reset_password_token
-
-    def verify_reset_password_token(self, token, expiry_minutes=30):
-        """Verify if reset token is valid (default expiry: 30 minutes)."""
-        if str(self.reset_password_token) != str(token):
-            return False
-        if (
-            self.reset_password_token_created_at
-            and timezone.now() > self.reset_password_token_created_at + timedelta(minutes=expiry_minutes)
-        ):
-            return False
-        return True
 
-    def clear_reset_password_token(self):
-        """Clear reset token after use or expiry."""
-        self.reset_password_token = None
-        self.reset_password_token_created_at = None
-        self.save(update_fields=["reset_password_token", "reset_password_token_created_at"])
+# ----------------------------
+# Password Reset Token Model
+# ----------------------------
+class PasswordResetToken(models.Model):
+    """
+    Pending password reset: the token handed to the client and the OTP
+    emailed to the user. Only the SHA-256 of the token is stored, as the
+    primary key, so a reset is validated with one indexed lookup and a
+    database leak doesn't expose usable tokens. Expired rows are deleted by
+    ``sweep_users``.
+    """
+    VALIDITY_MINUTES = 10
+
+    token_hash = models.CharField(max_length=64, primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="reset_tokens")
+    otp = models.CharField(max_length=6)
+    expires_at = models.DateTimeField(db_index=True)
+
+    @staticmethod
+    def hash_token(token) -> str:
+        return hashlib.sha256(str(token).encode()).hexdigest()
+
+    @classmethod
+    def issue(cls, user, otp):
+        """Replace the user's pending reset with a new one and return its token."""
+        token = uuid.uuid4()
+        with transaction.atomic():
+            cls.objects.filter(user=user).delete()
+            cls.objects.create(
+                token_hash=cls.hash_token(token),
+                user=user,
+                otp=otp,
+                expires_at=timezone.now() + timedelta(minutes=cls.VALIDITY_MINUTES),
+            )
+        return token
+
+    @classmethod
+    def lookup(cls, token):
+        """The unexpired reset for ``token`` with its user, or None."""
+        return (
+            cls.objects.select_related("user")
+            .filter(token_hash=cls.hash_token(token), expires_at__gt=timezone.now())
+            .first()
+        )
+
+    def __str__(self):
+        return f"Password reset for {self.user_id}"
+
+
+# ----------------------------
+# Employee File Model
+# ----------------------------
+class EmployeeFile(models.Model):
+    """
+    Document attached to an employee (contracts, scanned IDs, ...). Files
+    are created by the chunked upload API (see ``uploads``) once every
+    chunk has been received.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    employee = models.ForeignKey(User, on_delete=models.CASCADE, related_name="files")
+    file_title = models.CharField(max_length=512, blank=True, null=True)
+    file_url = models.FileField(upload_to="employee_files/")
+
+    def __str__(self):
+        return f"{self.employee.em_id} - {self.file_title}"
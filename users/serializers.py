@@ -1,10 +1,19 @@
-from .models import User
-from django.contrib.auth.password_validation import validate_password
+from .models import PasswordResetToken, User
 from django.contrib.auth.hashers import check_password
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenObtainSerializer, TokenRefreshSerializer
 from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare
 from core.utils import generate_otp, send_otp_email
+from . import email_registry, session_registry
+from .tokens import issue_refresh_token, record_login
+from .images import DEFAULT_IMAGE_SIZE, variant_name, queue_profile_image
+from .validators import validate_password
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,7 +22,26 @@ logger = logging.getLogger(__name__)
 # ----------------------------
 # Register Serializer
 # ----------------------------
+DUPLICATE_EMAIL_MESSAGE = "User with this email already exists"
+
+
+def _email_taken(email):
+    """
+    New emails are answered by the registry alone. A hit still costs one
+    indexed query. A stale member (an email changed or deleted by a bulk
+    update, which bypasses the signals) would otherwise reject a valid
+    signup until the next warm. The IntegrityError handler in ``create``
+    only covers the other direction: a missing member racing a signup.
+    """
+    if email_registry.is_registered(email) is False:
+        return False
+    return User.objects.filter(email=email).exists()
+
+
 class RegisterSerializer(serializers.ModelSerializer):
+    # Declared so ModelSerializer doesn't add a UniqueValidator: uniqueness
+    # is checked once in validate() (new emails from the email registry alone).
+    email = serializers.EmailField(max_length=254)
     password = serializers.CharField(write_only=True, validators=[validate_password], style={'input_type': 'password'})
     password_confirm = serializers.CharField(write_only=True, style={'input_type': 'password'})
 
@@ -24,33 +52,41 @@ class RegisterSerializer(serializers.ModelSerializer):
     def validate(self, data):
         if data["password"] != data["password_confirm"]:
             raise serializers.ValidationError({"password_confirm": "Passwords don't match"})
-        if User.objects.filter(email=data["email"]).exists():
-            raise serializers.ValidationError({"email": "User with this email already exists"})
+        if _email_taken(data["email"]):
+            raise serializers.ValidationError({"email": DUPLICATE_EMAIL_MESSAGE})
         return data
 
     def create(self, validated_data):
         password = validated_data.pop("password")
         validated_data.pop("password_confirm")
 
-        # Create user
-        user = User.objects.create_user(password=password, **validated_data)
-        user.is_verified = False
-        user.save(update_fields=["is_verified"])
-
-        # Send OTP
+        # One INSERT of the fully initialized user, OTP included. The unique
+        # constraint catches signups racing past validate().
         otp = generate_otp()
-        user.set_otp(otp)
         try:
-            send_otp_email(user.email, otp, validity_minutes=10)
-            logger.info(f"OTP sent to {user.email}")
-        except Exception as e:
-            user.delete()
-            logger.warning(f"Registration rollback: failed to send OTP to {user.email} - {str(e)}")
-            raise serializers.ValidationError({"email": f"Failed to send OTP: {str(e)}"})
-
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    password=password,
+                    is_verified=False,
+                    otp=otp,
+                    otp_created_at=timezone.now(),
+                    **validated_data
+                )
+                # Only mail users that exist. A failure here is logged and the
+                # user can ask for a new code via resend-otp.
+                transaction.on_commit(lambda: _send_registration_otp(user.email, otp), robust=True)
+        except IntegrityError:
+            if User.objects.filter(email=validated_data["email"]).exists():
+                raise serializers.ValidationError({"email": DUPLICATE_EMAIL_MESSAGE})
+            raise
         return user
 
 
+def _send_registration_otp(email, otp):
+    send_otp_email(email, otp, validity_minutes=10)
+    logger.info(f"OTP sent to {email}")
+
+
 # ----------------------------
 # Verify OTP Serializer
 # ----------------------------
@@ -126,7 +162,10 @@ class ChangePasswordSerializer(serializers.Serializer):
     def save(self):
         user = self.context["request"].user
         user.set_password(self.validated_data["new_password"])
-        user.save()
+        with transaction.atomic():
+            user.save(update_fields=["password"])
+            # The new password hash already invalidates every issued token.
+            session_registry.revoke_all(user.pk)
         return user
 
 
@@ -136,13 +175,18 @@ class ChangePasswordSerializer(serializers.Serializer):
 class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
     def validate(self, attrs):
         try:
-            data = super().validate(attrs)
+            TokenObtainSerializer.validate(self, attrs)
         except AuthenticationFailed:
             raise serializers.ValidationError("Invalid email or password")
 
         if not self.user.is_verified:
             raise serializers.ValidationError("Please verify your email before login.")
 
+        refresh = self.get_token(self.user)
+        data = {"refresh": str(refresh), "access": str(refresh.access_token)}
+        record_login(self.user, refresh)
+        session_registry.touch(self.user.pk, refresh["sid"], self.context.get("request"), created=True)
+
         data.update({
             "email": self.user.email,
             "role": self.user.em_role,
@@ -153,13 +197,44 @@ class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
 
     @classmethod
     def get_token(cls, user):
-        token = super().get_token(user)
+        """The login refresh token; ``validate`` stores it with ``record_login``."""
+        token = issue_refresh_token(user)
         token["role"] = user.em_role
         token["email"] = user.email
         token["user_id"] = str(user.id)
+        token["sid"] = session_registry.new_session_id()
         return token
 
 
+# ----------------------------
+# JWT Refresh Serializer
+# ----------------------------
+class SessionTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    ``TokenRefreshSerializer`` that also rejects refresh tokens issued
+    before the user's last password change and records the session as seen.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        # Only the password hash is needed here; super() loads the user for
+        # USER_AUTHENTICATION_RULE.
+        user = (
+            User.objects.filter(**{api_settings.USER_ID_FIELD: refresh.get(api_settings.USER_ID_CLAIM)})
+            .only("password")
+            .first()
+        )
+        if user is None:
+            raise AuthenticationFailed(self.error_messages["no_active_account"], "no_active_account")
+        # Checked before rotating: simplejwt only compares the hash on access tokens.
+        if api_settings.CHECK_REVOKE_TOKEN and refresh.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed("The user's password has changed", "password_changed")
+
+        data = super().validate(attrs)
+        session_registry.touch(user.pk, refresh.get("sid"), self.context.get("request"))
+        return data
+
+
 # ----------------------------
 # Forgot Password Serializer
 # ----------------------------
@@ -175,13 +250,12 @@ class ForgotPasswordOTPSerializer(serializers.Serializer):
 
     def save(self):
         otp = generate_otp()
-        token = self.user.set_reset_password_token() 
-        self.user.set_otp(otp, reset=True)
+        token = PasswordResetToken.issue(self.user, otp)
         try:
-            send_otp_email(self.user.email, otp, validity_minutes=10)
+            send_otp_email(self.user.email, otp, validity_minutes=PasswordResetToken.VALIDITY_MINUTES)
             logger.info(f"Password reset OTP sent to {self.user.email}")
         except Exception as e:
-            self.user.clear_reset_password_token()
+            PasswordResetToken.objects.filter(token_hash=PasswordResetToken.hash_token(token)).delete()
             raise serializers.ValidationError({"email": f"Failed to send OTP: {str(e)}"})
         return {
             "email": self.user.email,
@@ -200,17 +274,17 @@ class ResetPasswordOTPSerializer(serializers.Serializer):
     new_password_confirm = serializers.CharField(write_only=True)
 
     def validate(self, data):
-        try:
-            self.user = User.objects.get(email=data["email"])
-        except User.DoesNotExist:
+        reset = PasswordResetToken.lookup(data["token"])
+        if reset is None:
+            raise serializers.ValidationError("Invalid or expired reset token")
+
+        if reset.user.email != data["email"]:
             raise serializers.ValidationError("Invalid email")
 
-        if not self.user.verify_otp(data["otp"], reset=True):
+        if not constant_time_compare(reset.otp, data["otp"]):
             raise serializers.ValidationError("Invalid or expired OTP")
 
-        if not self.user.verify_reset_password_token(data["token"]):
-            self.user.clear_otp()
-            raise serializers.ValidationError("Invalid or expired reset token")
+        self.user = reset.user
 
         if data["new_password"] != data["new_password_confirm"]:
             raise serializers.ValidationError({"new_password_confirm": "Passwords do not match"})
@@ -219,6 +293,66 @@ class ResetPasswordOTPSerializer(serializers.Serializer):
 
     def save(self):
         self.user.set_password(self.validated_data["new_password"])
-        self.user.clear_reset_password_token()
-        self.user.save()
+        with transaction.atomic():
+            self.user.save(update_fields=["password"])
+            self.user.reset_tokens.all().delete()
+            session_registry.revoke_all(self.user.pk)
         return self.user
+
+
+# ----------------------------
+# Profile Serializer
+# ----------------------------
+class UserProfileSerializer(serializers.ModelSerializer):
+    """
+    Profile details. ``em_image`` is the URL of a processed variant: the size
+    comes from the ``image_size`` query parameter and WebP is returned when
+    the client's Accept header allows it, JPEG otherwise.
+    """
+    em_image = serializers.SerializerMethodField()
+
+    class Meta:
+        model = User
+        fields = [
+            "id", "email", "em_id", "em_role", "status", "em_gender", "em_blood_group",
+            "em_phone", "em_birthday", "em_joining_date", "em_contract_end", "em_image"
+        ]
+
+    def get_em_image(self, obj):
+        request = self.context.get("request")
+        size = DEFAULT_IMAGE_SIZE
+        webp = True
+        if request is not None:
+            size = request.query_params.get("image_size", DEFAULT_IMAGE_SIZE)
+            webp = "image/webp" in request.headers.get("Accept", "")
+
+        name = variant_name(obj.em_image_variants, size=size, webp=webp)
+        if not name:
+            return None
+        url = obj.em_image.storage.url(name)
+        return request.build_absolute_uri(url) if request is not None else url
+
+
+# ----------------------------
+# Profile Image Upload Serializer
+# ----------------------------
+class ProfileImageSerializer(serializers.ModelSerializer):
+    em_image = serializers.ImageField(write_only=True)
+
+    class Meta:
+        model = User
+        fields = ["em_image"]
+
+    def validate_em_image(self, value):
+        max_size = getattr(settings, "PROFILE_IMAGE_MAX_UPLOAD_SIZE", 10 * 1024 * 1024)
+        if value.size > max_size:
+            raise serializers.ValidationError(f"Image must be at most {max_size // (1024 * 1024)} MB.")
+        return value
+
+    def update(self, instance, validated_data):
+        # Variants of the previous image stay in place (they are shared by
+        # content hash) until the new upload has been processed.
+        instance.em_image = validated_data["em_image"]
+        instance.save(update_fields=["em_image"])
+        queue_profile_image(instance)
+        return instance
@@ -0,0 +1,132 @@
+"""
+Redis registry of each user's active sessions (refresh-token families),
+for listing a user's devices.
+
+A session id (``sid`` claim) is minted at login and kept across refresh
+rotations. Per user, a sorted set maps session ids to their last-seen time
+and a hash per session holds the device metadata; both expire with the
+refresh token lifetime. Login and refresh write the session in one
+pipeline.
+
+The registry is not what revokes tokens: tokens carry a hash of the
+password (``CHECK_REVOKE_TOKEN``), so a password change invalidates every
+access and refresh token without touching ``OutstandingToken``.
+``revoke_all`` then drops the user's entries in O(log n + m). Like the
+email registry, failures are logged and never fail the request.
+"""
+import logging
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from django.db import transaction
+from rest_framework.throttling import BaseThrottle
+from rest_framework_simplejwt.settings import api_settings
+
+logger = logging.getLogger(__name__)
+
+SESSIONS_KEY = "users:sessions:{}"
+SESSION_KEY = "users:session:{}"
+USER_AGENT_MAX_LENGTH = 256
+
+
+def _redis():
+    from django_redis import get_redis_connection
+    return get_redis_connection("default")
+
+
+def _lifetime() -> int:
+    return int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+
+
+def new_session_id() -> str:
+    return uuid.uuid4().hex
+
+
+def touch(user_id, sid: Optional[str], request=None, created: bool = False) -> None:
+    """Record that session ``sid`` of ``user_id`` was just used (login or refresh)."""
+    if not sid:
+        # Tokens issued before sessions were tracked.
+        return
+    now = time.time()
+    lifetime = _lifetime()
+    sessions_key = SESSIONS_KEY.format(user_id)
+    session_key = SESSION_KEY.format(sid)
+    meta = {"last_seen": now}
+    if created:
+        meta["created_at"] = now
+    if request is not None:
+        user_agent = request.META.get("HTTP_USER_AGENT", "")[:USER_AGENT_MAX_LENGTH]
+        ip = BaseThrottle().get_ident(request)
+        # A client that omits them on refresh keeps what login recorded.
+        if user_agent:
+            meta["user_agent"] = user_agent
+        if ip:
+            meta["ip"] = ip
+    try:
+        pipe = _redis().pipeline(transaction=False)
+        pipe.zadd(sessions_key, {sid: now})
+        # Sessions idle for a whole refresh lifetime can't refresh any more.
+        pipe.zremrangebyscore(sessions_key, "-inf", now - lifetime)
+        pipe.expire(sessions_key, lifetime)
+        pipe.hset(session_key, mapping=meta)
+        pipe.expire(session_key, lifetime)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Session registry update failed for user {user_id}: {str(e)}")
+
+
+def list_sessions(user_id) -> List[Dict[str, object]]:
+    """The user's sessions, most recently used first (empty if Redis is down)."""
+    try:
+        client = _redis()
+        now = time.time()
+        sids = client.zrevrangebyscore(SESSIONS_KEY.format(user_id), "+inf", now - _lifetime())
+        pipe = client.pipeline(transaction=False)
+        for sid in sids:
+            pipe.hgetall(SESSION_KEY.format(sid.decode()))
+        metas = pipe.execute()
+    except Exception as e:
+        logger.warning(f"Session registry read failed for user {user_id}: {str(e)}")
+        return []
+
+    sessions = []
+    for sid, meta in zip(sids, metas):
+        meta = {key.decode(): value.decode() for key, value in meta.items()}
+        sessions.append({
+            "sid": sid.decode(),
+            "user_agent": meta.get("user_agent", ""),
+            "ip": meta.get("ip", ""),
+            "created_at": float(meta["created_at"]) if "created_at" in meta else None,
+            "last_seen": float(meta["last_seen"]) if "last_seen" in meta else None,
+        })
+    return sessions
+
+
+def _remove(user_id, sids: Optional[List[str]]) -> None:
+    sessions_key = SESSIONS_KEY.format(user_id)
+    try:
+        client = _redis()
+        if sids is None:
+            sids = [sid.decode() for sid in client.zrange(sessions_key, 0, -1)]
+            pipe = client.pipeline(transaction=False)
+            pipe.delete(sessions_key)
+        else:
+            pipe = client.pipeline(transaction=False)
+            pipe.zrem(sessions_key, *sids)
+        for sid in sids:
+            pipe.delete(SESSION_KEY.format(sid))
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Session registry removal failed for user {user_id}: {str(e)}")
+
+
+def revoke(user_id, sid: Optional[str]) -> None:
+    """Forget one session (logout)."""
+    if sid:
+        transaction.on_commit(lambda: _remove(user_id, [sid]))
+
+
+def revoke_all(user_id) -> None:
+    """Forget every session of the user (password change or reset)."""
+    transaction.on_commit(lambda: _remove(user_id, None))
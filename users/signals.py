@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import email_registry
+from .models import User
+
+
+# ----------------------------
+# Email Registry
+# ----------------------------
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, **kwargs):
+    loaded_email = getattr(instance, "_loaded_email", None)
+    if created or instance.email != loaded_email:
+        if loaded_email and not created:
+            email_registry.remove(loaded_email)
+        email_registry.add(instance.email)
+    instance._loaded_email = instance.email
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    email_registry.remove(instance.email)
@@ -0,0 +1,148 @@
+"""
+Bounded cleanup of expired OTPs, expired password resets and abandoned
+self-signups, run by the ``sweep_users`` command (schedule it as a cron
+job).
+
+Work is done in small batches, each in its own short transaction: the
+batch's primary keys are picked through the partial indexes on pending
+OTPs / unverified ``date_joined`` (or the ``expires_at`` index of reset
+tokens), then updated or deleted by primary key. The batch size adapts
+so a batch holds its row locks for no longer than ``max_batch_ms``: it
+halves after a slow batch and grows back (up to the configured size)
+after fast ones.
+"""
+import logging
+import time
+from datetime import timedelta
+from typing import Callable, Dict, List
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from loan.models import Loan
+from payroll.models import EmpSalary, PaySalary
+
+from .models import PasswordResetToken, User
+
+logger = logging.getLogger(__name__)
+
+# Matches the default expiry of ``User.verify_otp``.
+OTP_EXPIRY_MINUTES = 10
+
+
+def _sweep(
+    queryset,
+    order_by: str,
+    apply: Callable[[List[object]], int],
+    batch_size: int,
+    max_batch_ms: int,
+    pause: float,
+) -> Dict[str, int]:
+    """
+    Apply ``apply`` to the primary keys of ``queryset`` in batches until
+    none are left, adapting the batch size to keep each batch under
+    ``max_batch_ms``.
+    """
+    size = batch_size
+    stats = {"rows": 0, "batches": 0, "slow_batches": 0}
+    while True:
+        requested = size
+        started = time.perf_counter()
+        with transaction.atomic():
+            batch = queryset.order_by(order_by)
+            if connection.features.has_select_for_update_skip_locked:
+                # Rows a request is working on right now are left for the next run.
+                batch = batch.select_for_update(skip_locked=True)
+            pks = list(batch.values_list("pk", flat=True)[:requested])
+            if not pks:
+                break
+            stats["rows"] += apply(pks)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        stats["batches"] += 1
+
+        if elapsed_ms > max_batch_ms:
+            stats["slow_batches"] += 1
+            size = max(1, size // 2)
+        elif elapsed_ms < max_batch_ms / 4:
+            size = min(batch_size, size * 2)
+        if len(pks) < requested:
+            # A short batch was the last one.
+            break
+        if pause:
+            time.sleep(pause)
+    return stats
+
+
+# ----------------------------
+# Sweeps
+# ----------------------------
+def clear_expired_otps(batch_size: int = 500, max_batch_ms: int = 200, pause: float = 0.0) -> Dict[str, int]:
+    """
+    Clear OTPs older than ``OTP_EXPIRY_MINUTES``; they can no longer verify.
+    ``otp_created_at`` is kept: it marks the account as a self-signup that
+    was sent an OTP, which ``purge_unverified_users`` relies on.
+    """
+    cutoff = timezone.now() - timedelta(minutes=OTP_EXPIRY_MINUTES)
+    expired = User.objects.filter(otp__isnull=False, otp_created_at__lt=cutoff)
+
+    def apply(pks):
+        # The cutoff is repeated so an OTP re-issued since the select survives.
+        return User.objects.filter(pk__in=pks, otp_created_at__lt=cutoff).update(otp=None)
+
+    stats = _sweep(expired, "otp_created_at", apply, batch_size, max_batch_ms, pause)
+    logger.info(f"Cleared {stats['rows']} expired OTPs in {stats['batches']} batches")
+    return stats
+
+
+def purge_expired_reset_tokens(batch_size: int = 500, max_batch_ms: int = 200, pause: float = 0.0) -> Dict[str, int]:
+    """Delete password resets past their ``expires_at``."""
+    now = timezone.now()
+    expired = PasswordResetToken.objects.filter(expires_at__lt=now)
+
+    def apply(pks):
+        return PasswordResetToken.objects.filter(pk__in=pks).delete()[0]
+
+    stats = _sweep(expired, "expires_at", apply, batch_size, max_batch_ms, pause)
+    logger.info(f"Deleted {stats['rows']} expired password resets in {stats['batches']} batches")
+    return stats
+
+
+def purge_unverified_users(
+    max_age_days: int = None,
+    batch_size: int = 500,
+    max_batch_ms: int = 200,
+    pause: float = 0.0,
+) -> Dict[str, int]:
+    """
+    Delete self-signups abandoned for ``max_age_days``
+    (``UNVERIFIED_USER_MAX_AGE_DAYS`` by default): sent an OTP, never
+    verified, never logged in. Employees created by HR or an admin are
+    also unverified, so anyone with payroll or loan records, and staff, is
+    never touched.
+    """
+    if max_age_days is None:
+        max_age_days = getattr(settings, "UNVERIFIED_USER_MAX_AGE_DAYS", 7)
+    cutoff = timezone.now() - timedelta(days=max_age_days)
+    stale = User.objects.filter(
+        is_verified=False,
+        date_joined__lt=cutoff,
+        otp_created_at__isnull=False,
+        last_login__isnull=True,
+        is_staff=False,
+        is_superuser=False,
+    ).exclude(
+        Exists(EmpSalary.objects.filter(employee=OuterRef("pk")))
+        | Exists(PaySalary.objects.filter(employee=OuterRef("pk")))
+        | Exists(Loan.objects.filter(employee=OuterRef("pk")))
+    )
+
+    def apply(pks):
+        # Re-checked so an account verified since the select is kept.
+        deleted = stale.filter(pk__in=pks).delete()[1]
+        return deleted.get(User._meta.label, 0)
+
+    stats = _sweep(stale, "date_joined", apply, batch_size, max_batch_ms, pause)
+    logger.info(f"Purged {stats['rows']} unverified users older than {max_age_days} days in {stats['batches']} batches")
+    return stats
@@ -0,0 +1,118 @@
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework import serializers
+
+from users import email_registry
+from users.models import User
+from users.serializers import RegisterSerializer
+
+
+class FakeRedis:
+    """The handful of set commands the registry uses."""
+
+    def __init__(self):
+        self.sets = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def sismember(self, key, member):
+        return member in self.sets.get(key, set())
+
+    def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+
+    def srem(self, key, member):
+        self.sets.get(key, set()).discard(member)
+
+    def delete(self, key):
+        self.sets.pop(key, None)
+
+    def rename(self, src, dst):
+        self.sets[dst] = self.sets.pop(src)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def sismember(self, key, member):
+        self.calls.append((key, member))
+
+    def execute(self):
+        return [self.redis.sismember(key, member) for key, member in self.calls]
+
+
+class EmailRegistryTests(TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = patch.object(email_registry, "_redis", return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.data = {
+            "email": "new@gmail.com", "password": "StrongPass123", "password_confirm": "StrongPass123",
+            "em_role": "EMPLOYEE", "em_phone": "1234567890", "em_gender": "MALE",
+        }
+
+    def test_cold_or_unavailable_registry_cannot_answer(self):
+        self.assertIsNone(email_registry.is_registered("a@gmail.com"))
+        with patch.object(email_registry, "_redis", side_effect=ConnectionError("refused")):
+            self.assertIsNone(email_registry.is_registered("a@gmail.com"))
+
+    def test_warm_command(self):
+        User.objects.create_user(email="a@gmail.com", password="x")
+        call_command("warm_email_registry", "--batch-size", "1", stdout=open("/dev/null", "w"))
+        self.assertTrue(email_registry.is_registered("a@gmail.com"))
+        self.assertFalse(email_registry.is_registered("b@gmail.com"))
+
+    def test_signals_track_create_change_and_delete(self):
+        email_registry.warm()
+        with self.captureOnCommitCallbacks(execute=True):
+            user = User.objects.create_user(email="a@gmail.com", password="x")
+        self.assertTrue(email_registry.is_registered("a@gmail.com"))
+
+        user = User.objects.get(pk=user.pk)
+        user.email = "renamed@gmail.com"
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save()
+        self.assertFalse(email_registry.is_registered("a@gmail.com"))
+        self.assertTrue(email_registry.is_registered("renamed@gmail.com"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user.delete()
+        self.assertFalse(email_registry.is_registered("renamed@gmail.com"))
+
+    def test_new_email_answered_without_database(self):
+        email_registry.warm()
+        serializer = RegisterSerializer(data=self.data)
+        with self.assertNumQueries(0):
+            self.assertTrue(serializer.is_valid())
+
+    def test_duplicate_confirmed_against_database(self):
+        User.objects.create_user(email="new@gmail.com", password="StrongPass123")
+        email_registry.warm()
+        serializer = RegisterSerializer(data=self.data)
+        with self.assertNumQueries(1):
+            self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors["email"], ["User with this email already exists"])
+
+    def test_stale_member_does_not_block_signup(self):
+        email_registry.warm()
+        self.redis.sadd(email_registry.KEY, "new@gmail.com")
+        serializer = RegisterSerializer(data=self.data)
+        self.assertTrue(serializer.is_valid())
+
+    def test_stale_registry_falls_back_to_unique_constraint(self):
+        email_registry.warm()
+        User.objects.bulk_create([User(email="new@gmail.com", em_id="EMP-BULK0001")])  # no signals
+        serializer = RegisterSerializer(data=self.data)
+        self.assertTrue(serializer.is_valid())
+        with patch("users.serializers.send_otp_email") as send:
+            with self.assertRaises(serializers.ValidationError) as ctx:
+                serializer.save()
+        self.assertEqual(ctx.exception.detail["email"], "User with this email already exists")
+        send.assert_not_called()
+        self.assertEqual(User.objects.filter(email="new@gmail.com").count(), 1)
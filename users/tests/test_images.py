@@ -0,0 +1,122 @@
+import shutil
+import tempfile
+from io import BytesIO
+from unittest.mock import patch
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from users.models import User
+from users.images import build_variants, process_profile_image, PROFILE_IMAGE_SIZES
+
+
+def make_jpeg(size=(2000, 1000), orientation=None):
+    image = Image.new("RGB", size, (200, 30, 30))
+    exif = Image.Exif()
+    exif[0x010F] = "PhoneMaker"  # Make
+    if orientation:
+        exif[0x0112] = orientation
+    buffer = BytesIO()
+    image.save(buffer, "JPEG", exif=exif.tobytes())
+    return buffer.getvalue()
+
+
+class MediaRootMixin:
+    def setUp(self):
+        super().setUp()
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+        super().tearDown()
+
+
+class BuildVariantsTests(MediaRootMixin, TestCase):
+    def test_variants_are_resized_and_stripped(self):
+        variants = build_variants(BytesIO(make_jpeg()))
+        self.assertEqual(set(variants), {name for name, _ in PROFILE_IMAGE_SIZES})
+
+        for size_name, size in PROFILE_IMAGE_SIZES:
+            for ext, name in variants[size_name].items():
+                self.assertTrue(name.endswith(f".{ext}"))
+                with default_storage.open(name) as f, Image.open(f) as image:
+                    self.assertEqual(max(image.size), size)
+                    self.assertEqual(len(image.getexif()), 0)
+
+    def test_orientation_applied(self):
+        # Orientation 6 = rotate 90°: a landscape photo becomes portrait.
+        variants = build_variants(BytesIO(make_jpeg(orientation=6)))
+        with default_storage.open(variants["medium"]["jpeg"]) as f, Image.open(f) as image:
+            self.assertEqual(image.size, (128, 256))
+
+    def test_same_image_shares_content_hash_names(self):
+        self.assertEqual(build_variants(BytesIO(make_jpeg())), build_variants(BytesIO(make_jpeg())))
+
+
+class ProfileImageViewTests(MediaRootMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user(email="emp@gmail.com", password="testpass123")
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def upload(self):
+        upload = SimpleUploadedFile("photo.jpg", make_jpeg(), content_type="image/jpeg")
+        with patch("users.images.Thread") as thread, self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(reverse("accounts:profile-image"), {"em_image": upload}, format="multipart")
+        return response, thread
+
+    def test_upload_processed_off_request(self):
+        response, thread = self.upload()
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        thread.assert_called_once()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.em_image_variants, {})
+        self.assertTrue(default_storage.exists(self.user.em_image.name))
+
+        raw_name = self.user.em_image.name
+        process_profile_image(*thread.call_args.kwargs["args"])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.em_image.name, self.user.em_image_variants["large"]["jpeg"])
+        self.assertFalse(default_storage.exists(raw_name))
+
+    def test_profile_returns_variant_url(self):
+        response = self.client.get(reverse("accounts:profile"))
+        self.assertIsNone(response.data["data"]["em_image"])
+
+        _, thread = self.upload()
+        variants = process_profile_image(*thread.call_args.kwargs["args"])
+
+        response = self.client.get(reverse("accounts:profile"), {"image_size": "small"}, HTTP_ACCEPT="image/webp,*/*")
+        self.assertTrue(response.data["data"]["em_image"].endswith(variants["small"]["webp"]))
+
+        response = self.client.get(reverse("accounts:profile"))
+        self.assertTrue(response.data["data"]["em_image"].endswith(variants["medium"]["jpeg"]))
+
+    def test_stale_processing_discarded(self):
+        _, first = self.upload()
+        _, second = self.upload()
+        self.assertIsNone(process_profile_image(*first.call_args.kwargs["args"]))
+        self.assertIsNotNone(process_profile_image(*second.call_args.kwargs["args"]))
+
+    def test_thread_returns_its_connection(self):
+        _, thread = self.upload()
+        target = thread.call_args.kwargs["target"]
+        with patch("users.images.connection") as connection, \
+                patch("users.images.process_profile_image", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                target(*thread.call_args.kwargs["args"])
+        connection.close.assert_called_once()
+
+    def test_oversized_upload_rejected(self):
+        with self.settings(PROFILE_IMAGE_MAX_UPLOAD_SIZE=1024):
+            response, thread = self.upload()
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        thread.assert_not_called()
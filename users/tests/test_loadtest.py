@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+
+from django.core.management import call_command
+from django.test import LiveServerTestCase, SimpleTestCase
+
+from users.loadtest import percentile, run_scenario
+from users.models import User
+
+
+class PercentileTests(SimpleTestCase):
+    def test_nearest_rank(self):
+        samples = [float(n) for n in range(1, 101)]
+        self.assertEqual(percentile(samples, 50), 50.0)
+        self.assertEqual(percentile(samples, 95), 95.0)
+        self.assertEqual(percentile(samples, 99), 99.0)
+        self.assertEqual(percentile([3.0], 99), 3.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+
+class LoadTestScenarioTests(LiveServerTestCase):
+    def test_seed_users(self):
+        call_command("seed_users", 3, stdout=open(os.devnull, "w"))
+        users = User.objects.filter(email__endswith="@loadtest.local")
+        self.assertEqual(users.count(), 3)
+        self.assertTrue(all(user.is_verified and user.em_id for user in users))
+        call_command("seed_users", 3, "--delete", stdout=open(os.devnull, "w"))
+        self.assertFalse(User.objects.filter(email__endswith="@loadtest.local").exists())
+
+    def test_scenarios_against_live_server(self):
+        call_command("seed_users", 2, stdout=open(os.devnull, "w"))
+        for name, steps in [
+            ("registration", {"register", "verify-otp", "login", "refresh", "logout"}),
+            ("password-reset", {"forgot-password", "reset-password", "login"}),
+            ("change-password", {"login", "change-password"}),
+        ]:
+            # One client: the test database connection is shared between
+            # the live server's threads and the runner.
+            result = run_scenario(name, self.live_server_url, concurrency=1, iterations=2, seeded=2)
+            self.assertEqual(result["sample_failures"], [], name)
+            self.assertEqual(set(result["steps"]), steps)
+            self.assertEqual(result["total"]["requests"], 2)
+            self.assertGreater(result["total"]["p99_ms"], 0)
+
+    def test_command_writes_json(self):
+        call_command("seed_users", 1, stdout=open(os.devnull, "w"))
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "results.json")
+            call_command(
+                "loadtest_accounts", "--base-url", self.live_server_url, "--scenario", "change-password",
+                "--concurrency", "1", "--iterations", "1", "--output", output, stdout=open(os.devnull, "w")
+            )
+            with open(output) as f:
+                results = json.load(f)
+        scenario = results["scenarios"]["change-password"]
+        self.assertEqual(scenario["total"]["errors"], 0)
+        self.assertEqual(set(scenario["total"]), {
+            "requests", "errors", "throughput_rps", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"
+        })
@@ -1,6 +1,10 @@
 import uuid
+from datetime import timedelta
+from django.db import connection
 from django.test import TestCase
-from users.models import User
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from users.models import PasswordResetToken, User
 from rest_framework.test import APIRequestFactory
 from rest_framework import serializers
 from unittest.mock import patch
@@ -34,10 +38,26 @@ class RegisterSerializerTests(TestCase):
         with patch('users.serializers.send_otp_email') as mock_send:
             serializer = RegisterSerializer(data=self.valid_data)
             self.assertTrue(serializer.is_valid())
-            user = serializer.save()
+            with self.captureOnCommitCallbacks(execute=True):
+                user = serializer.save()
+                # Mail goes out only once the user is committed.
+                mock_send.assert_not_called()
             self.assertEqual(user.email, "test@gmail.com")
             self.assertFalse(user.is_verified)
-            mock_send.assert_called_once()  
+            mock_send.assert_called_once_with("test@gmail.com", user.otp, validity_minutes=10)
+
+    def test_registration_is_a_single_insert(self):
+        """Test the user is created with its OTP in one write"""
+        serializer = RegisterSerializer(data=self.valid_data)
+        self.assertTrue(serializer.is_valid())
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks():
+            user = serializer.save()
+        writes = [q["sql"] for q in queries.captured_queries if q["sql"].startswith(("INSERT", "UPDATE", "DELETE"))]
+        self.assertEqual(len(writes), 1)
+        self.assertTrue(writes[0].startswith('INSERT INTO "users_user"'))
+        user.refresh_from_db()
+        self.assertEqual(len(user.otp), 6)
+        self.assertIsNotNone(user.otp_created_at)
 
     def test_password_mismatch(self):
         """Test password confirmation mismatch"""
@@ -67,14 +87,15 @@ class RegisterSerializerTests(TestCase):
         self.assertIn("password", serializer.errors)
 
     def test_email_sending_failure(self):
-        """Test rollback when OTP email fails"""
+        """Test the user is kept when the OTP email fails after commit"""
         with patch('users.serializers.send_otp_email', side_effect=Exception("SMTP error")):
             serializer = RegisterSerializer(data=self.valid_data)
             self.assertTrue(serializer.is_valid())
-            with self.assertRaises(serializers.ValidationError):
+            with self.assertLogs(level="ERROR"), self.captureOnCommitCallbacks(execute=True):
                 serializer.save()
-            
-            self.assertFalse(User.objects.filter(email=self.valid_data["email"]).exists())
+
+            # The user can ask for a new code through resend-otp.
+            self.assertTrue(User.objects.filter(email=self.valid_data["email"], is_verified=False).exists())
     
 class VerifyOTPSerializerTests(TestCase):
     def setUp(self):
@@ -278,6 +299,25 @@ class ForgotPasswordOTPSerializerTests(TestCase):
             result = serializer.save()
             self.assertEqual(result["email"], "test@gmail.com")
             self.assertIsNotNone(result["token"])
+
+    def test_token_is_stored_hashed_without_touching_the_user(self):
+        serializer = ForgotPasswordOTPSerializer(data={"email": "test@gmail.com"})
+        self.assertTrue(serializer.is_valid())
+        with patch('users.serializers.send_otp_email'):
+            # Delete of the previous reset and insert of the new one, no user UPDATE.
+            with self.assertNumQueries(4):  # savepoint, delete, insert, release
+                token = serializer.save()["token"]
+
+        reset = PasswordResetToken.objects.get()
+        self.assertEqual(reset.token_hash, PasswordResetToken.hash_token(token))
+        self.assertNotEqual(reset.token_hash, str(token))
+        self.assertEqual(reset.user, self.user)
+
+    def test_new_request_replaces_pending_reset(self):
+        first = PasswordResetToken.issue(self.user, "111111")
+        second = PasswordResetToken.issue(self.user, "222222")
+        self.assertIsNone(PasswordResetToken.lookup(first))
+        self.assertEqual(PasswordResetToken.lookup(second).otp, "222222")
     
     def test_nonexistent_user(self):
         """Test forgot password for non-existent user"""
@@ -294,6 +334,7 @@ class ForgotPasswordOTPSerializerTests(TestCase):
             self.assertTrue(serializer.is_valid())
             with self.assertRaises(ValidationError):
                 serializer.save()
+        self.assertFalse(PasswordResetToken.objects.exists())
 
 class ResetPasswordOTPSerializerTests(TestCase):
     def setUp(self):
@@ -303,8 +344,7 @@ class ResetPasswordOTPSerializerTests(TestCase):
             em_role="EMPLOYEE"
         )
         self.otp = "123456"
-        self.user.set_otp(self.otp, reset=True)
-        self.reset_token = self.user.set_reset_password_token()
+        self.reset_token = PasswordResetToken.issue(self.user, self.otp)
 
     def test_valid_password_reset(self):
         """Test successful password reset"""
@@ -320,6 +360,20 @@ class ResetPasswordOTPSerializerTests(TestCase):
         self.assertTrue(serializer.is_valid(), msg=serializer.errors)
         user = serializer.save()
         self.assertTrue(user.check_password("NewSecurePass123!"))
+        self.assertIsNone(PasswordResetToken.lookup(self.reset_token))
+
+    def test_expired_token(self):
+        PasswordResetToken.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+        data = {
+            "email": self.user.email,
+            "otp": self.otp,
+            "token": self.reset_token,
+            "new_password": "NewSecurePass123!",
+            "new_password_confirm": "NewSecurePass123!"
+        }
+        serializer = ResetPasswordOTPSerializer(data=data)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("Invalid or expired reset token", str(serializer.errors))
 
     def test_invalid_otp(self):
         """Test reset with invalid OTP"""
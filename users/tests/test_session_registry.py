@@ -0,0 +1,156 @@
+from unittest.mock import patch
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users import session_registry
+from users.models import PasswordResetToken, User
+
+
+class FakeRedis:
+    """The sorted-set and hash commands the session registry uses, returning bytes like redis-py."""
+
+    def __init__(self):
+        self.zsets = {}
+        self.hashes = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, *members):
+        for member in members:
+            self.zsets.get(key, {}).pop(member, None)
+
+    def zremrangebyscore(self, key, low, high):
+        zset = self.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if score <= float(high)]:
+            del zset[member]
+
+    def zrange(self, key, start, end):
+        return [m.encode() for m, _ in sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1])]
+
+    def zrevrangebyscore(self, key, high, low):
+        return [m.encode() for m in reversed([
+            m for m, score in sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1]) if score >= low
+        ])]
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    def hgetall(self, key):
+        return {k.encode(): str(v).encode() for k, v in self.hashes.get(key, {}).items()}
+
+    def expire(self, key, seconds):
+        pass
+
+    def delete(self, key):
+        self.zsets.pop(key, None)
+        self.hashes.pop(key, None)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+class SessionRegistryTests(APITestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = patch.object(session_registry, "_redis", return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = User.objects.create_user(email="test@gmail.com", password="StrongPass123", is_verified=True)
+
+    def login(self, user_agent="pytest-device"):
+        response = self.client.post(
+            reverse("accounts:login"), {"email": "test@gmail.com", "password": "StrongPass123"},
+            HTTP_USER_AGENT=user_agent,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def sessions(self, access):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        try:
+            return self.client.get(reverse("accounts:sessions"))
+        finally:
+            self.client.credentials()
+
+    def test_login_registers_device_and_refresh_keeps_session(self):
+        phone = self.login("phone")
+        laptop = self.login("laptop")
+
+        response = self.sessions(laptop["access"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sessions = response.data["data"]
+        self.assertEqual([s["user_agent"] for s in sessions], ["laptop", "phone"])
+        self.assertEqual([s["current"] for s in sessions], [True, False])
+
+        response = self.client.post(reverse("accounts:token-refresh"), {"refresh": phone["refresh"]})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sessions = self.sessions(response.data["access"]).data["data"]
+        self.assertEqual(len(sessions), 2)
+        self.assertTrue(sessions[0]["current"])
+        self.assertEqual(sessions[0]["user_agent"], "phone")
+
+    def test_logout_forgets_session(self):
+        phone = self.login("phone")
+        laptop = self.login("laptop")
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {phone['access']}")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse("accounts:logout"), {"refresh": phone["refresh"]})
+        self.assertEqual(response.status_code, status.HTTP_205_RESET_CONTENT)
+
+        self.assertEqual([s["user_agent"] for s in self.sessions(laptop["access"]).data["data"]], ["laptop"])
+
+    def test_change_password_revokes_all_sessions(self):
+        phone = self.login("phone")
+        laptop = self.login("laptop")
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {laptop['access']}")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(reverse("accounts:change-password"), {
+                "old_password": "StrongPass123", "new_password": "NewSecurePass123!",
+                "new_password_confirm": "NewSecurePass123!",
+            })
+        self.client.credentials()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self.redis.zsets.get(f"users:sessions:{self.user.pk}", {}), {})
+        self.assertEqual(self.sessions(phone["access"]).status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.post(reverse("accounts:token-refresh"), {"refresh": phone["refresh"]})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_reset_password_revokes_all_sessions(self):
+        phone = self.login("phone")
+        token = PasswordResetToken.issue(self.user, "123456")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse("accounts:reset-password"), {
+                "email": "test@gmail.com", "otp": "123456", "token": token,
+                "new_password": "NewSecurePass123!", "new_password_confirm": "NewSecurePass123!",
+            })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self.redis.zsets.get(f"users:sessions:{self.user.pk}", {}), {})
+        response = self.client.post(reverse("accounts:token-refresh"), {"refresh": phone["refresh"]})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_unavailable_registry_does_not_fail_login(self):
+        with patch.object(session_registry, "_redis", side_effect=ConnectionError("refused")):
+            tokens = self.login()
+            response = self.sessions(tokens["access"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"], [])
@@ -0,0 +1,113 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from payroll.models import EmpSalary, PayrollRun, PaySalary
+from users import sweeper
+from users.models import PasswordResetToken, User
+
+
+class SweeperTests(TestCase):
+    def make_user(self, email, joined_days_ago=0, otp_minutes_ago=None, **fields):
+        user = User.objects.create_user(email=email, password="Str0ng#Pass", **fields)
+        now = timezone.now()
+        User.objects.filter(pk=user.pk).update(
+            date_joined=now - timedelta(days=joined_days_ago),
+            otp="123456" if otp_minutes_ago is not None else None,
+            otp_created_at=now - timedelta(minutes=otp_minutes_ago) if otp_minutes_ago is not None else None,
+        )
+        return user
+
+    def test_clears_only_expired_otps(self):
+        expired = self.make_user("expired@example.com", otp_minutes_ago=30)
+        fresh = self.make_user("fresh@example.com", otp_minutes_ago=1)
+
+        stats = sweeper.clear_expired_otps()
+
+        self.assertEqual(stats["rows"], 1)
+        expired.refresh_from_db()
+        fresh.refresh_from_db()
+        self.assertIsNone(expired.otp)
+        # Kept as the record that this self-signup was sent an OTP.
+        self.assertIsNotNone(expired.otp_created_at)
+        self.assertEqual(fresh.otp, "123456")
+
+    def test_deletes_only_expired_reset_tokens(self):
+        user = self.make_user("reset@example.com", is_verified=True)
+        token = PasswordResetToken.issue(user, "123456")
+        PasswordResetToken.objects.create(
+            token_hash="0" * 64, user=user, otp="654321", expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        stats = sweeper.purge_expired_reset_tokens()
+
+        self.assertEqual(stats["rows"], 1)
+        self.assertEqual(list(PasswordResetToken.objects.values_list("token_hash", flat=True)), [PasswordResetToken.hash_token(token)])
+
+    def test_purges_only_abandoned_self_signups(self):
+        signup_age = 10 * 24 * 60
+        self.make_user("stale@example.com", joined_days_ago=10, otp_minutes_ago=signup_age)
+        self.make_user("recent@example.com", joined_days_ago=1, otp_minutes_ago=24 * 60)
+        self.make_user("verified@example.com", joined_days_ago=10, otp_minutes_ago=signup_age, is_verified=True)
+        self.make_user("staff@example.com", joined_days_ago=10, otp_minutes_ago=signup_age, is_staff=True)
+        # Created by HR: unverified, but never sent an OTP.
+        self.make_user("hired@example.com", joined_days_ago=10)
+        logged_in = self.make_user("logged-in@example.com", joined_days_ago=10, otp_minutes_ago=signup_age)
+        User.objects.filter(pk=logged_in.pk).update(last_login=timezone.now())
+
+        stats = sweeper.purge_unverified_users(max_age_days=7)
+
+        self.assertEqual(stats["rows"], 1)
+        self.assertEqual(
+            set(User.objects.values_list("email", flat=True)),
+            {"recent@example.com", "verified@example.com", "staff@example.com", "hired@example.com", "logged-in@example.com"},
+        )
+
+    def test_keeps_unverified_employee_with_payroll_records(self):
+        employee = self.make_user("employee@example.com", joined_days_ago=30, otp_minutes_ago=30 * 24 * 60)
+        salary = EmpSalary.objects.create(employee=employee, total=Decimal("30000.00"))
+        run = PayrollRun.objects.create(month=1, year=2026)
+        PaySalary.objects.create(payroll_run=run, employee=employee, month=1, year=2026, total_days=31)
+
+        stats = sweeper.purge_unverified_users(max_age_days=7)
+
+        self.assertEqual(stats["rows"], 0)
+        self.assertTrue(User.objects.filter(pk=employee.pk).exists())
+        self.assertTrue(EmpSalary.objects.filter(pk=salary.pk).exists())
+        self.assertEqual(PaySalary.objects.filter(employee=employee).count(), 1)
+
+    def test_works_in_batches(self):
+        for index in range(5):
+            self.make_user(f"stale{index}@example.com", joined_days_ago=10, otp_minutes_ago=10 * 24 * 60)
+
+        stats = sweeper.purge_unverified_users(max_age_days=7, batch_size=2)
+
+        self.assertEqual(stats["rows"], 5)
+        self.assertEqual(stats["batches"], 3)
+        self.assertFalse(User.objects.exists())
+
+    def test_slow_batches_shrink_the_batch_size(self):
+        for index in range(4):
+            self.make_user(f"otp{index}@example.com", otp_minutes_ago=30)
+
+        # Every batch is over a 0ms budget, so batches hold 2, 1 and 1 rows.
+        stats = sweeper.clear_expired_otps(batch_size=2, max_batch_ms=0)
+
+        self.assertEqual(stats["rows"], 4)
+        self.assertEqual(stats["batches"], 3)
+        self.assertEqual(stats["slow_batches"], 3)
+        self.assertFalse(User.objects.filter(otp__isnull=False).exists())
+
+    def test_command(self):
+        self.make_user("stale@example.com", joined_days_ago=10, otp_minutes_ago=30)
+        out = StringIO()
+
+        call_command("sweep_users", "--max-age-days", "7", stdout=out)
+
+        self.assertIn("Expired OTPs cleared: 1", out.getvalue())
+        self.assertIn("Unverified users purged: 1", out.getvalue())
+        self.assertFalse(User.objects.exists())
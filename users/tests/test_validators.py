@@ -0,0 +1,61 @@
+from unittest.mock import patch
+
+from django.contrib.auth import password_validation as django_validation
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
+
+from users import validators
+from users.models import User
+
+
+def verdict(validator, password, user):
+    try:
+        validator.validate(password, user)
+        return None
+    except ValidationError as e:
+        return e.messages
+
+
+class ValidatorParityTests(SimpleTestCase):
+    PASSWORDS = [
+        "password", "Password1", "12345678", "employee", "employee@example", "Employee@Example.com",
+        "exampleemployee", "mployeeex", "Vq8#mLw2!xTz", "com", "zxcvbnm", "letmein!", "a" * 40,
+    ]
+    USERS = [
+        User(email="employee@example.com"),
+        User(email="j.doe+hr@company.org"),
+        User(email=""),
+    ]
+    PAIRS = [
+        (validators.UserAttributeSimilarityValidator(), django_validation.UserAttributeSimilarityValidator()),
+        (validators.UserAttributeSimilarityValidator(max_similarity=0.5),
+         django_validation.UserAttributeSimilarityValidator(max_similarity=0.5)),
+        (validators.CommonPasswordValidator(), django_validation.CommonPasswordValidator()),
+        (validators.NumericPasswordValidator(), django_validation.NumericPasswordValidator()),
+        (validators.MinimumLengthValidator(8), django_validation.MinimumLengthValidator(8)),
+    ]
+
+    def test_same_verdicts_as_django(self):
+        for ours, theirs in self.PAIRS:
+            for user in self.USERS:
+                for password in self.PASSWORDS:
+                    with self.subTest(validator=type(ours).__name__, password=password, email=user.email):
+                        self.assertEqual(verdict(ours, password, user), verdict(theirs, password, user))
+
+    def test_common_password_list_is_shared(self):
+        self.assertIs(validators.CommonPasswordValidator().passwords, validators.CommonPasswordValidator().passwords)
+        self.assertIsInstance(validators.CommonPasswordValidator().passwords, frozenset)
+
+
+class ValidatePasswordTests(SimpleTestCase):
+    def test_runs_cheapest_first_and_stops_at_first_failure(self):
+        with patch.object(validators.UserAttributeSimilarityValidator, "validate") as similarity:
+            with self.assertRaises(ValidationError) as ctx:
+                validators.validate_password("short", User(email="employee@example.com"))
+        self.assertEqual(ctx.exception.messages[0][:30], "This password is too short. It")
+        self.assertEqual(len(ctx.exception.messages), 1)
+        similarity.assert_not_called()
+        self.assertEqual([v.cost for v in validators.ordered_validators()], [1, 2, 3, 4])
+
+    def test_accepts_strong_password(self):
+        validators.validate_password("Vq8#mLw2!xTz", User(email="employee@example.com"))
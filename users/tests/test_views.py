@@ -2,10 +2,15 @@ from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from django.urls import reverse
 from unittest.mock import patch
-from users.models import User
+from users.models import PasswordResetToken, User
 from django.test import override_settings
 from django.core.cache import cache
+from django.db import connection
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
 from rest_framework_simplejwt.tokens import RefreshToken
+from core.testing import QueryCountMixin
+from department.models import Department
+from designation.models import Designation
 
 class RegisterViewTests(APITestCase):
     def setUp(self):
@@ -23,7 +28,8 @@ class RegisterViewTests(APITestCase):
     def test_successful_registration(self):
         """Test successful user registration"""
         with patch("users.serializers.send_otp_email") as mock_send:
-            response = self.client.post(self.register_url, self.valid_data)
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(self.register_url, self.valid_data)
             self.assertEqual(response.status_code, status.HTTP_201_CREATED)
             self.assertEqual(User.objects.count(), 1)
             self.assertEqual(User.objects.get().email, "test@gmail.com")
@@ -48,11 +54,12 @@ class RegisterViewTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_registration_email_sending_failure(self):
-        """Test registration when OTP email fails"""
+        """Test registration when OTP email fails after commit"""
         with patch('users.serializers.send_otp_email', side_effect=Exception("SMTP error")):
-            response = self.client.post(self.register_url, self.valid_data)
-            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-            self.assertEqual(User.objects.count(), 0)
+            with self.assertLogs(level="ERROR"), self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(self.register_url, self.valid_data)
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.assertEqual(User.objects.count(), 1)
 
 class VerifyOTPViewTests(APITestCase):
     def setUp(self):
@@ -228,6 +235,13 @@ class LogoutViewTests(APITestCase):
         response = self.client.post(self.logout_url, data)
         self.assertEqual(response.status_code, status.HTTP_205_RESET_CONTENT)
     
+    def test_logout_with_another_users_token(self):
+        other = User.objects.create_user(email="other@gmail.com", password="StrongPass123", is_verified=True)
+        refresh = RefreshToken.for_user(other)
+        response = self.client.post(self.logout_url, {"refresh": str(refresh)})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(BlacklistedToken.objects.filter(token__jti=refresh["jti"]).exists())
+
     def test_logout_without_refresh_token(self):
         """Test logout without refresh token"""
         response = self.client.post(self.logout_url, {})
@@ -348,8 +362,7 @@ class ResetPasswordViewTests(APITestCase):
             is_verified=True
         )
         
-        self.reset_token = self.user.set_reset_password_token()
-        self.user.set_otp("123456", reset=True)
+        self.reset_token = PasswordResetToken.issue(self.user, "123456")
 
     def test_successful_password_reset(self):
         """Test successful password reset"""
@@ -364,7 +377,7 @@ class ResetPasswordViewTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.user.refresh_from_db()
         self.assertTrue(self.user.check_password("NewSecurePass123!"))
-        self.assertIsNone(self.user.reset_password_token)
+        self.assertFalse(PasswordResetToken.objects.filter(user=self.user).exists())
     
     def test_password_reset_invalid_otp(self):
         """Test password reset with invalid OTP"""
@@ -401,4 +414,39 @@ class ResetPasswordViewTests(APITestCase):
         }
         response = self.client.post(self.reset_password_url, data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        
\ No newline at end of file
+        
+
+class QueryCountTests(QueryCountMixin, APITestCase):
+    def setUp(self):
+        cache.clear()
+        department = Department.objects.create(dep_name="Engineering")
+        self.user = User.objects.create_user(
+            email="test@gmail.com",
+            password="StrongPass123",
+            is_verified=True,
+            designation=Designation.objects.create(des_name="Developer", department=department),
+        )
+
+    def test_profile_queries(self):
+        """Profile only loads the authenticated user"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.user).access_token}")
+        with self.assertMaxQueries(1):
+            response = self.client.get(reverse("accounts:profile"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_login_queries(self):
+        """Login is one user SELECT plus one batched write (two statements off PostgreSQL)"""
+        data = {"email": "test@gmail.com", "password": "StrongPass123"}
+        expected = 2 if connection.vendor == "postgresql" else 3
+        with self.assertMaxQueries(expected) as context:
+            response = self.client.post(reverse("accounts:login"), data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        select = context.captured_queries[0]["sql"]
+        self.assertIn('"users_user"."password"', select)
+        self.assertNotIn('"users_user"."em_image_variants"', select)
+
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.last_login)
+        outstanding = OutstandingToken.objects.get(user=self.user)
+        self.assertEqual(outstanding.token, response.data["refresh"])
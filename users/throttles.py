@@ -36,3 +36,15 @@ class GeneralThrottle(UserRateThrottle):
         if request and request.method in SAFE_METHODS:
             return getattr(settings, "GENERAL_THROTTLE_SAFE_RATE", "200/hour")
         return getattr(settings, "GENERAL_THROTTLE_UNSAFE_RATE", "50/hour")
+
+
+class UploadChunkThrottle(UserRateThrottle):
+    """
+    Throttle for chunked upload requests. A single large file takes many
+    chunks, so the limit is well above the general unsafe rate.
+    Default: 2000 chunk requests per hour per user.
+    """
+    scope = "upload"
+
+    def get_rate(self):
+        return getattr(settings, "UPLOAD_THROTTLE_RATE", "2000/hour")
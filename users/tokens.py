@@ -0,0 +1,71 @@
+"""
+Refresh tokens for login, issued in a fixed number of round trips.
+
+``RefreshToken.for_user`` inserts the outstanding-token row by itself and
+simplejwt's ``UPDATE_LAST_LOGIN`` adds a separate UPDATE. Here the token
+is built without the insert, and ``record_login`` writes both the
+outstanding token and ``last_login`` in a single statement on PostgreSQL
+(two statements elsewhere).
+"""
+from django.db import connections, router
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rest_framework_simplejwt.tokens import BlacklistMixin, RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from .models import User
+
+
+def issue_refresh_token(user) -> RefreshToken:
+    """``RefreshToken.for_user`` without the outstanding-token insert; pair it with ``record_login``."""
+    return super(BlacklistMixin, RefreshToken).for_user(user)
+
+
+def _login_sql(connection) -> str:
+    qn = connection.ops.quote_name
+    user_meta, token_meta = User._meta, OutstandingToken._meta
+    token_columns = ", ".join(
+        qn(token_meta.get_field(name).column) for name in ("user", "jti", "token", "created_at", "expires_at")
+    )
+    return (
+        f"WITH login AS ("
+        f"UPDATE {qn(user_meta.db_table)} SET {qn(user_meta.get_field('last_login').column)} = %s "
+        f"WHERE {qn(user_meta.pk.column)} = %s"
+        f") INSERT INTO {qn(token_meta.db_table)} ({token_columns}) VALUES (%s, %s, %s, %s, %s)"
+    )
+
+
+def record_login(user, refresh: RefreshToken) -> None:
+    """Store ``refresh`` as outstanding and set the user's ``last_login``."""
+    now = timezone.now()
+    outstanding = OutstandingToken(
+        user_id=user.pk,
+        jti=refresh[api_settings.JTI_CLAIM],
+        token=str(refresh),
+        created_at=refresh.current_time,
+        expires_at=datetime_from_epoch(refresh["exp"]),
+    )
+    alias = router.db_for_write(OutstandingToken)
+    connection = connections[alias]
+
+    if connection.vendor == "postgresql":
+        # A data-modifying CTE runs even though the INSERT doesn't read it.
+        def prep(model, name, value):
+            return model._meta.get_field(name).get_db_prep_save(value, connection)
+
+        params = [
+            prep(User, "last_login", now),
+            prep(User, "id", user.pk),
+            prep(User, "id", user.pk),
+            outstanding.jti,
+            outstanding.token,
+            prep(OutstandingToken, "created_at", outstanding.created_at),
+            prep(OutstandingToken, "expires_at", outstanding.expires_at),
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(_login_sql(connection), params)
+    else:
+        OutstandingToken.objects.using(alias).bulk_create([outstanding])
+        User.objects.using(alias).filter(pk=user.pk).update(last_login=now)
+    user.last_login = now
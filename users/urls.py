@@ -1,8 +1,10 @@
 from django.urls import path
+from rest_framework_simplejwt.views import TokenRefreshView
 from .views import (
     RegisterView, VerifyOTPView, ResendOTPView,
     LoginView, LogoutView, ChangePasswordView,
-    ForgotPasswordView, ResetPasswordView
+    ForgotPasswordView, ResetPasswordView,
+    ProfileView, ProfileImageView, SessionListView
 )
 
 app_name = "accounts" 
@@ -14,6 +16,8 @@ urlpatterns = [
     path("register/", RegisterView.as_view(), name="register"),
     path("login/", LoginView.as_view(), name="login"),
     path("logout/", LogoutView.as_view(), name="logout"),
+    path("token/refresh/", TokenRefreshView.as_view(), name="token-refresh"),
+    path("sessions/", SessionListView.as_view(), name="sessions"),
 
     # ----------------------------
     # OTP Verification
@@ -27,4 +31,10 @@ urlpatterns = [
     path("change-password/", ChangePasswordView.as_view(), name="change-password"),
     path("forgot-password/", ForgotPasswordView.as_view(), name="forgot-password"),
     path("reset-password/", ResetPasswordView.as_view(), name="reset-password"),
+
+    # ----------------------------
+    # Profile
+    # ----------------------------
+    path("profile/", ProfileView.as_view(), name="profile"),
+    path("profile/image/", ProfileImageView.as_view(), name="profile-image"),
 ]
@@ -0,0 +1,120 @@
+"""
+Password validators for the registration and password-change paths.
+
+Drop-in replacements for Django's validators (same verdicts and messages)
+that are cheaper per call:
+
+- the common-password list is decompressed once per process into a
+  frozenset, preloaded in ``UsersConfig.ready`` so gunicorn workers share
+  the master's copy;
+- attribute similarity uses the character-multiset bound that
+  ``SequenceMatcher.quick_ratio`` computes, without building matchers,
+  and skips parts whose length alone rules out a match;
+- ``validate_password`` runs validators cheapest first and stops at the
+  first failure.
+"""
+import functools
+import gzip
+import re
+from typing import Dict, List
+
+from django.contrib.auth import password_validation
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+
+# Validators without a ``cost`` run last.
+DEFAULT_COST = 100
+
+
+@functools.cache
+def common_passwords(path: str) -> frozenset:
+    """The password list at ``path`` (gzipped or plain), loaded once per process."""
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return frozenset(line.strip() for line in f)
+    except OSError:
+        with open(path) as f:
+            return frozenset(line.strip() for line in f)
+
+
+def _common_chars(password_counts: Dict[str, int], value: str) -> int:
+    """Size of the character-multiset intersection, as ``quick_ratio`` counts it."""
+    common = 0
+    for char in password_counts.keys() & set(value):
+        common += min(password_counts[char], value.count(char))
+    return common
+
+
+# ----------------------------
+# Validators
+# ----------------------------
+class MinimumLengthValidator(password_validation.MinimumLengthValidator):
+    cost = 1
+
+
+class NumericPasswordValidator(password_validation.NumericPasswordValidator):
+    cost = 2
+
+
+class CommonPasswordValidator(password_validation.CommonPasswordValidator):
+    cost = 3
+
+    def __init__(self, password_list_path=password_validation.CommonPasswordValidator.DEFAULT_PASSWORD_LIST_PATH):
+        if password_list_path is password_validation.CommonPasswordValidator.DEFAULT_PASSWORD_LIST_PATH:
+            password_list_path = self.DEFAULT_PASSWORD_LIST_PATH
+        self.passwords = common_passwords(str(password_list_path))
+
+
+class UserAttributeSimilarityValidator(password_validation.UserAttributeSimilarityValidator):
+    cost = 4
+
+    def validate(self, password, user=None):
+        if not user:
+            return
+
+        password = password.lower()
+        password_counts = None
+        for attribute_name in self.user_attributes:
+            value = getattr(user, attribute_name, None)
+            if not value or not isinstance(value, str):
+                continue
+            value_lower = value.lower()
+            for value_part in {*re.split(r"\W+", value_lower), value_lower}:
+                total = len(password) + len(value_part)
+                # quick_ratio is 2 * common chars / total, and at most
+                # min(len) chars can be common.
+                if not value_part or 2 * min(len(password), len(value_part)) < self.max_similarity * total:
+                    continue
+                if password_counts is None:
+                    password_counts = {char: password.count(char) for char in set(password)}
+                if 2 * _common_chars(password_counts, value_part) / total >= self.max_similarity:
+                    try:
+                        verbose_name = str(user._meta.get_field(attribute_name).verbose_name)
+                    except FieldDoesNotExist:
+                        verbose_name = attribute_name
+                    raise ValidationError(
+                        self.get_error_message(),
+                        code="password_too_similar",
+                        params={"verbose_name": verbose_name},
+                    )
+
+
+# ----------------------------
+# Validation
+# ----------------------------
+def ordered_validators() -> List[object]:
+    return sorted(password_validation.get_default_password_validators(), key=lambda v: getattr(v, "cost", DEFAULT_COST))
+
+
+def validate_password(password, user=None):
+    """
+    ``AUTH_PASSWORD_VALIDATORS``, cheapest first. Unlike Django's
+    ``validate_password`` it stops at the first failing validator, so a
+    short password never reaches the similarity check.
+    """
+    for validator in ordered_validators():
+        validator.validate(password, user)
+
+
+def preload() -> None:
+    """Instantiate the configured validators, loading the common-password list."""
+    password_validation.get_default_password_validators()
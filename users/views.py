@@ -1,16 +1,21 @@
 from rest_framework.views import APIView
 from rest_framework import generics, status
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework_simplejwt.views import TokenObtainPairView
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 import logging
 
 from core.utils import api_response
+from . import session_registry
 from .throttles import OTPThrottle, LoginThrottle, GeneralThrottle
 from .serializers import (
     RegisterSerializer, VerifyOTPSerializer, ResendOTPSerializer,
     ChangePasswordSerializer, MyTokenObtainPairSerializer,
-    ForgotPasswordOTPSerializer, ResetPasswordOTPSerializer
+    ForgotPasswordOTPSerializer, ResetPasswordOTPSerializer,
+    UserProfileSerializer, ProfileImageSerializer
 )
 
 logger = logging.getLogger(__name__)
@@ -100,7 +105,11 @@ class LogoutView(APIView):
             )
         try:
             token = RefreshToken(refresh_token)
+            if str(token.get(api_settings.USER_ID_CLAIM)) != str(request.user.pk):
+                raise TokenError("Token does not belong to this user")
             token.blacklist()
+            # Only a session whose token is now blacklisted is forgotten.
+            session_registry.revoke(request.user.pk, token.get("sid"))
             logger.info(f"User {request.user.email} logged out successfully")
             return api_response(message="Logged out successfully", status_code=status.HTTP_205_RESET_CONTENT)
         except Exception as e:
@@ -163,3 +172,58 @@ class ResetPasswordView(APIView):
         user = serializer.save()
         logger.info(f"User {user.email} reset password successfully")
         return api_response(message="Password reset successfully")
+
+
+# ----------------------------
+# Profile
+# ----------------------------
+class ProfileView(generics.RetrieveAPIView):
+    serializer_class = UserProfileSerializer
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [GeneralThrottle]
+
+    def get_object(self):
+        return self.request.user
+
+    def retrieve(self, request, *args, **kwargs):
+        serializer = self.get_serializer(self.get_object())
+        return api_response(message="Profile fetched successfully", data=serializer.data)
+
+
+# ----------------------------
+# Sessions
+# ----------------------------
+class SessionListView(APIView):
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [GeneralThrottle]
+
+    def get(self, request, *args, **kwargs):
+        current = request.auth.get("sid") if request.auth is not None else None
+        sessions = session_registry.list_sessions(request.user.pk)
+        for session in sessions:
+            session["current"] = session["sid"] == current
+        return api_response(message="Sessions fetched successfully", data=sessions)
+
+
+# ----------------------------
+# Profile Image Upload
+# ----------------------------
+class ProfileImageView(generics.UpdateAPIView):
+    serializer_class = ProfileImageSerializer
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [GeneralThrottle]
+    parser_classes = [MultiPartParser, FormParser]
+    http_method_names = ["put", "options"]
+
+    def get_object(self):
+        return self.request.user
+
+    def update(self, request, *args, **kwargs):
+        serializer = self.get_serializer(self.get_object(), data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user = serializer.save()
+        logger.info(f"User {user.email} uploaded a profile image")
+        return api_response(
+            message="Profile image uploaded. Thumbnails are being generated",
+            status_code=status.HTTP_202_ACCEPTED
+        )